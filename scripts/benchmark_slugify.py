@@ -0,0 +1,54 @@
+"""
+Micro-benchmark of the cached slugify against python-slugify.
+
+Run with `python scripts/benchmark_slugify.py` with spotdl installed.
+"""
+
+import timeit
+
+from slugify import slugify as python_slugify
+
+from spotdl.utils.normalize import clear_cache, slugify
+
+# Typical strings of a search, every song is matched against ~20 results
+# and the song name, album and artists are slugified for every result
+STRINGS = [
+    "Ropes",
+    "Salem Ilese",
+    "Mashup of Ropes and PS5 - Official Video",
+    "Beyoncé",
+    "Halo (Live at Wembley) [Remastered 2021]",
+    "the-beatles",
+    "love-me-do",
+    "Love Me Do - Mono / Remastered",
+    "TOMORROW X TOGETHER",
+    "Tomorrow x Together, Seori",
+] * 20
+
+NUMBER = 200
+
+
+def main():
+    """
+    Print the time of slugifying all strings with and without the cache.
+    """
+
+    baseline = timeit.timeit(
+        lambda: [python_slugify(text) for text in STRINGS], number=NUMBER
+    )
+
+    clear_cache()
+    cached = timeit.timeit(lambda: [slugify(text) for text in STRINGS], number=NUMBER)
+
+    clear_cache()
+    cold = timeit.timeit(lambda: [slugify(text) for text in STRINGS], number=1)
+
+    calls = len(STRINGS) * NUMBER
+    print(f"python-slugify: {baseline / calls * 1e6:.2f} us per call")
+    print(f"cached slugify: {cached / calls * 1e6:.2f} us per call")
+    print(f"first run:      {cold / len(STRINGS) * 1e6:.2f} us per call")
+    print(f"speedup:        {baseline / cached:.1f}x")
+
+
+if __name__ == "__main__":
+    main()
@@ -44,6 +44,9 @@ def __init__(
         ffmpeg_args: Optional[str] = None,
         output_format: str = "mp3",
         threads: int = 4,
+        search_threads: Optional[int] = None,
+        download_threads: Optional[int] = None,
+        transcode_workers: Optional[int] = None,
         output: str = ".",
         save_file: Optional[str] = None,
         overwrite: str = "skip",
@@ -56,6 +59,10 @@ def __init__(
         restrict: bool = False,
         print_errors: bool = False,
         sponsor_block: bool = False,
+        cover_size: Optional[int] = None,
+        no_search_cache: bool = False,
+        purge_search_cache: bool = False,
+        journal: Optional[str] = None,
     ):
         """
         Initialize the Spotdl class
@@ -75,6 +82,9 @@ def __init__(
         - ffmpeg_args: The ffmpeg arguments to use.
         - output_format: The output format to use.
         - threads: The number of threads to use.
+        - search_threads: The number of threads to use for metadata and searching.
+        - download_threads: The number of threads to use for fetching and tagging.
+        - transcode_workers: The number of ffmpeg processes to run at the same time.
         - output: The output directory to use.
         - save_file: The save file to use when saving/loading song metadata.
         - overwrite: The overwrite mode to use (force/skip).
@@ -87,6 +97,10 @@ def __init__(
         - restrict: Whether to restrict the filename to ASCII characters.
         - print_errors: Whether to print errors on exit.
         - sponsor_block: Whether to remove sponsor segments using sponsor block postprocessor.
+        - cover_size: The maximum size of the embedded covers in pixels.
+        - no_search_cache: If true, cached search and lyrics results won't be used.
+        - purge_search_cache: If true, cached search and lyrics results will be removed.
+        - journal: Path of the journal to resume interrupted downloads from.
 
         ### Notes
         - `search-query` uses the same format as `output`.
@@ -118,6 +132,9 @@ def __init__(
             ffmpeg_args=ffmpeg_args,
             output_format=output_format,
             threads=threads,
+            search_threads=search_threads,
+            download_threads=download_threads,
+            transcode_workers=transcode_workers,
             output=output,
             save_file=save_file,
             overwrite=overwrite,
@@ -129,6 +146,10 @@ def __init__(
             restrict=restrict,
             print_errors=print_errors,
             sponsor_block=sponsor_block,
+            cover_size=cover_size,
+            no_search_cache=no_search_cache,
+            purge_search_cache=purge_search_cache,
+            journal=journal,
         )
 
     def search(self, query: List[str]) -> List[Song]:
@@ -145,7 +166,7 @@ def search(self, query: List[str]) -> List[Song]:
         - query can be a list of song titles, urls, uris
         """
 
-        return parse_query(query, self.downloader.threads)
+        return parse_query(query, self.downloader.search_threads)
 
     def get_download_urls(self, songs: List[Song]) -> List[Optional[str]]:
         """
@@ -163,7 +184,7 @@ def get_download_urls(self, songs: List[Song]) -> List[Optional[str]]:
 
         urls: List[Optional[str]] = []
         with concurrent.futures.ThreadPoolExecutor(
-            max_workers=self.downloader.threads
+            max_workers=self.downloader.search_threads
         ) as executor:
             future_to_song = {
                 executor.submit(self.downloader.search, song): song for song in songs
@@ -2,14 +2,16 @@
 Download module for the console.
 """
 
+import itertools
 import traceback
-import json
 
-from typing import List, Optional
+from typing import Iterable, List, Optional
 from pathlib import Path
 
 from spotdl.download.downloader import Downloader
+from spotdl.types.song import Song
 from spotdl.utils.m3u import create_m3u_file
+from spotdl.utils.savefile import is_save_file, load_songs, save_songs
 from spotdl.utils.search import get_simple_songs
 
 
@@ -30,8 +32,14 @@ def download(
     """
 
     try:
-        # Parse the query
-        songs = get_simple_songs(query)
+        # Parse the query, save files are read while the songs are downloaded
+        songs: Iterable[Song]
+        if all(is_save_file(request) for request in query):
+            songs = itertools.chain.from_iterable(
+                load_songs(request) for request in query
+            )
+        else:
+            songs = get_simple_songs(query)
 
         results = downloader.download_multiple_songs(songs)
 
@@ -41,10 +49,9 @@ def download(
                 m3u_file, song_list, downloader.output, downloader.output_format, False
             )
 
-        if save_path:
-            # Save the songs to a file
-            with open(save_path, "w", encoding="utf-8") as save_file:
-                json.dump(songs, save_file, indent=4, ensure_ascii=False)
+        # The downloader writes its own save file while downloading
+        if save_path and not downloader.save_file:
+            save_songs(save_path, (song for song, _ in results))
 
     except Exception as exception:
         downloader.progress_handler.debug(traceback.format_exc())
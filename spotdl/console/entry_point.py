@@ -18,6 +18,7 @@
 from spotdl.utils.ffmpeg import FFmpegError, download_ffmpeg, is_ffmpeg_installed
 from spotdl.utils.config import get_config_file
 from spotdl.utils.github import check_for_updates
+from spotdl.utils.savefile import is_save_file
 from spotdl.utils.arguments import parse_arguments
 from spotdl.utils.spotify import SpotifyClient, SpotifyError
 from spotdl.download.downloader import DownloaderError
@@ -141,10 +142,12 @@ def entry_point():
         return None
 
     # Check if save file is present and if it's valid
-    if isinstance(settings["save_file"], str) and not settings["save_file"].endswith(
-        ".spotdl"
+    if isinstance(settings["save_file"], str) and not is_save_file(
+        settings["save_file"]
     ):
-        raise DownloaderError("Save file has to end with .spotdl")
+        raise DownloaderError(
+            "Save file has to end with .spotdl, .spotdl.gz or .spotdl.zst"
+        )
 
     if arguments.query and "saved" in arguments.query and not settings["user_auth"]:
         raise SpotifyError("You must be logged in to use the saved query.")
@@ -160,6 +163,9 @@ def entry_point():
         output_format=settings["format"],
         save_file=settings["save_file"],
         threads=settings["threads"],
+        search_threads=settings["search_threads"],
+        download_threads=settings["download_threads"],
+        transcode_workers=settings["transcode_workers"],
         output=settings["output"],
         overwrite=settings["overwrite"],
         search_query=settings["search_query"],
@@ -169,9 +175,14 @@ def entry_point():
         restrict=settings["restrict"],
         print_errors=settings["print_errors"],
         sponsor_block=settings["sponsor_block"],
+        cover_size=settings["cover_size"],
+        no_search_cache=settings["no_search_cache"],
+        purge_search_cache=settings["purge_search_cache"],
+        journal=settings["journal"],
     )
 
     def graceful_exit(_signal, _frame):
+        downloader.close()
         downloader.progress_handler.close()
         sys.exit(0)
 
@@ -187,6 +198,7 @@ def graceful_exit(_signal, _frame):
         m3u_file=settings["m3u"],
     )
 
+    downloader.close()
     downloader.progress_handler.close()
 
     return None
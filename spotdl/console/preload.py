@@ -2,7 +2,6 @@
 Preload module for the console.
 """
 
-import json
 import concurrent.futures
 from pathlib import Path
 
@@ -11,6 +10,7 @@
 from spotdl.download.downloader import Downloader
 from spotdl.utils.search import parse_query
 from spotdl.utils.m3u import create_m3u_file
+from spotdl.utils.savefile import SaveFileWriter
 
 
 def preload(
@@ -33,11 +33,12 @@ def preload(
     """
 
     # Parse the query
-    songs = parse_query(query, downloader.threads)
+    songs = parse_query(query, downloader.search_threads)
 
-    save_data = []
-    with concurrent.futures.ThreadPoolExecutor(
-        max_workers=downloader.threads
+    # Songs are saved as soon as their url is found
+    save_file = SaveFileWriter(save_path)
+    with save_file, concurrent.futures.ThreadPoolExecutor(
+        max_workers=downloader.search_threads
     ) as executor:
         future_to_song = {
             executor.submit(downloader.search, song): song for song in songs
@@ -55,21 +56,18 @@ def preload(
                 downloader.progress_handler.log(
                     f"Found url for {song.display_name}: {data}"
                 )
-                save_data.append({**song.json, "download_url": data})
+                save_file.write({**song.json, "download_url": data})
             except Exception as exc:
                 downloader.progress_handler.error(
                     f"{song} generated an exception: {exc}"
                 )
 
-    # Save the songs to a file
-    with open(save_path, "w", encoding="utf-8") as save_file:
-        json.dump(save_data, save_file, indent=4, ensure_ascii=False)
-
     if m3u_file:
         create_m3u_file(
             m3u_file, songs, downloader.output, downloader.output_format, False
         )
 
     downloader.progress_handler.log(
-        f"Saved {len(save_data)} song{'s' if len(save_data) > 1 else ''} to {save_path}"
+        f"Saved {save_file.count} song{'s' if save_file.count > 1 else ''} "
+        f"to {save_path}"
     )
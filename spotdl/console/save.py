@@ -2,14 +2,13 @@
 Save module for the console.
 """
 
-import json
-
 from typing import List, Optional
 from pathlib import Path
 
 from spotdl.download.downloader import Downloader
 from spotdl.utils.search import parse_query
 from spotdl.utils.m3u import create_m3u_file
+from spotdl.utils.savefile import save_songs
 
 
 def save(
@@ -32,14 +31,10 @@ def save(
     """
 
     # Parse the query
-    songs = parse_query(query, downloader.threads)
-
-    # Convert the songs to JSON
-    save_data = [song.json for song in songs]
+    songs = parse_query(query, downloader.search_threads)
 
     # Save the songs to a file
-    with open(save_path, "w", encoding="utf-8") as save_file:
-        json.dump(save_data, save_file, indent=4, ensure_ascii=False)
+    count = save_songs(save_path, songs)
 
     # Create an m3u file if requested
     if m3u_file:
@@ -48,5 +43,5 @@ def save(
         )
 
     downloader.progress_handler.log(
-        f"Saved {len(save_data)} song{'s' if len(save_data) > 1 else ''} to {save_path}"
+        f"Saved {count} song{'s' if count > 1 else ''} to {save_path}"
     )
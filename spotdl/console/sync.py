@@ -2,15 +2,22 @@
 Sync module for the console.
 """
 
-import glob
+import os
 import traceback
 
 from pathlib import Path
-from typing import List, Optional
+from typing import Dict, List, Optional, Set
 
 from spotdl.download.downloader import Downloader
+from spotdl.types.playlist import Playlist
+from spotdl.types.song import Song
 from spotdl.utils.search import parse_query
-from spotdl.utils.formatter import create_file_name
+from spotdl.utils.library import (
+    LibraryIndex,
+    PlaylistState,
+    get_tag_hash,
+    is_file_changed,
+)
 from spotdl.utils.m3u import create_m3u_file
 
 
@@ -28,48 +35,107 @@ def sync(
     - downloader: Already initialized downloader instance.
     - save_path: Path to save the songs to.
     - m3u_file: Path to the file to save the metadata to.
+
+    ### Notes
+    - The songs are compared with the library index of the output directory,
+        files are looked up in the directory listings and only the files
+        of indexed songs are stat'ed, to find the ones changed outside of spotdl.
+    - A song that can't be updated is reported and skipped,
+        the sync continues with the other songs.
     """
 
-    # Parse the query
-    songs_list = parse_query(query, downloader.threads)
+    library = downloader.open_library()
+
+    # Parse the query, unchanged playlists are loaded from the library index
+    songs_list = parse_sync_query(query, library, downloader.search_threads)
 
     if m3u_file:
         create_m3u_file(
             m3u_file, songs_list, downloader.output, downloader.output_format, False
         )
 
-    # Get all files that are in the output directory
-    parent_dir = Path(downloader.output).parent
-    old_files = [
-        Path(file) for file in glob.glob(f"{parent_dir}/*.{downloader.output_format}")
-    ]
+    entries = library.get_entries()
+
+    # List every directory only once instead of checking every file
+    listings: Dict[Path, Set[str]] = {}
+
+    def list_directory(directory: Path) -> Set[str]:
+        if directory not in listings:
+            try:
+                listings[directory] = set(os.listdir(directory))
+            except OSError:
+                listings[directory] = set()
+
+        return listings[directory]
+
+    def file_exists(path: Path) -> bool:
+        return path.name in list_directory(path.parent)
 
     # Get all output file names
-    new_files = [
-        create_file_name(song, downloader.output, downloader.output_format)
-        for song in songs_list
-    ]
+    new_files = {
+        song.song_id: downloader.create_output_file(song) for song in songs_list
+    }
+
+    # Get all files that are no longer in the query,
+    # the songs in the index and the other files in the output directory
+    old_files = {
+        entry.path
+        for song_id, entry in entries.items()
+        if new_files.get(song_id) != entry.path
+    }
+
+    parent_dir = Path(downloader.output).parent
+    old_files.update(
+        parent_dir / file_name
+        for file_name in list_directory(parent_dir)
+        if file_name.endswith(f".{downloader.output_format}")
+    )
 
-    # Get all files that are no longer in the query
-    to_delete = set(old_files) - set(new_files)
+    to_delete = old_files - set(new_files.values())
 
     # Delete all files that are no longer in the query
     for file in to_delete:
-        file.unlink()
+        if file_exists(file):
+            file.unlink()
+
+    library.remove(song_id for song_id in entries if song_id not in new_files)
 
     # Download the rest of the songs
     try:
         to_download = []
         for song in songs_list:
-            song_path = create_file_name(
-                song, downloader.output, downloader.output_format
-            )
-            if Path(song_path).exists():
-                if downloader.overwrite == "force":
-                    downloader.progress_handler.log(f"Overwriting {song.display_name}")
-                    to_download.append(song)
-            else:
+            song_path = new_files[song.song_id]
+            entry = entries.get(song.song_id)
+
+            if not file_exists(song_path):
+                to_download.append(song)
+                continue
+
+            if downloader.overwrite == "force":
+                downloader.progress_handler.log(f"Overwriting {song.display_name}")
                 to_download.append(song)
+                continue
+
+            try:
+                if entry is None or entry.path != song_path:
+                    # The song was downloaded before it was recorded in the index
+                    library.add(song, song_path, downloader.output_format)
+                elif entry.tag_hash != get_tag_hash(song):
+                    downloader.progress_handler.log(
+                        f"Updating metadata of {song.display_name}"
+                    )
+                    downloader.update_metadata(song, song_path)
+                elif is_file_changed(entry):
+                    # The file was modified outside of spotdl, restore its tags
+                    downloader.progress_handler.log(
+                        f"Restoring metadata of {song.display_name}"
+                    )
+                    downloader.update_metadata(song, song_path)
+            except Exception as exception:
+                downloader.progress_handler.debug(traceback.format_exc())
+                downloader.progress_handler.error(
+                    f"Failed to update {song.display_name}: {exception}"
+                )
 
         if len(to_download) == 0:
             downloader.progress_handler.log("Nothing to do...")
@@ -79,3 +145,66 @@ def sync(
     except Exception as exception:
         downloader.progress_handler.debug(traceback.format_exc())
         downloader.progress_handler.error(str(exception))
+
+
+def parse_sync_query(
+    query: List[str], library: LibraryIndex, threads: int = 1
+) -> List[Song]:
+    """
+    Parse the query, fetching only the playlists that changed since the last sync.
+
+    ### Arguments
+    - query: list of strings to search for.
+    - library: The library index with the state of the synced playlists.
+    - threads: Number of threads to use.
+
+    ### Returns
+    - List of song objects.
+
+    ### Notes
+    - Playlists are compared by their snapshot id, an unchanged playlist costs
+        a single request. Only the added tracks of a changed playlist are resolved,
+        the other songs are reused from the last sync.
+    - The rest of the query is passed to `parse_query`.
+    """
+
+    songs: List[Song] = []
+    other_requests: List[str] = []
+    for request in query:
+        if "open.spotify.com" not in request or "playlist" not in request:
+            other_requests.append(request)
+            continue
+
+        url = request.split("?")[0]
+        snapshot_id = Playlist.get_snapshot_id(url)
+        state = library.get_playlist(url)
+
+        if state is not None and state.snapshot_id == snapshot_id:
+            songs.extend(state.songs)
+            continue
+
+        raw_tracks = Playlist.get_tracks(url)
+        known_songs: Dict[str, Song] = (
+            {song.song_id: song for song in state.songs} if state else {}
+        )
+
+        # Resolve only the tracks that were added since the last sync
+        new_songs = Song.list_from_tracks(
+            [track for track in raw_tracks if track["id"] not in known_songs],
+            threads,
+        )
+
+        known_songs.update((song.song_id, song) for song in new_songs)
+        playlist_songs = [
+            known_songs[track["id"]]
+            for track in raw_tracks
+            if track["id"] in known_songs
+        ]
+
+        library.set_playlist(PlaylistState(url, snapshot_id, playlist_songs))
+        songs.extend(playlist_songs)
+
+    if other_requests:
+        songs.extend(parse_query(other_requests, threads))
+
+    return songs
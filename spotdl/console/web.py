@@ -28,6 +28,7 @@
 from spotdl.utils.search import parse_query
 from spotdl.utils.search import get_search_results
 from spotdl.utils.config import get_spotdl_path
+from spotdl.utils.ratelimit import get_rate_limiter
 
 ALLOWED_ORIGINS = [
     "http://localhost:8800",
@@ -100,6 +101,9 @@ class SettingsModel(BaseModel):
     client_secret: Optional[str]
     user_auth: Optional[bool]
     threads: Optional[int]
+    search_threads: Optional[int]
+    download_threads: Optional[int]
+    transcode_workers: Optional[int]
 
 
 app = App()
@@ -182,8 +186,24 @@ def update(self, progress_handler_instance: SongTracker, message: str):
         - progress_handler_instance: The ProgressHandler instance.
         - message: The message to send.
         """
+        song = progress_handler_instance.song
+        song_data = song.json
+
+        # `Song.json` references the song list by url,
+        # the web API keeps sending the song list itself
+        if song.song_list is not None:
+            song_data = {
+                **song_data,
+                "song_list": {
+                    "name": song.song_list.name,
+                    "url": song.song_list.url,
+                    "urls": song.song_list.urls,
+                    "songs": [list_song.json for list_song in song.song_list.songs],
+                },
+            }
+
         update_message = {
-            "song": progress_handler_instance.song.json,
+            "song": song_data,
             "progress": progress_handler_instance.progress,
             "message": message,
         }
@@ -444,6 +464,18 @@ def download_multiple_objects(
     )
 
 
+@app.server.get("/api/rates")
+def get_rates() -> Dict[str, float]:
+    """
+    Return the current request rates.
+
+    ### Returns
+    - returns the requests per second of every host and audio provider.
+    """
+
+    return get_rate_limiter().rates()
+
+
 @app.server.get("/api/settings")
 def get_settings() -> SettingsModel:
     """
@@ -478,7 +510,8 @@ def change_settings(settings: SettingsModel) -> bool:
 
     logging.debug("Applying settings: %s", {settings_cpy})
 
-    # Re-initialize downloader
+    # Re-initialize downloader, stopping the threads of the old one
+    app.downloader.close()
     app.downloader = Downloader(
         audio_providers=settings_cpy["audio_providers"],
         lyrics_providers=settings_cpy["lyrics_providers"],
@@ -488,6 +521,9 @@ def change_settings(settings: SettingsModel) -> bool:
         output_format=settings_cpy["format"],
         save_file=settings_cpy["save_file"],
         threads=settings_cpy["threads"],
+        search_threads=settings_cpy.get("search_threads"),
+        download_threads=settings_cpy.get("download_threads"),
+        transcode_workers=settings_cpy.get("transcode_workers"),
         output=settings_cpy["output"],
         overwrite=settings_cpy["overwrite"],
         log_level="CRITICAL",
@@ -557,6 +593,9 @@ def web(settings: Dict[str, Any]):
         output_format=settings["format"],
         save_file=settings["save_file"],
         threads=settings["threads"],
+        search_threads=settings.get("search_threads"),
+        download_threads=settings.get("download_threads"),
+        transcode_workers=settings.get("transcode_workers"),
         output=settings["output"],
         overwrite=settings["overwrite"],
         log_level=settings["log_level"],
@@ -572,4 +611,5 @@ def web(settings: Dict[str, Any]):
 
     loop.run_until_complete(server.serve())
 
+    app.downloader.close()
     app.downloader.progress_handler.close()
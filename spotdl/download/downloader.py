@@ -2,30 +2,62 @@
 Downloader module, this is where all the downloading pre/post processing happens etc.
 """
 
-import json
+import os
 import datetime
 import asyncio
 import shutil
 import sys
 import concurrent.futures
+import threading
 import traceback
 
+from dataclasses import dataclass, fields
 from pathlib import Path
-from typing import Dict, List, Optional, Tuple, Type
+from typing import Any, Dict, Iterable, List, Optional, Sized, Tuple, Type
 
 from yt_dlp.postprocessor.sponsorblock import SponsorBlockPP
 from yt_dlp.postprocessor.modify_chapters import ModifyChaptersPP
 
 from spotdl.types import Song
-from spotdl.utils.ffmpeg import FFmpegError, convert_sync, get_ffmpeg_path
+from spotdl.utils.ffmpeg import (
+    FFmpegError,
+    TranscodePool,
+    choose_conversion,
+    get_ffmpeg_path,
+    get_stream_info,
+    probe_file,
+)
 from spotdl.utils.metadata import embed_metadata, MetadataError
 from spotdl.utils.formatter import create_file_name, restrict_filename
 from spotdl.providers.audio.base import AudioProvider
 from spotdl.providers.lyrics import Genius, MusixMatch, AzLyrics
 from spotdl.providers.lyrics.base import LyricsProvider
 from spotdl.providers.audio import YouTube, YouTubeMusic, SoundCloud
-from spotdl.download.progress_handler import NAME_TO_LEVEL, ProgressHandler
-from spotdl.utils.config import get_errors_path
+from spotdl.download.journal import (
+    STAGE_MATCHED,
+    STAGE_RESOLVED,
+    STAGE_TAGGED,
+    STAGE_TRANSCODED,
+    DownloadJournal,
+    JournalEntry,
+)
+from spotdl.download.pipeline import Pipeline, Stage
+from spotdl.download.progress_handler import (
+    NAME_TO_LEVEL,
+    ProgressHandler,
+    SongTracker,
+)
+from spotdl.utils.cache import PersistentCache
+from spotdl.utils.config import (
+    get_covers_path,
+    get_errors_path,
+    get_lyrics_cache_path,
+    get_search_cache_path,
+)
+from spotdl.utils.covers import CoverCache
+from spotdl.utils.library import LibraryIndex, get_library_path
+from spotdl.utils.ratelimit import get_rate_limiter, get_status_code
+from spotdl.utils.savefile import SaveFileWriter
 
 
 AUDIO_PROVIDERS: Dict[str, Type[AudioProvider]] = {
@@ -51,6 +83,14 @@
     "music_offtopic": "Non-Music Section",
 }
 
+# Matches are kept for a month, songs that weren't found are searched again sooner
+SEARCH_CACHE_TTL = 30 * 24 * 60 * 60
+SEARCH_CACHE_NEGATIVE_TTL = 24 * 60 * 60
+
+# Lyrics rarely change, but providers add missing lyrics over time
+LYRICS_CACHE_TTL = 90 * 24 * 60 * 60
+LYRICS_CACHE_NEGATIVE_TTL = 7 * 24 * 60 * 60
+
 
 class DownloaderError(Exception):
     """
@@ -58,6 +98,25 @@ class DownloaderError(Exception):
     """
 
 
+@dataclass
+class DownloadJob:
+    """
+    State of a single song while it moves through the download pipeline.
+    """
+
+    song: Song
+    output_file: Optional[Path] = None
+    tracker: Optional[SongTracker] = None
+    url: Optional[str] = None
+    audio_provider: Optional[AudioProvider] = None
+    download_info: Optional[Dict[str, Any]] = None
+    conversion: Optional[str] = None
+    lyrics: Optional["concurrent.futures.Future[str]"] = None
+    part_file: Optional[Path] = None
+    resumed: Optional[JournalEntry] = None
+    path: Optional[Path] = None
+
+
 class Downloader:
     """
     Downloader class, this is where all the downloading pre/post processing happens etc.
@@ -73,6 +132,9 @@ def __init__(
         ffmpeg_args: Optional[str] = None,
         output_format: str = "mp3",
         threads: int = 4,
+        search_threads: Optional[int] = None,
+        download_threads: Optional[int] = None,
+        transcode_workers: Optional[int] = None,
         output: str = ".",
         save_file: Optional[str] = None,
         overwrite: str = "skip",
@@ -85,6 +147,10 @@ def __init__(
         restrict: bool = False,
         print_errors: bool = False,
         sponsor_block: bool = False,
+        cover_size: Optional[int] = None,
+        no_search_cache: bool = False,
+        purge_search_cache: bool = False,
+        journal: Optional[str] = None,
     ):
         """
         Initialize the Downloader class.
@@ -98,6 +164,12 @@ def __init__(
         - ffmpeg_args: The ffmpeg arguments to use.
         - output_format: The output format to use.
         - threads: The number of threads to use.
+        - search_threads: The number of threads to use for resolving metadata
+            and searching, defaults to `threads`.
+        - download_threads: The number of threads to use for fetching streams
+            and tagging, defaults to `threads`.
+        - transcode_workers: The number of ffmpeg processes to run at the same time,
+            defaults to the number of CPU cores.
         - output: The output directory to use.
         - save_file: The save file to use when saving/loading song metadata.
         - overwrite: The overwrite mode to use (force/skip).
@@ -110,6 +182,11 @@ def __init__(
         - restrict: Whether to restrict the filename to ASCII characters.
         - print_errors: Whether to print errors on exit.
         - sponsor_block: Whether to remove sponsor segments using sponsor block postprocessor.
+        - cover_size: The maximum size of the embedded covers in pixels.
+        - no_search_cache: Whether to skip the cached search and lyrics results.
+        - purge_search_cache: Whether to remove all cached search and lyrics results.
+        - journal: Path of the journal that records the progress of every song,
+            an interrupted download resumes from it.
 
         ### Notes
         - `search-query` uses the same format as `output`.
@@ -157,14 +234,6 @@ def __init__(
         else:
             self.loop = loop
 
-        # semaphore is required to limit concurrent asyncio executions
-        self.semaphore = asyncio.Semaphore(threads)
-
-        # thread pool executor is used to run blocking (CPU-bound) code from a thread
-        self.thread_executor = concurrent.futures.ThreadPoolExecutor(
-            max_workers=threads
-        )
-
         # If ffmpeg is the default value and it's not installed
         # try to use the spotdl's ffmpeg
         if ffmpeg == "ffmpeg" and shutil.which("ffmpeg") is None:
@@ -178,6 +247,9 @@ def __init__(
         self.output_format = output_format
         self.save_file = save_file
         self.threads = threads
+        self.search_threads = search_threads or threads
+        self.download_threads = download_threads or threads
+        self.transcode_workers = transcode_workers or os.cpu_count() or 1
         self.cookie_file = cookie_file
         self.overwrite = overwrite
         self.search_query = search_query
@@ -189,8 +261,47 @@ def __init__(
         self.print_errors = print_errors
         self.errors: List[str] = []
         self.sponsor_block = sponsor_block
+
+        # Downloaded songs are recorded in the library index once it's opened
+        self.library: Optional[LibraryIndex] = None
+
+        # Stages completed by every song, so an interrupted download can be resumed
+        self.journal = DownloadJournal(Path(journal)) if journal else None
+
+        # Songs are written to the save file as soon as they are finished
+        self.save_writer: Optional[SaveFileWriter] = None
         self.progress_handler = ProgressHandler(NAME_TO_LEVEL[log_level], simple_tui)
 
+        # Covers are shared by all songs of an album, download them only once
+        self.cover_cache = CoverCache(get_covers_path(), max_size=cover_size)
+
+        # Shared by all workers, HTTP requests are limited per host
+        # and searches of the audio providers per provider
+        self.rate_limiter = get_rate_limiter()
+
+        self.search_cache: Optional[PersistentCache] = None
+        self.lyrics_cache: Optional[PersistentCache] = None
+        if purge_search_cache or not no_search_cache:
+            self.search_cache = PersistentCache(
+                get_search_cache_path(), "search", SEARCH_CACHE_TTL
+            )
+
+            # Lyrics are plain text, so they compress very well
+            self.lyrics_cache = PersistentCache(
+                get_lyrics_cache_path(), "lyrics", LYRICS_CACHE_TTL, compress=True
+            )
+
+            if purge_search_cache:
+                self.search_cache.clear()
+                self.lyrics_cache.clear()
+                self.progress_handler.debug("Search and lyrics caches purged")
+
+            if no_search_cache:
+                self.search_cache.close()
+                self.lyrics_cache.close()
+                self.search_cache = None
+                self.lyrics_cache = None
+
         self.audio_providers: List[AudioProvider] = []
         for audio_provider_class in audio_providers_classes:
             self.audio_providers.append(
@@ -206,8 +317,71 @@ def __init__(
         for lyrics_provider_class in lyrics_providers_classes:
             self.lyrics_providers.append(lyrics_provider_class())
 
+        # Lyrics providers are queried at the same time, but only as many queries
+        # as songs are downloaded run at once, so the providers aren't flooded.
+        # Queued queries are cancelled when a provider with higher priority
+        # found the lyrics
+        self.lyrics_executor = concurrent.futures.ThreadPoolExecutor(
+            max_workers=self.download_threads
+        )
+
+        # Every stage gets its own workers, so that e.g. spotify requests
+        # for the next songs are made while the previous ones are converted.
+        # Searching is throttled separately because of rate limits
+        # and transcoding is CPU-bound, so it scales with the number of cores
+        self.stages = [
+            Stage("resolve", self.resolve_metadata, self.search_threads),
+            Stage("search", self.find_download_url, self.search_threads),
+            Stage("fetch", self.fetch_stream, self.download_threads),
+            Stage("probe", self.probe, self.download_threads),
+            Stage("transcode", self.transcode, self.transcode_workers),
+            Stage("tag", self.tag, self.download_threads),
+            Stage("finalize", self.finalize, 1),
+        ]
+
+        # thread pool executor is used to run blocking code of the stages from a thread,
+        # it needs a thread for every worker so the stages don't wait for each other
+        self.thread_executor = concurrent.futures.ThreadPoolExecutor(
+            max_workers=sum(stage.workers for stage in self.stages)
+        )
+
+        # ffmpeg processes are limited by the pool, also for songs
+        # downloaded outside of the pipeline (e.g. `search_and_download`)
+        self.transcode_pool = TranscodePool(self.transcode_workers)
+
+        self.pipeline = Pipeline(
+            self.stages,
+            self.loop,
+            self.thread_executor,
+            self.handle_error,
+            self.save_result,
+        )
+
         self.progress_handler.debug("Downloader initialized")
 
+    def close(self) -> None:
+        """
+        Stop the worker threads of the downloader and close its caches.
+
+        ### Notes
+        - The downloader can't be used after it was closed.
+        """
+
+        self.thread_executor.shutdown(wait=False)
+        self.lyrics_executor.shutdown(wait=False)
+        self.transcode_pool.close()
+
+        if self.journal is not None:
+            self.journal.flush()
+
+        if self.search_cache is not None:
+            self.search_cache.close()
+
+        if self.lyrics_cache is not None:
+            self.lyrics_cache.close()
+
+        self.progress_handler.debug("Downloader closed")
+
     def download_song(self, song: Song) -> Tuple[Song, Optional[Path]]:
         """
         Download a single song.
@@ -226,7 +400,7 @@ def download_song(self, song: Song) -> Tuple[Song, Optional[Path]]:
         return results[0]
 
     def download_multiple_songs(
-        self, songs: List[Song]
+        self, songs: Iterable[Song]
     ) -> List[Tuple[Song, Optional[Path]]]:
         """
         Download multiple songs to the temp directory.
@@ -236,28 +410,68 @@ def download_multiple_songs(
 
         ### Returns
         - list of tuples with the song and the path to the downloaded file if successful.
+
+        ### Notes
+        - Songs are streamed through the download pipeline, the first song
+            is downloaded while the metadata of the next ones is still being resolved.
+        - If `songs` is not a list, it's consumed lazily and the song count
+            is updated as the songs are read.
+        - Songs are appended to the save file in the order they are finished.
         """
 
-        self.progress_handler.set_song_count(len(songs))
+        if isinstance(songs, Sized):
+            self.progress_handler.set_song_count(len(songs))
+        else:
+            songs = self._count_songs(songs)
+
+        if self.save_file:
+            self.save_writer = SaveFileWriter(self.save_file)
+
+        try:
+            jobs = self.pipeline.run(DownloadJob(song) for song in songs)
+        except BaseException:
+            if self.save_writer is not None:
+                self.save_writer.abort()
+                self.save_writer = None
+
+            raise
+
+        results = [(job.song, job.path) for job in jobs]
 
-        tasks = [self.pool_download(song) for song in songs]
+        if self.save_writer is not None:
+            self.save_writer.close()
+            self.save_writer = None
 
-        # call all task asynchronously, and wait until all are finished
-        results = list(self.loop.run_until_complete(asyncio.gather(*tasks)))
+        if self.journal is not None:
+            self.journal.close()
+
+        for key, rate in self.rate_limiter.rates().items():
+            self.progress_handler.debug(f"Request rate of {key}: {rate:.1f}/s")
 
         if self.print_errors:
             for error in self.errors:
                 self.progress_handler.error(error)
 
-        if self.save_file:
-            with open(self.save_file, "w", encoding="utf-8") as save_file:
-                json.dump([song.json for song, _ in results], save_file, indent=4)
-
         return results
 
+    def _count_songs(self, songs: Iterable[Song]) -> Iterable[Song]:
+        """
+        Update the song count while songs are read from a lazy iterable.
+
+        ### Arguments
+        - songs: The songs to count.
+
+        ### Returns
+        - Generator yielding the songs.
+        """
+
+        for song in songs:
+            self.progress_handler.set_song_count(self.progress_handler.song_count + 1)
+            yield song
+
     async def pool_download(self, song: Song) -> Tuple[Song, Optional[Path]]:
         """
-        Run asynchronous task in a pool to make sure that all processes.
+        Run a single song through the download pipeline.
 
         ### Arguments
         - song: The song to download.
@@ -266,19 +480,13 @@ async def pool_download(self, song: Song) -> Tuple[Song, Optional[Path]]:
         - tuple with the song and the path to the downloaded file if successful.
 
         ### Notes
-        - This method calls `self.search_and_download` in a new thread.
-        """
-
-        # tasks that cannot acquire semaphore will wait here until it's free
-        # only certain amount of tasks can acquire the semaphore at the same time
-        async with self.semaphore:
-            # The following function calls blocking code, which would block whole event loop.
-            # Therefore it has to be called in a separate thread via ThreadPoolExecutor. This
-            # is not a problem, since GIL is released for the I/O operations, so it shouldn't
-            # hurt performance.
-            return await self.loop.run_in_executor(
-                self.thread_executor, self.search_and_download, song
-            )
+        - The blocking stages are run in `self.thread_executor`,
+            so this method can be awaited from the event loop.
+        """
+
+        jobs = await self.pipeline.process([DownloadJob(song)])
+
+        return jobs[0].song, jobs[0].path
 
     def search(self, song: Song) -> Tuple[str, AudioProvider]:
         """
@@ -289,10 +497,67 @@ def search(self, song: Song) -> Tuple[str, AudioProvider]:
 
         ### Returns
         - tuple with download url and audio provider if successful.
+
+        ### Notes
+        - The search cache is consulted first, results of the providers
+            (also failed searches) are stored in it.
+        - A provider whose first search raises an error is marked as unhealthy
+            and skipped from then on. Later errors of a provider only fall back
+            to the next provider for this song. The error is only raised
+            if none of the providers found the song.
         """
 
+        error: Optional[Exception] = None
         for audio_provider in self.audio_providers:
-            url = audio_provider.search(song)
+            if audio_provider.healthy is False:
+                continue
+
+            cache_key = self.get_search_cache_key(audio_provider, song)
+            cached = None
+            if cache_key and self.search_cache:
+                cached = self.search_cache.get(cache_key)
+
+            if cached is not None:
+                url = cached["url"]
+                self.progress_handler.debug(
+                    f"Using cached {audio_provider.name} result for {song.display_name}"
+                )
+            else:
+                self.rate_limiter.acquire(audio_provider.name)
+
+                try:
+                    url, score = audio_provider.search_with_score(song)
+                except Exception as exception:
+                    self.rate_limiter.update(
+                        audio_provider.name, get_status_code(exception)
+                    )
+
+                    error = exception
+                    if audio_provider.healthy is None:
+                        audio_provider.healthy = False
+                        self.progress_handler.warn(
+                            f"{audio_provider.name} is not available, "
+                            f"using the next audio provider: {exception}"
+                        )
+                    else:
+                        self.progress_handler.debug(
+                            f"{audio_provider.name} failed to search for "
+                            f"{song.display_name}, using the next audio provider: "
+                            f"{exception}"
+                        )
+
+                    continue
+
+                audio_provider.healthy = True
+                self.rate_limiter.update(audio_provider.name, 200)
+
+                if cache_key and self.search_cache:
+                    self.search_cache.set(
+                        cache_key,
+                        {"url": url, "score": score},
+                        None if url else SEARCH_CACHE_NEGATIVE_TTL,
+                    )
+
             if url:
                 return url, audio_provider
 
@@ -300,8 +565,146 @@ def search(self, song: Song) -> Tuple[str, AudioProvider]:
                 f"{audio_provider.name} failed to find {song.display_name}"
             )
 
+        if error is not None:
+            raise error
+
         raise LookupError(f"No results found for song: {song.display_name}")
 
+    def get_search_cache_key(
+        self, audio_provider: AudioProvider, song: Song
+    ) -> Optional[str]:
+        """
+        Get the key of the song in the search cache.
+
+        ### Arguments
+        - audio_provider: The audio provider that searches for the song.
+        - song: The song to search for.
+
+        ### Returns
+        - The cache key or None if the song can't be identified.
+        """
+
+        song_id = song.isrc or song.song_id
+        if not song_id:
+            return None
+
+        # Provider settings that change the search results are part of the key
+        return "|".join(
+            [
+                audio_provider.name,
+                song_id,
+                self.search_query or "",
+                "filtered" if self.filter_results else "unfiltered",
+                self.output_format,
+            ]
+        )
+
+    @staticmethod
+    def get_lyrics_cache_key(
+        lyrics_provider: LyricsProvider, song: Song
+    ) -> Optional[str]:
+        """
+        Get the key of the song in the lyrics cache.
+
+        ### Arguments
+        - lyrics_provider: The lyrics provider that searches for the lyrics.
+        - song: The song to search for.
+
+        ### Returns
+        - The cache key or None if the song can't be identified.
+        """
+
+        song_id = song.isrc or song.song_id
+        if not song_id:
+            return None
+
+        return f"{lyrics_provider.name}|{song_id}"
+
+    def get_lyrics(self, lyrics_provider: LyricsProvider, song: Song) -> Optional[str]:
+        """
+        Get the lyrics from a single provider and store the result in the lyrics cache.
+
+        ### Arguments
+        - lyrics_provider: The lyrics provider to use.
+        - song: The song to search for.
+
+        ### Returns
+        - The lyrics or None if the provider didn't find them.
+
+        ### Errors
+        - RequestException if a request of the provider failed.
+
+        ### Notes
+        - Only found lyrics are cached here, missing lyrics are cached
+            by `start_lyrics_search` once it knows that no provider failed.
+        """
+
+        lyrics = lyrics_provider.get_lyrics(song.name, song.artists)
+
+        cache_key = self.get_lyrics_cache_key(lyrics_provider, song)
+        if lyrics and cache_key and self.lyrics_cache:
+            self.lyrics_cache.set(cache_key, {"lyrics": lyrics})
+
+        return lyrics
+
+    def open_library(self) -> LibraryIndex:
+        """
+        Open the library index of the output directory,
+        songs downloaded from now on are recorded in it.
+
+        ### Returns
+        - The library index.
+        """
+
+        if self.library is None:
+            self.library = LibraryIndex(get_library_path(self.output))
+
+        return self.library
+
+    def create_output_file(self, song: Song) -> Path:
+        """
+        Create the path of the file the song is downloaded to.
+
+        ### Arguments
+        - song: The song.
+
+        ### Returns
+        - The path of the output file.
+        """
+
+        output_file = create_file_name(song, self.output, self.output_format)
+
+        # Restrict the filename if needed
+        if self.restrict is True:
+            output_file = restrict_filename(output_file)
+
+        return output_file
+
+    def update_metadata(self, song: Song, path: Path) -> None:
+        """
+        Embed the current metadata in an already downloaded song.
+
+        ### Arguments
+        - song: The song.
+        - path: The path of the downloaded file.
+
+        ### Errors
+        - MetadataError if the metadata couldn't be embedded.
+        """
+
+        try:
+            lyrics = self.search_lyrics(song)
+        except LookupError:
+            lyrics = ""
+
+        try:
+            embed_metadata(path, song, self.output_format, lyrics, self.cover_cache)
+        except Exception as exception:
+            raise MetadataError("Failed to embed metadata to the song") from exception
+
+        if self.library is not None:
+            self.library.add(song, path, self.output_format)
+
     def search_lyrics(self, song: Song) -> str:
         """
         Search for lyrics using all available providers.
@@ -311,22 +714,124 @@ def search_lyrics(self, song: Song) -> str:
 
         ### Returns
         - lyrics if successful.
+
+        ### Errors
+        - LookupError if no provider found the lyrics.
+        """
+
+        return self.start_lyrics_search(song).result()
+
+    def start_lyrics_search(self, song: Song) -> "concurrent.futures.Future[str]":
+        """
+        Query all lyrics providers at the same time.
+
+        ### Arguments
+        - song: The song to search for.
+
+        ### Returns
+        - Future with the lyrics of the first provider in the list that found them,
+            or with a LookupError if no provider found them.
+
+        ### Notes
+        - Cached results (also failed ones) are used without querying the provider.
+        - Missing lyrics are cached only if all providers that were waited for
+            answered, a provider that raised an error is queried again on the next run.
+        - Once the lyrics are found, the queries of the providers with
+            lower priority that haven't started yet are cancelled,
+            the running ones are limited by the providers' timeout.
         """
 
+        result: "concurrent.futures.Future[str]" = concurrent.futures.Future()
+        lock = threading.Lock()
+
+        cache_keys = {
+            lyrics_provider.name: self.get_lyrics_cache_key(lyrics_provider, song)
+            for lyrics_provider in self.lyrics_providers
+        }
+
+        cached: Dict[str, Any] = {}
+        if self.lyrics_cache:
+            cached = self.lyrics_cache.get_many(
+                cache_key for cache_key in cache_keys.values() if cache_key
+            )
+
+        searches: List[Tuple[LyricsProvider, concurrent.futures.Future]] = []
+        queried: Dict[str, str] = {}
         for lyrics_provider in self.lyrics_providers:
-            lyrics = lyrics_provider.get_lyrics(song.name, song.artists)
-            if lyrics:
+            cache_key = cache_keys[lyrics_provider.name]
+            if cache_key in cached:
                 self.progress_handler.debug(
-                    f"Found lyrics for {song.display_name} on {lyrics_provider.name}"
+                    f"Using cached {lyrics_provider.name} lyrics "
+                    f"for {song.display_name}"
                 )
-                return lyrics
 
-            self.progress_handler.debug(
-                f"{lyrics_provider.name} failed to find lyrics "
-                f"for {song.display_name}"
-            )
+                search: concurrent.futures.Future = concurrent.futures.Future()
+                search.set_result(cached[cache_key]["lyrics"])
+            else:
+                search = self.lyrics_executor.submit(
+                    self.get_lyrics, lyrics_provider, song
+                )
+
+                if cache_key:
+                    queried[lyrics_provider.name] = cache_key
+
+            searches.append((lyrics_provider, search))
+
+        def settle(_) -> None:
+            with lock:
+                if result.done():
+                    return
+
+                # Go through the providers by priority,
+                # wait while a provider with higher priority is still searching
+                missing: List[str] = []
+                failed = False
+                lyrics: Optional[str] = None
+                for lyrics_provider, search in searches:
+                    if not search.done():
+                        return
+
+                    if search.cancelled() or search.exception() is not None:
+                        failed = True
+                    else:
+                        lyrics = search.result()
+
+                    if lyrics:
+                        self.progress_handler.debug(
+                            f"Found lyrics for {song.display_name} "
+                            f"on {lyrics_provider.name}"
+                        )
+                        break
+
+                    if lyrics_provider.name in queried:
+                        missing.append(queried[lyrics_provider.name])
+
+                # A provider that failed might have the lyrics on the next run
+                if missing and not failed and self.lyrics_cache:
+                    self.lyrics_cache.set_many(
+                        {cache_key: {"lyrics": None} for cache_key in missing},
+                        LYRICS_CACHE_NEGATIVE_TTL,
+                    )
+
+                if not lyrics:
+                    result.set_exception(
+                        LookupError(f"No lyrics found for song: {song.display_name}")
+                    )
+                    return
+
+                result.set_result(lyrics)
+
+            # Cancelling a search runs its callbacks, which take the lock
+            for _, other_search in searches:
+                other_search.cancel()
 
-        raise LookupError(f"No lyrics found for song: {song.display_name}")
+        for _, search in searches:
+            search.add_done_callback(settle)
+
+        if len(searches) == 0:
+            settle(None)
+
+        return result
 
     def search_and_download(self, song: Song) -> Tuple[Song, Optional[Path]]:
         """
@@ -339,170 +844,473 @@ def search_and_download(self, song: Song) -> Tuple[Song, Optional[Path]]:
         - tuple with the song and the path to the downloaded file if successful.
 
         ### Notes
-        - This function is synchronous.
+        - This function is synchronous, it runs all the pipeline stages
+            one after another in the current thread.
+        """
+
+        job = DownloadJob(song)
+
+        try:
+            for stage in self.stages:
+                if not stage.function(job):
+                    break
+        except Exception as exception:
+            self.handle_error(job, exception)
+
+        return job.song, job.path
+
+    def resolve_metadata(self, job: DownloadJob) -> bool:
+        """
+        Pipeline stage that fetches the metadata of placeholder songs
+        and prepares the output file.
+
+        ### Arguments
+        - job: The download job.
+
+        ### Returns
+        - False if the song was skipped, True otherwise.
         """
 
+        song = job.song
+
+        # Continue where an interrupted download of the song stopped
+        if self.journal is not None and song.url:
+            job.resumed = self.journal.get(song.url)
+
+        if job.resumed is not None:
+            song = job.song = Song.from_dict(
+                {**job.resumed.song, "song_list": song.song_list}
+            )
+
         # Check if we have all the metadata
         # and that the song object is not a placeholder
         # If it's None extract the current metadata
         # And reinitialize the song object
         if song.name is None and song.url:
-            data = song.json
-            new_data = Song.from_url(data["url"]).json
-            data.update((k, v) for k, v in new_data.items() if v is not None)
+            new_song = Song.from_url(song.url)
 
-            if data.get("song_list"):
-                # Reinitialize the correct song list object
-                data["song_list"] = song.song_list.__class__(**data["song_list"])
+            # Keep the values that were set on the placeholder
+            # (e.g. download url and song list) if spotify doesn't provide them
+            for field in fields(new_song):
+                if getattr(new_song, field.name) is None:
+                    setattr(new_song, field.name, getattr(song, field.name))
 
-            # Reinitialize the song object
-            song = Song(**data)
+            song = job.song = new_song
 
         # Create the output file path
-        output_file = create_file_name(song, self.output, self.output_format)
-
-        # Restrict the filename if needed
-        if self.restrict is True:
-            output_file = restrict_filename(output_file)
+        output_file = self.create_output_file(song)
 
         # If the file already exists and we don't want to overwrite it,
         # we can skip the download
         if output_file.exists() and self.overwrite == "skip":
+            # The song was finished before its journal entry was removed
+            if job.resumed is not None:
+                self.journal.remove(song.url)  # type: ignore
+
             self.progress_handler.log(f"Skipping {song.display_name}")
-            self.progress_handler.overall_completed_tasks += 1
+            self.progress_handler.complete_task()
             self.progress_handler.update_overall()
-            return song, None
+            return False
 
         # Don't skip if the file exists and overwrite is set to force
         if output_file.exists() and self.overwrite == "force":
             self.progress_handler.debug(f"Overwriting {song.display_name}")
 
         # Initalize the progress tracker
-        display_progress_tracker = self.progress_handler.get_new_tracker(song)
+        job.tracker = self.progress_handler.get_new_tracker(song)
 
         # Create the output directory if it doesn't exist
         output_file.parent.mkdir(parents=True, exist_ok=True)
 
-        try:
-            if song.download_url is None:
-                url, audio_provider = self.search(song)
-            else:
-                url = song.download_url
-                audio_provider = AudioProvider(
-                    output_format=self.output_format,
-                    cookie_file=self.cookie_file,
-                    search_query=self.search_query,
-                    filter_results=self.filter_results,
-                )
+        job.output_file = output_file
 
-            # Get the download metadata using yt-dlp
-            download_info = audio_provider.get_download_metadata(url)
+        # The song is written to the part file and moved to the output file
+        # once it's finished, so an interrupted download never counts as done
+        job.part_file = output_file.with_name(
+            f"{output_file.stem}.part{output_file.suffix}"
+        )
 
-            if download_info is None:
-                self.progress_handler.debug(
-                    f"No download info found for {song.display_name}, url: {url}"
-                )
-                raise LookupError(
-                    f"yt-dlp failed to get metadata for: {song.name} - {song.artist}"
-                )
+        # Sponsor block needs the download info, which isn't kept in the journal
+        if (
+            job.resumed is not None
+            and job.resumed.reached(STAGE_TRANSCODED)
+            and (self.sponsor_block or not job.part_file.is_file())
+        ):
+            job.resumed.stage = STAGE_MATCHED
+
+        self.record_stage(job, STAGE_RESOLVED)
+
+        return True
+
+    def find_download_url(self, job: DownloadJob) -> bool:
+        """
+        Pipeline stage that searches the audio providers for the song.
+
+        ### Arguments
+        - job: The download job.
 
+        ### Returns
+        - True, errors are raised.
+        """
+
+        if job.resumed is not None and job.resumed.reached(STAGE_MATCHED):
+            job.url = job.resumed.url
+            job.audio_provider = next(
+                (
+                    audio_provider
+                    for audio_provider in self.audio_providers
+                    if audio_provider.name == job.resumed.audio_provider
+                ),
+                None,
+            )
+
+        if job.url is not None and job.audio_provider is not None:
             self.progress_handler.debug(
-                f"Downloading {song.display_name} using {url}, "
-                f"audio provider: {audio_provider.name}"
+                f"Resuming {job.song.display_name} from the journal: {job.url}"
+            )
+        elif job.song.download_url is None:
+            job.url, job.audio_provider = self.search(job.song)
+        else:
+            job.url = job.song.download_url
+            job.audio_provider = AudioProvider(
+                output_format=self.output_format,
+                cookie_file=self.cookie_file,
+                search_query=self.search_query,
+                filter_results=self.filter_results,
             )
 
-            success, result = convert_sync(
-                (download_info["url"], download_info["ext"]),
-                output_file,
-                self.ffmpeg,
-                self.output_format,
-                self.bitrate,
-                self.ffmpeg_args,
-                display_progress_tracker.progress_hook,
+        self.record_stage(job, STAGE_MATCHED)
+
+        # Look for the lyrics while the song is downloaded
+        if not self.is_resumed(job, STAGE_TAGGED):
+            job.lyrics = self.start_lyrics_search(job.song)
+
+        return True
+
+    def fetch_stream(self, job: DownloadJob) -> bool:
+        """
+        Pipeline stage that gets the download metadata (stream url etc.) using yt-dlp.
+
+        ### Arguments
+        - job: The download job.
+
+        ### Returns
+        - True, errors are raised.
+
+        ### Errors
+        - LookupError if yt-dlp doesn't return any metadata.
+        """
+
+        # The song was already transcoded before the download was interrupted
+        if self.is_resumed(job, STAGE_TRANSCODED):
+            return True
+
+        song = job.song
+        download_info = job.audio_provider.get_download_metadata(job.url)  # type: ignore
+
+        if download_info is None:
+            self.progress_handler.debug(
+                f"No download info found for {song.display_name}, url: {job.url}"
+            )
+            raise LookupError(
+                f"yt-dlp failed to get metadata for: {song.name} - {song.artist}"
             )
 
-            if not success and result:
-                # If the conversion failed and there is an error message
-                # create a file with the error message
-                # and save it in the errors directory
-                # raise an exception with file path
-                file_name = (
-                    get_errors_path()
-                    / f"ffmpeg_error_{datetime.datetime.now().strftime('%Y-%m-%d-%H-%M-%S')}.txt"
-                )
+        job.download_info = download_info
 
-                error_message = ""
-                for key, value in result.items():
-                    error_message += f"### {key}:\n{str(value).strip()}\n\n"
+        self.progress_handler.debug(
+            f"Downloading {song.display_name} using {job.url}, "
+            f"audio provider: {job.audio_provider.name}"  # type: ignore
+        )
 
-                with open(file_name, "w", encoding="utf-8") as error_path:
-                    error_path.write(error_message)
+        return True
 
-                # Remove the file that failed to convert
-                output_file.unlink()
+    def probe(self, job: DownloadJob) -> bool:
+        """
+        Pipeline stage that decides whether the stream can be copied,
+        remuxed or has to be transcoded.
 
-                raise FFmpegError(
-                    f"Failed to convert {song.display_name}, "
-                    f"you can find error here: {str(file_name.absolute())}"
-                )
+        ### Arguments
+        - job: The download job.
 
-            download_info["filepath"] = str(output_file)
+        ### Returns
+        - True
+        """
 
-            # Set the song's download url
-            if song.download_url is None:
-                song.download_url = download_info["webpage_url"]
+        if self.is_resumed(job, STAGE_TRANSCODED):
+            return True
 
-            display_progress_tracker.notify_download_complete()
+        download_info: Dict[str, Any] = job.download_info  # type: ignore
 
-            if self.sponsor_block:
-                post_processor = SponsorBlockPP(
-                    audio_provider.audio_handler, SPONSOR_BLOCK_CATEGORIES
-                )
+        codec, container, source_bitrate = get_stream_info(download_info)
 
-                _, download_info = post_processor.run(download_info)
-                chapters = download_info["sponsorblock_chapters"]
-                if len(chapters) > 0:
-                    self.progress_handler.log(
-                        f"Removing {len(chapters)} sponsor segments for {song.display_name}"
-                    )
+        # yt-dlp doesn't always know the codec, ask ffprobe instead
+        if codec is None:
+            codec, container, source_bitrate = probe_file(
+                download_info["url"], self.ffmpeg
+            )
 
-                    modify_chapters = ModifyChaptersPP(
-                        audio_provider.audio_handler,
-                        remove_sponsor_segments=SPONSOR_BLOCK_CATEGORIES,
-                    )
+        job.conversion, reason = choose_conversion(
+            codec,
+            container,
+            source_bitrate,
+            self.output_format,
+            self.bitrate,
+            self.ffmpeg_args,
+        )
 
-                    files_to_delete, download_info = modify_chapters.run(download_info)
+        self.progress_handler.debug(
+            f"Using {job.conversion} for {job.song.display_name}: {reason}"
+        )
 
-                    for file_to_delete in files_to_delete:
-                        Path(file_to_delete).unlink()
+        return True
 
-            try:
-                lyrics = self.search_lyrics(song)
-            except LookupError:
-                self.progress_handler.debug(
-                    f"No lyrics found for {song.display_name}, "
-                    "lyrics providers: "
-                    f"{', '.join([lprovider.name for lprovider in self.lyrics_providers])}"
+    def transcode(self, job: DownloadJob) -> bool:
+        """
+        Pipeline stage that downloads and converts the stream with ffmpeg.
+
+        ### Arguments
+        - job: The download job.
+
+        ### Returns
+        - True, errors are raised.
+
+        ### Errors
+        - FFmpegError if the conversion failed.
+        """
+
+        if self.is_resumed(job, STAGE_TRANSCODED):
+            job.tracker.notify_download_complete()  # type: ignore
+            return True
+
+        song = job.song
+        part_file: Path = job.part_file  # type: ignore
+        download_info: Dict[str, Any] = job.download_info  # type: ignore
+
+        success, result = self.transcode_pool.convert(
+            (download_info["url"], download_info["ext"]),
+            part_file,
+            self.ffmpeg,
+            self.output_format,
+            self.bitrate,
+            self.ffmpeg_args,
+            job.tracker.progress_hook,  # type: ignore
+            job.conversion,
+        )
+
+        if not success and result:
+            # If the conversion failed and there is an error message
+            # create a file with the error message
+            # and save it in the errors directory
+            # raise an exception with file path
+            file_name = (
+                get_errors_path()
+                / f"ffmpeg_error_{datetime.datetime.now().strftime('%Y-%m-%d-%H-%M-%S')}.txt"
+            )
+
+            error_message = ""
+            for key, value in result.items():
+                error_message += f"### {key}:\n{str(value).strip()}\n\n"
+
+            with open(file_name, "w", encoding="utf-8") as error_path:
+                error_path.write(error_message)
+
+            # Remove the file that failed to convert
+            if part_file.is_file():
+                part_file.unlink()
+
+            raise FFmpegError(
+                f"Failed to convert {song.display_name}, "
+                f"you can find error here: {str(file_name.absolute())}"
+            )
+
+        download_info["filepath"] = str(part_file)
+
+        # Set the song's download url
+        if song.download_url is None:
+            song.download_url = download_info["webpage_url"]
+
+        self.record_stage(job, STAGE_TRANSCODED)
+
+        job.tracker.notify_download_complete()  # type: ignore
+
+        return True
+
+    def tag(self, job: DownloadJob) -> bool:
+        """
+        Pipeline stage that removes sponsor segments and embeds the metadata.
+
+        ### Arguments
+        - job: The download job.
+
+        ### Returns
+        - True, errors are raised.
+
+        ### Errors
+        - MetadataError if the metadata couldn't be embedded.
+        """
+
+        if self.is_resumed(job, STAGE_TAGGED):
+            return True
+
+        song = job.song
+
+        if self.sponsor_block:
+            audio_handler = job.audio_provider.audio_handler  # type: ignore
+            post_processor = SponsorBlockPP(audio_handler, SPONSOR_BLOCK_CATEGORIES)
+
+            _, job.download_info = post_processor.run(job.download_info)
+            chapters = job.download_info["sponsorblock_chapters"]
+            if len(chapters) > 0:
+                self.progress_handler.log(
+                    f"Removing {len(chapters)} sponsor segments for {song.display_name}"
                 )
-                lyrics = ""
 
-            try:
-                embed_metadata(output_file, song, self.output_format, lyrics)
-            except Exception as exception:
-                raise MetadataError(
-                    "Failed to embed metadata to the song"
-                ) from exception
+                modify_chapters = ModifyChaptersPP(
+                    audio_handler,
+                    remove_sponsor_segments=SPONSOR_BLOCK_CATEGORIES,
+                )
 
-            display_progress_tracker.notify_complete()
+                files_to_delete, job.download_info = modify_chapters.run(
+                    job.download_info
+                )
 
-            self.progress_handler.log(
-                f'Downloaded "{song.display_name}": {song.download_url}'
+                for file_to_delete in files_to_delete:
+                    Path(file_to_delete).unlink()
+
+        try:
+            if job.lyrics is None:
+                job.lyrics = self.start_lyrics_search(song)
+
+            lyrics = job.lyrics.result()
+        except LookupError:
+            self.progress_handler.debug(
+                f"No lyrics found for {song.display_name}, "
+                "lyrics providers: "
+                f"{', '.join([lprovider.name for lprovider in self.lyrics_providers])}"
             )
+            lyrics = ""
 
-            return song, output_file
+        try:
+            embed_metadata(
+                job.part_file,  # type: ignore
+                song,
+                self.output_format,
+                lyrics,
+                self.cover_cache,
+            )
         except Exception as exception:
-            display_progress_tracker.notify_error(traceback.format_exc(), exception)
-            self.errors.append(
-                f"{song.url} - {exception.__class__.__name__}: {exception}"
+            raise MetadataError("Failed to embed metadata to the song") from exception
+
+        self.record_stage(job, STAGE_TAGGED)
+
+        return True
+
+    def finalize(self, job: DownloadJob) -> bool:
+        """
+        Pipeline stage that marks the song as downloaded.
+
+        ### Arguments
+        - job: The download job.
+
+        ### Returns
+        - True
+        """
+
+        os.replace(job.part_file, job.output_file)  # type: ignore
+
+        if self.journal is not None and job.song.url:
+            self.journal.remove(job.song.url)
+
+        job.tracker.notify_complete()  # type: ignore
+        job.path = job.output_file
+
+        if self.library is not None:
+            self.library.add(
+                job.song, job.output_file, self.output_format  # type: ignore
+            )
+
+        self.progress_handler.log(
+            f'Downloaded "{job.song.display_name}": {job.song.download_url}'
+        )
+
+        return True
+
+    def record_stage(self, job: DownloadJob, stage: str) -> None:
+        """
+        Record a completed stage of the job in the journal.
+
+        ### Arguments
+        - job: The download job.
+        - stage: The completed stage.
+        """
+
+        if self.journal is None or not job.song.url:
+            return
+
+        self.journal.record(
+            job.song.url,
+            JournalEntry(
+                stage,
+                job.song.json,
+                url=job.url,
+                audio_provider=(
+                    job.audio_provider.name if job.audio_provider else None
+                ),
+                part_file=str(job.part_file) if job.part_file else None,
+            ),
+        )
+
+    @staticmethod
+    def is_resumed(job: DownloadJob, stage: str) -> bool:
+        """
+        Check if the job completed a stage before the download was interrupted.
+
+        ### Arguments
+        - job: The download job.
+        - stage: The stage.
+
+        ### Returns
+        - True if the stage can be skipped.
+        """
+
+        return job.resumed is not None and job.resumed.reached(stage)
+
+    def save_result(self, job: DownloadJob) -> None:
+        """
+        Write a finished job to the save file, if one is being written.
+
+        ### Arguments
+        - job: The finished download job.
+        """
+
+        if self.save_writer is not None:
+            self.save_writer.write(job.song)
+
+    def handle_error(self, job: DownloadJob, exception: Exception) -> None:
+        """
+        Report an exception raised by one of the pipeline stages.
+
+        ### Arguments
+        - job: The download job that failed.
+        - exception: The exception that was raised.
+        """
+
+        message = "".join(
+            traceback.format_exception(
+                type(exception), exception, exception.__traceback__
             )
-            return song, None
+        )
+
+        if job.tracker is not None:
+            job.tracker.notify_error(message, exception)
+        else:
+            # The song failed before it got a progress tracker
+            self.progress_handler.debug(message)
+            self.progress_handler.error(f"{exception.__class__.__name__}: {exception}")
+            self.progress_handler.complete_task()
+            self.progress_handler.update_overall()
+
+        self.errors.append(
+            f"{job.song.url} - {exception.__class__.__name__}: {exception}"
+        )
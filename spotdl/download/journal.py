@@ -0,0 +1,196 @@
+"""
+Journal module, records how far every song got in the download pipeline,
+so an interrupted download can be resumed without redoing searches or transcodes.
+
+    >>> journal = DownloadJournal(Path("backfill.journal"))
+    >>> journal.record(song.url, JournalEntry(STAGE_MATCHED, song_data, url=url))
+    >>> journal.get(song.url)
+"""
+
+import json
+import os
+import threading
+import time
+
+from dataclasses import asdict, dataclass
+from pathlib import Path
+from typing import Any, Dict, Optional
+
+# Stages recorded in the journal, in the order they are completed
+STAGE_RESOLVED = "resolved"
+STAGE_MATCHED = "matched"
+STAGE_TRANSCODED = "transcoded"
+STAGE_TAGGED = "tagged"
+JOURNAL_STAGES = (STAGE_RESOLVED, STAGE_MATCHED, STAGE_TRANSCODED, STAGE_TAGGED)
+
+JOURNAL_VERSION = 1
+
+# The journal is written at most once per interval (in seconds),
+# records made in between are written with the next one
+JOURNAL_FLUSH_INTERVAL = 1.0
+
+
+class JournalError(Exception):
+    """
+    Base class for all exceptions related to the download journal.
+    """
+
+
+@dataclass
+class JournalEntry:
+    """
+    Last completed stage of a song and the results needed to resume after it.
+    """
+
+    stage: str
+    song: Dict[str, Any]
+    url: Optional[str] = None
+    audio_provider: Optional[str] = None
+    part_file: Optional[str] = None
+
+    def reached(self, stage: str) -> bool:
+        """
+        Check if the song completed a stage.
+
+        ### Arguments
+        - stage: The stage.
+
+        ### Returns
+        - True if the stage or a later one was completed.
+        """
+
+        return JOURNAL_STAGES.index(self.stage) >= JOURNAL_STAGES.index(stage)
+
+
+class DownloadJournal:
+    """
+    Thread-safe journal of the songs that are being downloaded, keyed by the song url.
+    Finished songs are removed, so the journal only holds interrupted and failed songs.
+    """
+
+    def __init__(
+        self, path: Path, flush_interval: float = JOURNAL_FLUSH_INTERVAL
+    ) -> None:
+        """
+        Open (or create) the journal.
+
+        ### Arguments
+        - path: The path of the journal file.
+        - flush_interval: Minimum number of seconds between two writes.
+
+        ### Errors
+        - JournalError if the journal file is invalid.
+        """
+
+        self.path = path
+        self.flush_interval = flush_interval
+        self.lock = threading.Lock()
+        self.entries = self._load()
+        self.dirty = False
+        self.flushed = 0.0
+
+    def get(self, key: str) -> Optional[JournalEntry]:
+        """
+        Get the journal entry of a song.
+
+        ### Arguments
+        - key: The url of the song.
+
+        ### Returns
+        - The entry or None if the song isn't in the journal.
+        """
+
+        with self.lock:
+            return self.entries.get(key)
+
+    def record(self, key: str, entry: JournalEntry) -> None:
+        """
+        Record a completed stage of a song.
+
+        ### Arguments
+        - key: The url of the song.
+        - entry: The new entry of the song.
+        """
+
+        with self.lock:
+            self.entries[key] = entry
+            self.dirty = True
+
+        self.flush(force=False)
+
+    def remove(self, key: str) -> None:
+        """
+        Remove a finished song from the journal.
+
+        ### Arguments
+        - key: The url of the song.
+        """
+
+        with self.lock:
+            if self.entries.pop(key, None) is not None:
+                self.dirty = True
+
+        self.flush(force=False)
+
+    def flush(self, force: bool = True) -> None:
+        """
+        Write the journal to disk.
+
+        ### Arguments
+        - force: Write even if the last write was less than `flush_interval` ago.
+
+        ### Notes
+        - The journal is written to a temporary file that is renamed over the
+            journal, so an interrupted write never leaves a broken journal behind.
+        """
+
+        with self.lock:
+            now = time.monotonic()
+            if not self.dirty or (
+                not force and now - self.flushed < self.flush_interval
+            ):
+                return
+
+            data = {
+                "version": JOURNAL_VERSION,
+                "songs": {key: asdict(entry) for key, entry in self.entries.items()},
+            }
+
+            temp_path = self.path.with_name(self.path.name + ".tmp")
+            with open(temp_path, "w", encoding="utf-8") as temp_file:
+                json.dump(data, temp_file, ensure_ascii=False)
+                temp_file.flush()
+                os.fsync(temp_file.fileno())
+
+            os.replace(temp_path, self.path)
+
+            self.dirty = False
+            self.flushed = now
+
+    def close(self) -> None:
+        """
+        Write the journal to disk, removes it if all songs were finished.
+        """
+
+        self.flush()
+
+        with self.lock:
+            if not self.entries and self.path.is_file():
+                self.path.unlink()
+
+    def _load(self) -> Dict[str, JournalEntry]:
+        if not self.path.is_file():
+            return {}
+
+        try:
+            with open(self.path, "r", encoding="utf-8") as journal_file:
+                data = json.load(journal_file)
+
+            if data.get("version") != JOURNAL_VERSION:
+                raise JournalError(
+                    f"Unsupported journal version: {data.get('version')}"
+                )
+
+            return {key: JournalEntry(**entry) for key, entry in data["songs"].items()}
+        except (ValueError, TypeError, KeyError, AttributeError) as exception:
+            raise JournalError(f"Invalid journal file: {self.path}") from exception
@@ -0,0 +1,196 @@
+"""
+Pipeline module, runs items through a series of stages connected by asyncio queues.
+Every stage has its own number of workers, so slow stages don't hold up fast ones.
+"""
+
+import asyncio
+import concurrent.futures
+
+from dataclasses import dataclass
+from typing import Any, Callable, Dict, Iterable, List, Optional, Sequence
+
+# Marks the end of the input for the workers of a stage
+_STOP = object()
+
+
+class PipelineError(Exception):
+    """
+    Base class for all exceptions related to the pipeline.
+    """
+
+
+@dataclass
+class Stage:
+    """
+    Single step of the pipeline.
+
+    `function` is a blocking callable that receives the item and returns True
+    if the item should be passed to the next stage, or False if it's finished
+    (e.g. skipped or failed).
+    """
+
+    name: str
+    function: Callable[[Any], bool]
+    workers: int = 1
+
+
+class Pipeline:
+    """
+    Staged producer/consumer pipeline.
+    Items are processed by the stages in order, each stage runs its blocking
+    function in a thread pool with at most `stage.workers` items at once.
+    """
+
+    def __init__(
+        self,
+        stages: List[Stage],
+        loop: asyncio.AbstractEventLoop,
+        executor: Optional[concurrent.futures.Executor] = None,
+        error_handler: Optional[Callable[[Any, Exception], None]] = None,
+        result_handler: Optional[Callable[[Any], None]] = None,
+    ) -> None:
+        """
+        Initialize the pipeline.
+
+        ### Arguments
+        - stages: The stages to run the items through.
+        - loop: The event loop to run the pipeline on.
+        - executor: The executor to run the stage functions in.
+        - error_handler: Function called with the item and the exception
+            when a stage raises, the item is not processed any further.
+        - result_handler: Function called with every item as soon as it's finished.
+
+        ### Errors
+        - PipelineError if there are no stages or a stage has no workers.
+
+        ### Notes
+        - The executor should have at least as many workers as all stages combined,
+            otherwise stages will wait for each other.
+        """
+
+        if len(stages) == 0:
+            raise PipelineError("Pipeline requires at least one stage")
+
+        for stage in stages:
+            if stage.workers < 1:
+                raise PipelineError(f"Stage {stage.name} requires at least one worker")
+
+        self.stages = stages
+        self.loop = loop
+        self.executor = executor
+        self.error_handler = error_handler
+        self.result_handler = result_handler
+
+    def run(self, items: Iterable[Any]) -> List[Any]:
+        """
+        Run the items through the pipeline and wait until all are finished.
+
+        ### Arguments
+        - items: The items to process.
+
+        ### Returns
+        - The processed items in the same order as the input.
+        """
+
+        return self.loop.run_until_complete(self.process(items))
+
+    async def process(self, items: Iterable[Any]) -> List[Any]:
+        """
+        Run the items through the pipeline.
+
+        ### Arguments
+        - items: The items to process.
+
+        ### Returns
+        - The processed items in the same order as the input.
+
+        ### Notes
+        - Items are read from the iterable while earlier items are still being processed,
+            so a lazy iterable is consumed as fast as the first stage can accept items.
+        - Exceptions that are not handled by the `error_handler` are raised
+            after all the other items are finished.
+        """
+
+        # Queues are bounded to keep memory flat when the input is large
+        queues: List[asyncio.Queue] = [
+            asyncio.Queue(maxsize=stage.workers * 2) for stage in self.stages
+        ]
+
+        results: Dict[int, Any] = {}
+        errors: List[Exception] = []
+
+        async def feed() -> int:
+            # Lazy iterables may block (e.g. reading a file), so they are read
+            # in a thread, sequences are already in memory
+            iterator = iter(items)
+            lazy = not isinstance(items, Sequence)
+            count = 0
+
+            while True:
+                if lazy:
+                    item = await self.loop.run_in_executor(None, next, iterator, _STOP)
+                else:
+                    item = next(iterator, _STOP)
+
+                if item is _STOP:
+                    break
+
+                await queues[0].put((count, item))
+                count += 1
+
+            for _ in range(self.stages[0].workers):
+                await queues[0].put(_STOP)
+
+            return count
+
+        async def work(position: int) -> None:
+            stage = self.stages[position]
+            is_last = position == len(self.stages) - 1
+
+            while True:
+                entry = await queues[position].get()
+                if entry is _STOP:
+                    return
+
+                index, item = entry
+                try:
+                    proceed = await self.loop.run_in_executor(
+                        self.executor, stage.function, item
+                    )
+                except Exception as exception:  # pylint: disable=W0703
+                    proceed = False
+                    if self.error_handler is None:
+                        errors.append(exception)
+                    else:
+                        self.error_handler(item, exception)
+
+                if proceed and not is_last:
+                    await queues[position + 1].put(entry)
+                    continue
+
+                results[index] = item
+
+                if self.result_handler is not None:
+                    try:
+                        self.result_handler(item)
+                    except Exception as exception:  # pylint: disable=W0703
+                        errors.append(exception)
+
+        async def run_stage(position: int) -> None:
+            await asyncio.gather(
+                *(work(position) for _ in range(self.stages[position].workers))
+            )
+
+            # Let the next stage know that there won't be any more items
+            if position < len(self.stages) - 1:
+                for _ in range(self.stages[position + 1].workers):
+                    await queues[position + 1].put(_STOP)
+
+        count, *_ = await asyncio.gather(
+            feed(), *(run_stage(position) for position in range(len(self.stages)))
+        )
+
+        if errors:
+            raise errors[0]
+
+        return [results[index] for index in range(count)]
@@ -3,6 +3,7 @@
 """
 
 import logging
+import threading
 
 from typing import Any, Callable, Optional, List
 
@@ -167,6 +168,7 @@ def __init__(
         self.overall_progress = 0
         self.overall_total = 100
         self.overall_completed_tasks = 0
+        self.overall_lock = threading.Lock()
         self.update_callback = update_callback
         self.previous_overall = self.overall_completed_tasks
 
@@ -251,7 +253,18 @@ def set_song_count(self, count: int) -> None:
         self.overall_total = 100 * count
 
         if not self.simple_tui:
-            if self.song_count > 4:
+            # The count can grow while songs are streamed to the downloader,
+            # so update the existing overall progress bar instead of adding a new one
+            if self.overall_task_id is not None:
+                self.rich_progress_bar.update(
+                    self.overall_task_id,
+                    message=(
+                        f"{self.overall_completed_tasks}/{int(self.overall_total / 100)} "
+                        "complete"
+                    ),
+                    total=self.overall_total,
+                )
+            elif self.song_count > 4:
                 self.overall_task_id = self.rich_progress_bar.add_task(
                     description="Total",
                     message=(
@@ -348,6 +361,14 @@ def update_overall(self) -> None:
                 )
                 self.previous_overall = self.overall_completed_tasks
 
+    def complete_task(self) -> None:
+        """
+        Count a finished (or failed) song, songs are finished by multiple threads.
+        """
+
+        with self.overall_lock:
+            self.overall_completed_tasks += 1
+
     def get_new_tracker(self, song: Song) -> "SongTracker":
         """
         Get a new progress tracker.
@@ -428,12 +449,12 @@ def update(self, message=""):
 
             # If task is complete
             if self.progress == 100 or message == "Error":
-                self.parent.overall_completed_tasks += 1
+                self.parent.complete_task()
                 self.parent.rich_progress_bar.remove_task(self.task_id)
         else:
             # If task is complete
             if self.progress == 100 or message == "Error":
-                self.parent.overall_completed_tasks += 1
+                self.parent.complete_task()
 
             self.parent.log(f"{self.song.name} - {self.song.artist}: {message}")
 
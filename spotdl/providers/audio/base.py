@@ -2,12 +2,24 @@
 Base audio provider module.
 """
 
-from typing import Dict, Optional
+import threading
+
+from typing import Any, Dict, Optional, Tuple
 
 from yt_dlp import YoutubeDL
 
 from spotdl.types import Song
 
+# Prefer streams that are already in the output codec,
+# so they can be copied instead of transcoded by ffmpeg
+YTDL_FORMATS = {
+    "mp3": "bestaudio[acodec=mp3]/bestaudio",
+    "m4a": "bestaudio[ext=m4a]/bestaudio/best",
+    "opus": "bestaudio[acodec=opus]/bestaudio[ext=webm]/bestaudio/best",
+    "ogg": "bestaudio[acodec=vorbis]/bestaudio",
+    "flac": "bestaudio[acodec=flac]/bestaudio",
+}
+
 
 class AudioProviderError(Exception):
     """
@@ -71,16 +83,15 @@ def __init__(
         self.search_query = search_query
         self.filter_results = filter_results
 
-        if self.output_format == "m4a":
-            ytdl_format = "bestaudio[ext=m4a]/bestaudio/best"
-        elif self.output_format == "opus":
-            ytdl_format = "bestaudio[ext=webm]/bestaudio/best"
-        else:
-            ytdl_format = "bestaudio"
+        # None until the first search, False if the first search failed
+        self.healthy: Optional[bool] = None
+
+        self._client: Any = None
+        self._client_lock = threading.Lock()
 
         self.audio_handler = YoutubeDL(
             {
-                "format": ytdl_format,
+                "format": YTDL_FORMATS.get(self.output_format, "bestaudio"),
                 "quiet": True,
                 "no_warnings": True,
                 "encoding": "UTF-8",
@@ -89,6 +100,32 @@ def __init__(
             }
         )
 
+    @property
+    def client(self) -> Any:
+        """
+        Get the API client of the provider, it's created on first use
+        so that creating the provider doesn't make any requests.
+
+        ### Returns
+        - The client returned by `create_client`.
+        """
+
+        with self._client_lock:
+            if self._client is None:
+                self._client = self.create_client()
+
+            return self._client
+
+    def create_client(self) -> Any:
+        """
+        Create the API client of the provider.
+
+        ### Returns
+        - The client.
+        """
+
+        raise NotImplementedError
+
     def search(self, song: Song) -> Optional[str]:
         """
         Search for a song and return best match.
@@ -100,6 +137,22 @@ def search(self, song: Song) -> Optional[str]:
         - The url of the best match or None if no match was found.
         """
 
+        url, _ = self.search_with_score(song)
+
+        return url
+
+    def search_with_score(self, song: Song) -> Tuple[Optional[str], Optional[float]]:
+        """
+        Search for a song and return best match with its score.
+
+        ### Arguments
+        - song: The song to search for.
+
+        ### Returns
+        - tuple with the url of the best match and its score,
+            (None, None) if no match was found.
+        """
+
         raise NotImplementedError
 
     def get_results(self, search_term: str, **kwargs):
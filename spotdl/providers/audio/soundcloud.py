@@ -1,21 +1,30 @@
 """
 YTMusic module for downloading and searching songs.
 """
-from typing import Any, Dict, List, Optional
+from typing import Any, Dict, List, Optional, Tuple
 
 from soundcloud import SoundCloud as SoundCloudClient
 from itertools import islice
-from slugify import slugify
 
+import concurrent.futures
 import re
 
-from spotdl.utils.providers import match_percentage
+from spotdl.utils.providers import (
+    match_percentage,
+    match_percentages,
+    time_matches,
+)
 from spotdl.providers.audio.base import AudioProvider
 from spotdl.types import Song
 from spotdl.utils.formatter import (
     create_song_title,
     create_search_query,
 )
+from spotdl.utils.normalize import slugify
+
+
+# Maximum number of album lookups that are made at the same time
+ALBUM_LOOKUP_THREADS = 8
 
 
 class SoundCloud(AudioProvider):
@@ -23,19 +32,17 @@ class SoundCloud(AudioProvider):
     SoundCloud audio provider class
     """
 
-    def __init__(self, *args: Any, **kwargs: Any) -> None:
+    def create_client(self) -> SoundCloudClient:
         """
         Initialize the SoundCloud API
 
-        ### Arguments
-        - args: Arguments passed to the `AudioProvider` class.
-        - kwargs: Keyword arguments passed to the `AudioProvider` class.
+        ### Returns
+        - The SoundCloud API client.
         """
 
-        super().__init__(*args, **kwargs)
-        self.client = SoundCloudClient()
+        return SoundCloudClient()
 
-    def search(self, song: Song) -> Optional[str]:
+    def search_with_score(self, song: Song) -> Tuple[Optional[str], Optional[float]]:
         """
         Search for a song on SoundCloud.
 
@@ -43,7 +50,8 @@ def search(self, song: Song) -> Optional[str]:
         - song: The song to search for.
 
         ### Returns
-        - The url of the best match or None if no match was found.
+        - tuple with the url of the best match and its score,
+            (None, None) if no match was found.
         """
 
         if self.search_query:
@@ -56,7 +64,7 @@ def search(self, song: Song) -> Optional[str]:
         song_results = self.get_results(search_query)
 
         if not song_results:
-            return None
+            return None, None
 
         if self.filter_results:
             # Order results
@@ -71,9 +79,9 @@ def search(self, song: Song) -> Optional[str]:
             best_result = max(songs, key=lambda k: songs[k])
 
             if songs[best_result] >= 80:
-                return best_result
+                return best_result, songs[best_result]
         else:
-            return None
+            return None, None
 
         results = {**songs}
 
@@ -84,7 +92,7 @@ def search(self, song: Song) -> Optional[str]:
 
         # Get the result with highest score
         # and return the link
-        return sorted_results[0][0]
+        return sorted_results[0]
 
     def get_results(self, search_term: str, **kwargs) -> List[Dict[str, Any]]:
         """
@@ -105,26 +113,24 @@ def get_results(self, search_term: str, **kwargs) -> List[Dict[str, Any]]:
         edited_search_term = re.sub(regex, "", search_term)
         results.extend(list(islice(self.client.search(edited_search_term), 20)))
 
-        # Simplify results
+        # Simplify results, both searches often return the same tracks
         simplified_results = []
+        known_ids = set()
         for result in results:
-            if result.kind != "track":
+            if result.kind != "track" or result.id in known_ids:
                 continue
 
-            album = self.client.get_track_albums(result.id)
-
-            try:
-                album_name = next(album).title
-            except StopIteration:
-                album_name = None
+            known_ids.add(result.id)
 
+            # The album needs another request,
+            # it's fetched by `get_albums` only for the results that are matched
             simplified_results.append(
                 {
+                    "id": result.id,
                     "name": result.title,
                     "type": "track",
                     # Should be result.kind, but it will always be track, might change in the future
                     "link": result.permalink_url,
-                    "album": album_name,
                     "duration": result.full_duration,
                     "artist": result.user.username,
                     # Soundcloud doesn't give a list of artists, so we have to assume all the
@@ -136,6 +142,33 @@ def get_results(self, search_term: str, **kwargs) -> List[Dict[str, Any]]:
 
         return simplified_results
 
+    def get_albums(self, results: List[Dict[str, Any]]) -> None:
+        """
+        Fetch the album names of the results concurrently
+        and store them in the `album` key of the results.
+
+        ### Arguments
+        - results: The results returned by `get_results`.
+
+        ### Notes
+        - Results that already have an album (or no album) are skipped.
+        """
+
+        results = [result for result in results if "album" not in result]
+        if len(results) == 0:
+            return
+
+        def get_album(result: Dict[str, Any]) -> Optional[str]:
+            album = next(self.client.get_track_albums(result["id"]), None)
+
+            return album.title if album is not None else None
+
+        with concurrent.futures.ThreadPoolExecutor(
+            max_workers=min(len(results), ALBUM_LOOKUP_THREADS)
+        ) as executor:
+            for result, album_name in zip(results, executor.map(get_album, results)):
+                result["album"] = album_name
+
     def order_results(
         self, results: List[Dict[str, Any]], song: Song
     ) -> Dict[str, Any]:
@@ -153,23 +186,36 @@ def order_results(
         # Slugify some variables
         slug_song_name = slugify(song.name)
         slug_album_name = slugify(song.album_name)
+        slug_song_artist = slugify(song.artist)
 
-        # Assign an overall avg match value to each result
-        links_with_match_value = {}
+        # check for common words in result name,
+        # results that have no common words in their name are skipped
+        # before any of the expensive matching is done
+        sentence_words = slug_song_name.replace("-", " ").split(" ")
+        candidates = []
         for result in results:
-
             # Slugify result title
             slug_result_name = slugify(result["name"])
-
-            # check for common words in result name
-            sentence_words = slug_song_name.replace("-", " ").split(" ")
-            common_word = any(
-                word != "" and word in slug_result_name for word in sentence_words
-            )
-
-            # skip results that have no common words in their name
-            if not common_word:
-                continue
+            if any(word != "" and word in slug_result_name for word in sentence_words):
+                candidates.append((result, slug_result_name))
+
+        if len(candidates) == 0:
+            return {}
+
+        # Score all pairs at once
+        slug_result_names = [slug_result_name for _, slug_result_name in candidates]
+        artist_matches = match_percentages(
+            [slugify(artist) for artist in song.artists],
+            [slugify(result.get("artist") or "") for result, _ in candidates],
+        )
+        time_match_values = time_matches(
+            [result["duration"] for result, _ in candidates], song.duration
+        )
+
+        # Find the results that match the artist,
+        # albums are fetched only for them
+        matched = []
+        for index, (result, _) in enumerate(candidates):
 
             # Artist divide number
             artist_divide_number = 1
@@ -177,13 +223,10 @@ def order_results(
             # Find artist match
             artist_match_number = 0.0
             if result["type"] == "track":
-                for artist in song.artists:
-                    artist_match = match_percentage(
-                        slugify(artist), slugify(result["artist"])
-                    )
+                for artist_index in range(len(song.artists)):
+                    artist_match = artist_matches[artist_index][index]
                     if artist_match == 100:
-                        links_with_match_value[result["link"]] = artist_match
-                        return links_with_match_value
+                        return {result["link"]: artist_match}
                     artist_match_number += artist_match
 
                 # If we didn't find any artist match, we fallback to artist name match. Since
@@ -191,8 +234,7 @@ def order_results(
                 # if block very low
                 if artist_match_number <= 30:
                     channel_name_match = match_percentage(
-                        slugify(song.artist),
-                        slugify(result["name"]),
+                        slug_song_artist, slug_result_names[index]
                     )
                     if channel_name_match > artist_match_number:
                         artist_match_number = channel_name_match
@@ -204,6 +246,20 @@ def order_results(
             if artist_match < 70:
                 continue
 
+            matched.append((index, result, artist_match))
+
+        self.get_albums(
+            [result for _, result, _ in matched if result["type"] == "track"]
+        )
+
+        album_matches = match_percentages(
+            [slugify(result.get("album") or "") for _, result, _ in matched],
+            [slug_album_name],
+        )
+
+        # Assign an overall avg match value to each result
+        links_with_match_value = {}
+        for matched_index, (index, result, artist_match) in enumerate(matched):
             # Find album match
             album_match = 0.0
             album = None
@@ -211,13 +267,10 @@ def order_results(
             if result["type"] == "track":
                 album = result.get("album")
                 if album:
-                    album_match = match_percentage(slugify(album), slug_album_name)
+                    album_match = album_matches[matched_index][0]
 
             # Calculate time match
-            delta = result["duration"] - song.duration
-            non_match_value = (delta ** 2) / song.duration * 100
-
-            time_match = 100 - non_match_value
+            time_match = time_match_values[index]
 
             if result["type"] == "track":
                 if album is None:
@@ -2,15 +2,15 @@
 Youtube module for downloading and searching songs.
 """
 
-from typing import Any, Dict, List, Optional
+from typing import Any, Dict, List, Optional, Tuple
 
 from pytube import YouTube as PyTube, Search
-from slugify import slugify
 
 from spotdl.utils.formatter import create_song_title, create_search_query
-from spotdl.utils.providers import match_percentage
+from spotdl.utils.providers import match_percentage, match_percentages
 from spotdl.providers.audio.base import AudioProvider
 from spotdl.types import Song
+from spotdl.utils.normalize import slugify
 
 
 class YouTube(AudioProvider):
@@ -18,7 +18,7 @@ class YouTube(AudioProvider):
     YouTube audio provider class
     """
 
-    def search(self, song: Song) -> Optional[str]:
+    def search_with_score(self, song: Song) -> Tuple[Optional[str], Optional[float]]:
         """
         Search for a video on YouTube.
 
@@ -26,7 +26,8 @@ def search(self, song: Song) -> Optional[str]:
         - song: The song to search for.
 
         ### Returns
-        - The url of the best match or None if no match was found.
+        - tuple with the url of the best match and its score,
+            (None, None) if no match was found.
         """
 
         if self.search_query:
@@ -42,7 +43,7 @@ def search(self, song: Song) -> Optional[str]:
                     isrc_result = isrc_results[0]
 
                     if isrc_result and isrc_result.watch_url is not None:
-                        return isrc_result.watch_url
+                        return isrc_result.watch_url, 100
 
             search_query = create_song_title(song.name, song.artists).lower()
 
@@ -52,7 +53,7 @@ def search(self, song: Song) -> Optional[str]:
         results = self.get_results(search_query)
 
         if results is None:
-            return None
+            return None, None
 
         if self.filter_results:
             ordered_results = {results[0].watch_url: 100}
@@ -62,7 +63,7 @@ def search(self, song: Song) -> Optional[str]:
 
         # No matches found
         if len(ordered_results) == 0:
-            return None
+            return None, None
 
         result_items = list(ordered_results.items())
 
@@ -70,7 +71,7 @@ def search(self, song: Song) -> Optional[str]:
         sorted_results = sorted(result_items, key=lambda x: x[1], reverse=True)
 
         # Return the first result
-        return sorted_results[0][0]
+        return sorted_results[0]
 
     @staticmethod
     def get_results(
@@ -113,33 +114,36 @@ def order_results(self, results: List[PyTube], song: Song) -> Dict[str, Any]:
             else create_search_query(song, self.search_query, False, None, True)
         )
 
+        # Skip results without id and results that have no common words
+        # in their name before any of the expensive matching is done
+        sentence_words = slug_song_name.replace("-", " ").split(" ")
+        candidates = []
         for result in results:
-            # Skip results without id
             if result.video_id is None:
                 continue
 
-            # Slugify some variables
             slug_result_name = slugify(result.title)
-            sentence_words = slug_song_name.replace("-", " ").split(" ")
+            if any(word != "" and word in slug_result_name for word in sentence_words):
+                candidates.append((result, slug_result_name))
 
-            # Check for common words in result name
-            common_word = any(
-                word != "" and word in slug_result_name for word in sentence_words
-            )
+        if len(candidates) == 0:
+            return links_with_match_value
 
-            # skip results that have no common words in their name
-            if not common_word:
-                continue
+        # Score the artists of all results at once,
+        # the name is compared only for results matching the artist
+        artist_matches = match_percentages(
+            [slugify(artist) for artist in song.artists],
+            [slug_result_name for _, slug_result_name in candidates],
+        )
 
+        for index, (result, slug_result_name) in enumerate(candidates):
             # Find artist match
             artist_match_number = 0.0
 
             # Calculate artist match for each artist
             # in the song's artist list
-            for artist in song.artists:
-                artist_match_number += match_percentage(
-                    slugify(artist), slug_result_name
-                )
+            for artist_index in range(len(song.artists)):
+                artist_match_number += artist_matches[artist_index][index]
 
             # skip results with artist match lower than 70%
             artist_match = artist_match_number / len(song.artists)
@@ -2,12 +2,15 @@
 YTMusic module for downloading and searching songs.
 """
 
-from typing import Any, Dict, List, Optional
+from typing import Any, Dict, List, Optional, Tuple
 
 from ytmusicapi import YTMusic
-from slugify import slugify
 
-from spotdl.utils.providers import match_percentage
+from spotdl.utils.providers import (
+    match_percentage,
+    match_percentages,
+    time_matches,
+)
 from spotdl.providers.audio.base import AudioProvider, AudioProviderError
 from spotdl.types import Song
 from spotdl.utils.formatter import (
@@ -15,6 +18,8 @@
     parse_duration,
     create_search_query,
 )
+from spotdl.utils.http import get_session
+from spotdl.utils.normalize import slugify
 
 
 class YouTubeMusic(AudioProvider):
@@ -22,26 +27,25 @@ class YouTubeMusic(AudioProvider):
     YouTube Music audio provider class
     """
 
-    def __init__(self, *args: Any, **kwargs: Any) -> None:
+    def create_client(self) -> YTMusic:
         """
         Initialize the YouTube Music API
 
-        ### Arguments
-        - args: Arguments passed to the `AudioProvider` class.
-        - kwargs: Keyword arguments passed to the `AudioProvider` class.
-        """
+        ### Returns
+        - The YouTube Music API client.
 
-        super().__init__(*args, **kwargs)
-        self.client = YTMusic()
+        ### Errors
+        - AudioProviderError if the API can't be reached.
+        """
 
-        # Check if we are getting results from YouTube Music
-        test_results = self.get_results("a")
-        if len(test_results) == 0:
+        try:
+            return YTMusic(requests_session=get_session())
+        except Exception as exception:
             raise AudioProviderError(
                 "Could not connect to YouTube Music API. Use VPN or other audio provider."
-            )
+            ) from exception
 
-    def search(self, song: Song) -> Optional[str]:
+    def search_with_score(self, song: Song) -> Tuple[Optional[str], Optional[float]]:
         """
         Search for a song on YouTube Music.
 
@@ -49,7 +53,8 @@ def search(self, song: Song) -> Optional[str]:
         - song: The song to search for.
 
         ### Returns
-        - The url of the best match or None if no match was found.
+        - tuple with the url of the best match and its score,
+            (None, None) if no match was found.
         """
 
         if self.search_query:
@@ -79,7 +84,7 @@ def search(self, song: Song) -> Optional[str]:
                         and name_match > 90
                         and time_match > 90
                     ):
-                        return isrc_result["link"]
+                        return isrc_result["link"], 100
 
             search_query = create_song_title(song.name, song.artists).lower()
 
@@ -103,7 +108,7 @@ def search(self, song: Song) -> Optional[str]:
             best_result = max(songs, key=lambda k: songs[k])
 
             if songs[best_result] >= 80:
-                return best_result
+                return best_result, songs[best_result]
 
         # We didn't find the correct song on the first try so now we get video type results
         # add them to song_results, and get the result with highest score
@@ -122,7 +127,7 @@ def search(self, song: Song) -> Optional[str]:
 
         # No matches found
         if not results:
-            return None
+            return None, None
 
         result_items = list(results.items())
 
@@ -131,7 +136,7 @@ def search(self, song: Song) -> Optional[str]:
 
         # Get the result with highest score
         # and return the link
-        return sorted_results[0][0]
+        return sorted_results[0]
 
     def get_results(self, search_term: str, **kwargs) -> List[Dict[str, Any]]:
         """
@@ -190,64 +195,70 @@ def order_results(
             else create_search_query(song, self.search_query, False, None, True)
         )
 
-        # Assign an overall avg match value to each result
-        links_with_match_value = {}
+        # check for common words in result name,
+        # results that have no common words in their name are skipped
+        # before any of the expensive matching is done
+        sentence_words = slug_song_name.split("-")
+        candidates = []
         for result in results:
             # Slugify result title
             slug_result_name = slugify(result["name"])
-            slug_result_album = (
-                slugify(result["album"]) if result.get("album") else None
-            )
+            if any(word != "" and word in slug_result_name for word in sentence_words):
+                candidates.append((result, slug_result_name))
+
+        if len(candidates) == 0:
+            return {}
+
+        # Songs are matched by their artists, videos by their title
+        slug_result_artists = [slugify(result["artists"]) for result, _ in candidates]
+        artist_matches = match_percentages(
+            [slugify(artist) for artist in song.artists],
+            [
+                slug_result_artists[index]
+                if result["type"] == "song"
+                else slug_result_name
+                for index, (result, slug_result_name) in enumerate(candidates)
+            ],
+        )
 
-            # check for common words in result name
-            sentence_words = slug_song_name.split("-")
-            common_word = any(
-                word != "" and word in slug_result_name for word in sentence_words
+        # The channel name is only needed for videos without artist match
+        unmatched = [
+            index
+            for index, (result, _) in enumerate(candidates)
+            if result["type"] != "song"
+            and sum(row[index] for row in artist_matches) <= 50
+        ]
+        channel_name_matches = dict(
+            zip(
+                unmatched,
+                match_percentages(
+                    [slug_song_artist],
+                    [slug_result_artists[index] for index in unmatched],
+                )[0],
             )
+        )
 
-            # skip results that have no common words in their name
-            if not common_word:
-                continue
+        time_match_values = time_matches(
+            [result["duration"] for result, _ in candidates], song.duration
+        )
 
+        # Assign an overall avg match value to each result,
+        # the remaining scores are computed only for results matching the artist
+        links_with_match_value = {}
+        for index, (result, slug_result_name) in enumerate(candidates):
             # Artist divide number
             artist_divide_number = len(song.artists)
 
             # Find artist match
-            artist_match_number = 0.0
-            if result["type"] == "song":
-                # Artist results has only one artist
-                # So we fallback to matching the song title
-                # if len(result["artists"].split(",")) == 1:
-                #     for artist in song.artists:
-                #         artist_match_number += match_percentage(
-                #             slugify(artist), slug_result_name
-                #         )
-                # else:
-                #     for artist in song.artists:
-                #         artist_match_number += match_percentage(
-                #             slugify(artist), slugify(result["artists"])
-                #         )
-
-                for artist in song.artists:
-                    artist_match_number += match_percentage(
-                        slugify(artist), slugify(result["artists"])
-                    )
-            else:
-                for artist in song.artists:
-                    artist_match_number += match_percentage(
-                        slugify(artist), slug_result_name
-                    )
+            artist_match_number = sum(row[index] for row in artist_matches)
 
-                # If we didn't find any artist match,
-                # we fallback to channel name match
-                if artist_match_number <= 50:
-                    channel_name_match = match_percentage(
-                        slugify(song.artist),
-                        slugify(result["artists"]),
-                    )
-                    if channel_name_match > artist_match_number:
-                        artist_match_number = channel_name_match
-                        artist_divide_number = 1
+            # If we didn't find any artist match,
+            # we fallback to channel name match
+            if index in channel_name_matches:
+                channel_name_match = channel_name_matches[index]
+                if channel_name_match > artist_match_number:
+                    artist_match_number = channel_name_match
+                    artist_divide_number = 1
 
             # skip results with artist match lower than 70%
             artist_match = artist_match_number / artist_divide_number
@@ -274,6 +285,10 @@ def order_results(
             if name_match < 50:
                 continue
 
+            slug_result_album = (
+                slugify(result["album"]) if result.get("album") else None
+            )
+
             # Find album match
             album_match = 0.0
 
@@ -283,18 +298,15 @@ def order_results(
                     album_match = match_percentage(slug_result_album, slug_album_name)
 
             # Calculate time match
-            delta = result["duration"] - song.duration
-            non_match_value = (delta**2) / song.duration * 100
-
-            time_match = 100 - non_match_value
+            time_match = time_match_values[index]
 
             average_match = (artist_match + name_match + time_match) / 3
 
             if (
                 result["type"] == "song"
+                and slug_result_album == slug_album_name
                 and slug_result_album
                 and match_percentage(slug_album_name, slug_result_name) > 95
-                and slug_result_album == slug_album_name
             ):
                 # If the result album name is similar to the song album name
                 # and the result album name is the same as the song album name
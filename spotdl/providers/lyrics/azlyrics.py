@@ -6,8 +6,6 @@
 
 from bs4 import BeautifulSoup
 
-import requests
-
 from spotdl.providers.lyrics.base import LyricsProvider
 
 
@@ -26,6 +24,9 @@ def get_lyrics(self, name: str, artists: List[str], **_) -> Optional[str]:
 
         ### Returns
         - The lyrics of the song or None if no lyrics were found.
+
+        ### Errors
+        - RequestException if a request failed.
         """
 
         # Join every artist by comma in artists
@@ -37,7 +38,8 @@ def get_lyrics(self, name: str, artists: List[str], **_) -> Optional[str]:
 
         url = f"https://search.azlyrics.com/search.php?q={song_name}+{artists}"
 
-        response = requests.get(url, headers=self.headers)
+        response = self.session.get(url, headers=self.headers, timeout=self.timeout)
+        response.raise_for_status()
         soup = BeautifulSoup(response.content, "html.parser")
 
         td_tags = soup.find_all("td")
@@ -55,7 +57,10 @@ def get_lyrics(self, name: str, artists: List[str], **_) -> Optional[str]:
         if lyrics_url.strip() == "":
             return None
 
-        response = requests.get(lyrics_url, headers=self.headers)
+        response = self.session.get(
+            lyrics_url, headers=self.headers, timeout=self.timeout
+        )
+        response.raise_for_status()
         soup = BeautifulSoup(response.content, "html.parser")
 
         # Find all divs that don't have a class
@@ -4,17 +4,28 @@
 
 from typing import List, Optional
 
+from spotdl.utils.http import get_session
+
+# Timeout of every request made by the lyrics providers in seconds
+LYRICS_TIMEOUT = 10
+
 
 class LyricsProvider:
     """
     Base class for all other lyrics providers.
     """
 
-    def __init__(self):
+    def __init__(self, timeout: float = LYRICS_TIMEOUT):
         """
         Init the lyrics provider searchand set headers.
+
+        ### Arguments
+        - timeout: Timeout of every request in seconds.
         """
 
+        self.timeout = timeout
+        self.session = get_session()
+
         self.headers = {
             "Connection": "keep-alive",
             "Pragma": "no-cache",
@@ -40,6 +51,10 @@ def get_lyrics(self, name: str, artists: List[str], **kwargs) -> Optional[str]:
 
         ### Returns
         - The lyrics of the song or None if no lyrics were found.
+
+        ### Errors
+        - RequestException if a request failed, so that a missing answer
+            isn't mistaken for missing lyrics.
         """
 
         raise NotImplementedError
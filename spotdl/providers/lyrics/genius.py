@@ -4,9 +4,8 @@
 
 from typing import List, Optional
 
-import requests
-
 from bs4 import BeautifulSoup
+from requests import RequestException
 
 from spotdl.providers.lyrics.base import LyricsProvider
 
@@ -26,6 +25,9 @@ def get_lyrics(self, name: str, artists: List[str], **_) -> Optional[str]:
 
         ### Returns
         - The lyrics of the song or None if no lyrics were found.
+
+        ### Errors
+        - RequestException if a request failed.
         """
 
         try:
@@ -40,24 +42,31 @@ def get_lyrics(self, name: str, artists: List[str], **_) -> Optional[str]:
                 artist for artist in artists if artist.lower() not in name.lower()
             )
 
-            search_response = requests.get(
+            search_response = self.session.get(
                 "https://api.genius.com/search",
                 params={"q": f"{name} {artist_str}"},
                 headers=headers,
+                timeout=self.timeout,
             )
+            search_response.raise_for_status()
 
             song_id = search_response.json()["response"]["hits"][0]["result"]["id"]
 
-            song_response = requests.get(
-                f"https://api.genius.com/songs/{song_id}", headers=headers
+            song_response = self.session.get(
+                f"https://api.genius.com/songs/{song_id}",
+                headers=headers,
+                timeout=self.timeout,
             )
+            song_response.raise_for_status()
 
             song_url = song_response.json()["response"]["song"]["url"]
 
             counter = 0
             soup = None
             while counter > 5:
-                genius_page_response = requests.get(song_url, headers=self.headers)
+                genius_page_response = self.session.get(
+                    song_url, headers=self.headers, timeout=self.timeout
+                )
 
                 if not genius_page_response.ok:
                     counter += 1
@@ -79,5 +88,8 @@ def get_lyrics(self, name: str, artists: List[str], **_) -> Optional[str]:
             lyrics_containers = soup.select("div[class^=Lyrics__Container]")
             lyrics = "\n".join(con.get_text() for con in lyrics_containers)
             return lyrics.strip()
+        except RequestException:
+            # Network errors are raised, the lyrics might be found on the next try
+            raise
         except Exception:
             return None
@@ -5,9 +5,8 @@
 from typing import List, Optional
 from urllib.parse import quote
 
-import requests
-
 from bs4 import BeautifulSoup
+from requests import RequestException
 
 from spotdl.providers.lyrics.base import LyricsProvider
 
@@ -28,6 +27,9 @@ def get_lyrics(self, name: str, artists: List[str], **kwargs) -> Optional[str]:
 
         ### Returns
         - The lyrics of the song or None if no lyrics were found.
+
+        ### Errors
+        - RequestException if a request failed.
         """
 
         try:
@@ -46,7 +48,10 @@ def get_lyrics(self, name: str, artists: List[str], **kwargs) -> Optional[str]:
                 query += "/tracks"
 
             search_url = f"https://www.musixmatch.com/search/{query}"
-            search_resp = requests.get(search_url, headers=self.headers)
+            search_resp = self.session.get(
+                search_url, headers=self.headers, timeout=self.timeout
+            )
+            search_resp.raise_for_status()
 
             search_soup = BeautifulSoup(search_resp.text, "html.parser")
             song_url_tag = search_soup.select_one("a[href^='/lyrics/']")
@@ -63,12 +68,18 @@ def get_lyrics(self, name: str, artists: List[str], **kwargs) -> Optional[str]:
                 return lyrics
 
             song_url = "https://www.musixmatch.com" + str(song_url_tag.get("href", ""))
-            lyrics_resp = requests.get(song_url, headers=self.headers)
+            lyrics_resp = self.session.get(
+                song_url, headers=self.headers, timeout=self.timeout
+            )
+            lyrics_resp.raise_for_status()
 
             lyrics_soup = BeautifulSoup(lyrics_resp.text, "html.parser")
             lyrics_paragraphs = lyrics_soup.select("p.mxm-lyrics__content")
             lyrics = "\n".join(i.get_text() for i in lyrics_paragraphs)
 
             return lyrics
+        except RequestException:
+            # Network errors are raised, the lyrics might be found on the next try
+            raise
         except Exception:
             return None
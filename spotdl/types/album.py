@@ -5,7 +5,7 @@
 from dataclasses import dataclass
 from typing import Any, Dict, List
 from spotdl.types.song import SongList
-from spotdl.utils.spotify import SpotifyClient
+from spotdl.utils.spotify import SpotifyClient, SpotifyError
 from spotdl.types.song import Song
 
 
@@ -41,7 +41,7 @@ def from_url(cls, url: str) -> "Album":
 
         # Remove songs without id (country restricted/local tracks)
         # And create song object for each track
-        songs: List[Song] = [Song.from_url(url) for url in urls]
+        songs: List[Song] = Song.list_from_urls(urls)
 
         return cls(
             **metadata,
@@ -69,20 +69,11 @@ def get_urls(url: str) -> List[str]:
                 "Couldn't get metadata, check if you have passed correct album id"
             )
 
-        tracks = album_response["items"]
-
         # Get all tracks from album
-        while album_response["next"]:
-            album_response = spotify_client.next(album_response)
-
-            # Failed to get response, break the loop
-            if album_response is None:
-                break
-
-            tracks.extend(album_response["items"])
-
-        if album_response is None:
-            raise AlbumError(f"Failed to get album response: {url}")
+        try:
+            tracks = spotify_client.get_all_items(album_response)
+        except SpotifyError as exception:
+            raise AlbumError(f"Failed to get album response: {url}") from exception
 
         return [
             track["external_urls"]["spotify"]
@@ -5,12 +5,11 @@
 from dataclasses import dataclass
 from typing import Any, Dict, List, Set
 
-from slugify import slugify
-
 from spotdl.types.song import SongList
 from spotdl.types.song import Song
 from spotdl.types.album import Album
 from spotdl.utils.spotify import SpotifyClient
+from spotdl.utils.normalize import slugify
 
 
 class ArtistError(Exception):
@@ -131,7 +130,9 @@ def get_albums(url: str) -> List[str]:
         # query spotify for artist details
         spotify_client = SpotifyClient()
 
-        artist_albums = spotify_client.artist_albums(url, album_type="album,single")
+        artist_albums = spotify_client.artist_albums(
+            url, album_type="album,single", limit=50
+        )
 
         albums: List[str] = []
 
@@ -140,23 +141,12 @@ def get_albums(url: str) -> List[str]:
         # different countries
         known_albums: Set[str] = set()
         if artist_albums is not None:
-            for album in artist_albums["items"]:
-                albums.append(album["external_urls"]["spotify"])
-                known_albums.add(slugify(album["name"]))  # type: ignore
-
-            # Fetch all artist albums
-            while artist_albums and artist_albums["next"]:
-                artist_albums = spotify_client.next(artist_albums)
-                if artist_albums is None:
-                    break
-
-                for album in artist_albums["items"]:
-                    album_name = slugify(album["name"])  # type: ignore
-
-                    if album_name in known_albums:
-                        albums.extend([item["uri"] for item in artist_albums["items"]])
+            for album in spotify_client.get_all_items(artist_albums):
+                album_name = slugify(album["name"])  # type: ignore
 
-                        known_albums.add(album_name)
+                if album_name not in known_albums:
+                    albums.append(album["external_urls"]["spotify"])
+                    known_albums.add(album_name)
 
         return albums
 
@@ -40,17 +40,17 @@ def from_url(cls, url: str) -> "Playlist":
 
         metadata = Playlist.get_metadata(url)
 
-        # Get urls
-        urls = cls.get_urls(url)
+        # Get track objects, the playlist response already
+        # contains full track objects, so we don't have to refetch them
+        raw_tracks = cls.get_tracks(url)
 
-        # Remove songs without id (country restricted/local tracks)
-        # And create song object for each track
-        tracks = [Song.from_url(url) for url in urls]
+        # Create song object for each track
+        tracks = Song.list_from_tracks(raw_tracks)  # type: ignore
 
         return cls(
             **metadata,
             songs=tracks,
-            urls=urls,
+            urls=[track["external_urls"]["spotify"] for track in raw_tracks],
         )
 
     @staticmethod
@@ -65,34 +65,60 @@ def get_urls(url: str) -> List[str]:
         - A list of urls.
         """
 
+        return [track["external_urls"]["spotify"] for track in Playlist.get_tracks(url)]
+
+    @staticmethod
+    def get_tracks(url: str) -> List[Dict[str, Any]]:
+        """
+        Get track objects of all tracks in a playlist.
+
+        ### Arguments
+        - url: The URL of the playlist.
+
+        ### Returns
+        - A list of track objects.
+        """
+
         spotify_client = SpotifyClient()
-        tracks = []
 
         playlist_response = spotify_client.playlist_items(url)
         if playlist_response is None:
             raise PlaylistError(f"Wrong playlist id: {url}")
 
-        tracks = playlist_response["items"]
-
         # Get all tracks from playlist
-        while playlist_response["next"]:
-            playlist_response = spotify_client.next(playlist_response)
-
-            # Failed to get response, break the loop
-            if playlist_response is None:
-                break
-
-            # Add tracks to the list
-            tracks.extend(playlist_response["items"])
+        tracks = spotify_client.get_all_items(playlist_response)
 
+        # Remove songs without id (country restricted/local tracks)
+        # and episodes
         return [
-            track["track"]["external_urls"]["spotify"]
+            track["track"]
             for track in tracks
             if track is not None
             and track.get("track") is not None
-            and track.get("track").get("id")
+            and track["track"].get("id")
+            and track["track"].get("type", "track") == "track"
         ]
 
+    @staticmethod
+    def get_snapshot_id(url: str) -> str:
+        """
+        Get the snapshot id of a playlist, it changes when the playlist is modified.
+
+        ### Arguments
+        - url: The URL of the playlist.
+
+        ### Returns
+        - The snapshot id.
+        """
+
+        spotify_client = SpotifyClient()
+
+        playlist = spotify_client.playlist(url, fields="snapshot_id")
+        if playlist is None:
+            raise PlaylistError("Invalid playlist URL.")
+
+        return playlist["snapshot_id"]
+
     @staticmethod
     def get_metadata(url: str) -> Dict[str, Any]:
         """
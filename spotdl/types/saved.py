@@ -30,16 +30,18 @@ def from_url(cls, url: str = "saved") -> "Saved":
 
         metadata = Saved.get_metadata(url)
 
-        urls = cls.get_urls(url)
+        # Saved tracks response already contains full track objects
+        raw_tracks = cls.get_tracks(url)
 
-        # Remove songs without id
-        # and create Song objects
-        tracks = [Song.from_url(url) for url in urls]
+        # Create Song objects
+        tracks = Song.list_from_tracks(raw_tracks)  # type: ignore
 
         return cls(
             **metadata,
             songs=tracks,
-            urls=urls,
+            urls=[
+                "https://open.spotify.com/track/" + track["id"] for track in raw_tracks
+            ],
         )
 
     @staticmethod
@@ -54,30 +56,37 @@ def get_urls(_: str = "saved") -> List[str]:
         - A list of urls.
         """
 
+        return [
+            "https://open.spotify.com/track/" + track["id"]
+            for track in Saved.get_tracks()
+        ]
+
+    @staticmethod
+    def get_tracks(_: str = "saved") -> List[Dict[str, Any]]:
+        """
+        Returns a list of track objects of all saved tracks.
+
+        ### Arguments
+        - _: not required, but used to match the signature of the other get_tracks methods.
+
+        ### Returns
+        - A list of track objects.
+        """
+
         spotify_client = SpotifyClient()
         if spotify_client.user_auth is False:  # type: ignore
             raise SavedError("You must be logged in to use this function.")
 
-        saved_tracks_response = spotify_client.current_user_saved_tracks()
+        saved_tracks_response = spotify_client.current_user_saved_tracks(limit=50)
         if saved_tracks_response is None:
             raise Exception("Couldn't get saved tracks")
 
-        saved_tracks = saved_tracks_response["items"]
-
         # Fetch all saved tracks
-        while saved_tracks_response and saved_tracks_response["next"]:
-            response = spotify_client.next(saved_tracks_response)
-            # response is wrong, break
-            if response is None:
-                break
-
-            saved_tracks_response = response
-            saved_tracks.extend(saved_tracks_response["items"])
+        saved_tracks = spotify_client.get_all_items(saved_tracks_response)
 
         # Remove songs without id
-        # and return urls
         return [
-            "https://open.spotify.com/track/" + track["track"]["id"]
+            track["track"]
             for track in saved_tracks
             if track and track.get("track", {}).get("id")
         ]
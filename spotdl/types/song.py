@@ -3,12 +3,33 @@
 """
 
 import json
+import sys
+import concurrent.futures
 
-from dataclasses import dataclass, asdict
-from typing import Dict, Any, List, Optional
+from dataclasses import dataclass, fields
+from typing import Callable, Dict, Any, List, Optional, Type, TypeVar, Union
 
 from spotdl.utils.spotify import SpotifyClient
 
+# Maximum number of IDs accepted by the spotify multi-ID endpoints
+TRACKS_BATCH_SIZE = 50
+ALBUMS_BATCH_SIZE = 20
+ARTISTS_BATCH_SIZE = 50
+
+# Song fields that are usually shared by many songs (same album or artist),
+# their values are interned so that every value is stored only once
+SHARED_FIELDS = (
+    "artist",
+    "album_name",
+    "album_artist",
+    "date",
+    "cover_url",
+    "publisher",
+    "copyright_text",
+)
+
+T = TypeVar("T")
+
 
 class SongError(Exception):
     """
@@ -16,6 +37,39 @@ class SongError(Exception):
     """
 
 
+def slotted(cls: Type[T]) -> Type[T]:
+    """
+    Recreate a dataclass with `__slots__`, so its instances don't have a `__dict__`.
+
+    ### Arguments
+    - cls: The dataclass.
+
+    ### Returns
+    - The slotted class.
+
+    ### Notes
+    - Same as `dataclass(slots=True)`, which is only available on Python 3.10+.
+    """
+
+    field_names = tuple(field.name for field in fields(cls))
+    cls_dict = dict(cls.__dict__)
+    cls_dict["__slots__"] = field_names
+
+    # Defaults are class attributes, they would conflict with the slots,
+    # the generated __init__ keeps its own copy of them
+    for field_name in field_names:
+        cls_dict.pop(field_name, None)
+
+    cls_dict.pop("__dict__", None)
+    cls_dict.pop("__weakref__", None)
+
+    slotted_cls = type(cls)(cls.__name__, cls.__bases__, cls_dict)
+    slotted_cls.__qualname__ = cls.__qualname__
+
+    return slotted_cls
+
+
+@slotted
 @dataclass()
 class Song:
     """
@@ -45,6 +99,22 @@ class Song:
     download_url: Optional[str] = None
     song_list: Optional["SongList"] = None
 
+    def __post_init__(self) -> None:
+        """
+        Intern the values shared between songs.
+        """
+
+        for field_name in SHARED_FIELDS:
+            value = getattr(self, field_name)
+            if isinstance(value, str):
+                setattr(self, field_name, sys.intern(value))
+
+        if isinstance(self.artists, list):
+            self.artists = [sys.intern(artist) for artist in self.artists]
+
+        if isinstance(self.genres, list):
+            self.genres = [sys.intern(genre) for genre in self.genres]
+
     @classmethod
     def from_url(cls, url: str) -> "Song":
         """
@@ -79,6 +149,123 @@ def from_url(cls, url: str) -> "Song":
         album_id = raw_track_meta["album"]["id"]
         raw_album_meta: Dict[str, Any] = spotify_client.album(album_id)  # type: ignore
 
+        return cls.from_raw_metadata(raw_track_meta, raw_album_meta, raw_artist_meta)
+
+    @classmethod
+    def list_from_urls(cls, urls: List[str], threads: int = 1) -> List["Song"]:
+        """
+        Creates a list of Song objects from a list of URLs.
+
+        ### Arguments
+        - urls: The URLs of the songs.
+        - threads: The number of batches to fetch at the same time.
+
+        ### Returns
+        - The list of Song objects, in the same order as the URLs.
+
+        ### Notes
+        - Tracks that are no longer available on spotify are skipped.
+        """
+
+        for url in urls:
+            if "open.spotify.com" not in url or "track" not in url:
+                raise SongError(f"Invalid URL: {url}")
+
+        return cls.list_from_tracks(urls, threads)  # type: ignore
+
+    @classmethod
+    def list_from_tracks(
+        cls, tracks: List[Union[str, Dict[str, Any]]], threads: int = 1
+    ) -> List["Song"]:
+        """
+        Creates a list of Song objects from spotify track objects
+        (e.g. from playlist or search responses) or track URLs.
+        Only the data that is still missing is fetched, in batches using
+        the multi-ID endpoints. Albums and artists are deduplicated.
+
+        ### Arguments
+        - tracks: Full track objects or URLs/IDs of tracks to fetch.
+        - threads: The number of batches to fetch at the same time.
+
+        ### Returns
+        - The list of Song objects, in the same order as the tracks.
+
+        ### Notes
+        - Tracks that are no longer available on spotify are skipped.
+        """
+
+        spotify_client = SpotifyClient()
+
+        # get track info for the tracks that were passed as urls
+        urls = [track for track in tracks if isinstance(track, str)]
+        fetched_tracks = iter(
+            _fetch_in_batches(
+                lambda ids: spotify_client.tracks(ids)["tracks"],  # type: ignore
+                urls,
+                TRACKS_BATCH_SIZE,
+                threads,
+            )
+        )
+        raw_tracks: List[Dict[str, Any]] = [
+            track
+            for track in (
+                next(fetched_tracks) if isinstance(track, str) else track
+                for track in tracks
+            )
+            if track
+        ]
+
+        # get album info, each album is fetched only once
+        album_ids = list(dict.fromkeys(track["album"]["id"] for track in raw_tracks))
+        raw_albums = _fetch_in_batches(
+            lambda ids: spotify_client.albums(ids)["albums"],  # type: ignore
+            album_ids,
+            ALBUMS_BATCH_SIZE,
+            threads,
+        )
+        albums = {album["id"]: album for album in raw_albums if album}
+
+        # get info about primary artists, each artist is fetched only once
+        artist_ids = list(
+            dict.fromkeys(track["artists"][0]["id"] for track in raw_tracks)
+        )
+        raw_artists = _fetch_in_batches(
+            lambda ids: spotify_client.artists(ids)["artists"],  # type: ignore
+            artist_ids,
+            ARTISTS_BATCH_SIZE,
+            threads,
+        )
+        artists = {artist["id"]: artist for artist in raw_artists if artist}
+
+        return [
+            cls.from_raw_metadata(
+                track,
+                albums[track["album"]["id"]],
+                artists[track["artists"][0]["id"]],
+            )
+            for track in raw_tracks
+            if track["album"]["id"] in albums and track["artists"][0]["id"] in artists
+        ]
+
+    @classmethod
+    def from_raw_metadata(
+        cls,
+        raw_track_meta: Dict[str, Any],
+        raw_album_meta: Dict[str, Any],
+        raw_artist_meta: Dict[str, Any],
+    ) -> "Song":
+        """
+        Creates a Song object from raw spotify metadata.
+
+        ### Arguments
+        - raw_track_meta: The track object returned by spotify.
+        - raw_album_meta: The full album object of the track.
+        - raw_artist_meta: The full artist object of the primary artist.
+
+        ### Returns
+        - The Song object.
+        """
+
         # create song object
         return cls(
             name=raw_track_meta["name"],
@@ -126,10 +313,16 @@ def from_search_term(cls, search_term: str) -> "Song":
         ):
             raise SongError("No songs matches found on spotify")
 
-        return Song.from_url(
-            "http://open.spotify.com/track/"
-            + raw_search_results["tracks"]["items"][0]["id"]
-        )
+        # search results contain full track objects, so they don't have to be refetched
+        songs = Song.list_from_tracks(raw_search_results["tracks"]["items"][:1])
+
+        # The track is dropped if its album or artist couldn't be fetched
+        if len(songs) == 0:
+            raise SongError(
+                "Couldn't get metadata, the album or artist of the song is not available"
+            )
+
+        return songs[0]
 
     @classmethod
     def from_data_dump(cls, data: str) -> "Song":
@@ -147,22 +340,34 @@ def from_data_dump(cls, data: str) -> "Song":
         data_dict = json.loads(data)
 
         # Return product object
-        return cls(**data_dict)
+        return cls.from_dict(data_dict)
 
     @classmethod
-    def from_dict(cls, data: Dict[str, Any]) -> "Song":
+    def from_dict(
+        cls, data: Dict[str, Any], song_lists: Optional[Dict[str, "SongList"]] = None
+    ) -> "Song":
         """
         Create a Song object from a dictionary.
 
         ### Arguments
         - data: The dictionary.
+        - song_lists: Song lists by url, used to resolve the song list reference.
 
         ### Returns
         - The Song object.
+
+        ### Notes
+        - `song_list` can be a song list, its url (see `Song.json`) or a dictionary
+            (older save files), song lists that can't be resolved are dropped.
         """
 
+        song_list = data.get("song_list")
+        if song_list is not None and not isinstance(song_list, SongList):
+            url = song_list.get("url") if isinstance(song_list, dict) else song_list
+            song_list = song_lists.get(url) if song_lists else None
+
         # Return product object
-        return cls(**data)
+        return cls(**{**data, "song_list": song_list})
 
     @property
     def display_name(self) -> str:
@@ -182,9 +387,48 @@ def json(self) -> Dict[str, Any]:
 
         ### Returns
         - The dictionary.
+
+        ### Notes
+        - The values are not copied, so the dictionary must not be modified.
+        - The song list is referenced by its url.
         """
 
-        return asdict(self)
+        data = {field.name: getattr(self, field.name) for field in fields(self)}
+        if self.song_list is not None:
+            data["song_list"] = self.song_list.url
+
+        return data
+
+
+def _fetch_in_batches(
+    fetch_many: Callable[[List[str]], List[Optional[Dict[str, Any]]]],
+    ids: List[str],
+    batch_size: int,
+    threads: int = 1,
+) -> List[Optional[Dict[str, Any]]]:
+    """
+    Fetch items from a spotify multi-ID endpoint in batches.
+
+    ### Arguments
+    - fetch_many: Function that fetches a batch of items.
+    - ids: The IDs (or URLs) of the items.
+    - batch_size: The maximum number of IDs per request.
+    - threads: The number of batches to fetch at the same time.
+
+    ### Returns
+    - The list of items (or None for unknown IDs) in the same order as `ids`.
+    """
+
+    batches = [
+        ids[index : index + batch_size] for index in range(0, len(ids), batch_size)
+    ]
+
+    items: List[Optional[Dict[str, Any]]] = []
+    with concurrent.futures.ThreadPoolExecutor(max_workers=max(threads, 1)) as executor:
+        for batch_items in executor.map(fetch_many, batches):
+            items.extend(batch_items)
+
+    return items
 
 
 @dataclass(frozen=True)
@@ -150,6 +150,28 @@ def parse_main_options(parser: _ArgumentGroup):
         help="Disable filtering results.",
     )
 
+    # Add no search cache argument
+    parser.add_argument(
+        "--no-search-cache",
+        action="store_true",
+        default=DEFAULT_CONFIG["no_search_cache"],
+        help=(
+            "Don't use the cached audio provider search results, "
+            "query the providers again. Also applies to the lyrics cache."
+        ),
+    )
+
+    # Add purge search cache argument
+    parser.add_argument(
+        "--purge-search-cache",
+        action="store_true",
+        default=DEFAULT_CONFIG["purge_search_cache"],
+        help=(
+            "Remove all cached audio provider search results before downloading. "
+            "Also clears the lyrics cache."
+        ),
+    )
+
 
 def parse_spotify_options(parser: _ArgumentGroup):
     """
@@ -227,6 +249,40 @@ def parse_ffmpeg_options(parser: _ArgumentGroup):
         type=int,
         help="The number of threads to use when downloading songs.",
     )
+
+    # Add search threads argument
+    parser.add_argument(
+        "--search-threads",
+        default=DEFAULT_CONFIG["search_threads"],
+        type=int,
+        help=(
+            "The number of threads to use when resolving metadata and searching "
+            "for songs. Defaults to --threads."
+        ),
+    )
+
+    # Add download threads argument
+    parser.add_argument(
+        "--download-threads",
+        default=DEFAULT_CONFIG["download_threads"],
+        type=int,
+        help=(
+            "The number of threads to use when fetching streams and tagging songs. "
+            "Defaults to --threads."
+        ),
+    )
+
+    # Add transcode workers argument
+    parser.add_argument(
+        "--transcode-workers",
+        default=DEFAULT_CONFIG["transcode_workers"],
+        type=int,
+        help=(
+            "The number of ffmpeg processes to run at the same time. "
+            "Defaults to the number of CPU cores."
+        ),
+    )
+
     # Add constant bit rate argument
     parser.add_argument(
         "--bitrate",
@@ -285,7 +341,7 @@ def parse_output_options(parser: _ArgumentGroup):
         default=DEFAULT_CONFIG["save_file"],
         help=(
             "The file to save/load the songs data from/to. "
-            "It has to end with .spotdl. "
+            "It has to end with .spotdl (.spotdl.gz or .spotdl.zst to compress it). "
             "If combined with the download operation, it will save the songs data to the file. "
             "Required for save/preload/sync"
         ),
@@ -340,6 +396,29 @@ def parse_output_options(parser: _ArgumentGroup):
         action="store_true",
     )
 
+    # Add cover size argument
+    parser.add_argument(
+        "--cover-size",
+        default=DEFAULT_CONFIG["cover_size"],
+        type=int,
+        help=(
+            "Resize the embedded covers to this size in pixels (requires Pillow). "
+            "Original covers are used by default."
+        ),
+    )
+
+    # Add journal argument
+    parser.add_argument(
+        "--journal",
+        type=str,
+        default=DEFAULT_CONFIG["journal"],
+        help=(
+            "File to record the progress of every song in. "
+            "An interrupted download started with the same journal resumes "
+            "without searching or converting the finished songs again."
+        ),
+    )
+
 
 def parse_misc_options(parser: _ArgumentGroup):
     """
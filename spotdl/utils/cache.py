@@ -0,0 +1,207 @@
+"""
+Module for persistent, TTL-aware key/value caches stored in SQLite databases.
+
+    >>> cache = PersistentCache(get_metadata_cache_path(), "tracks", ttl=3600)
+    >>> cache.set("track:1t2qKa8K72IBC8yQlhD9bU", {"name": "Ropes"})
+    >>> cache.get("track:1t2qKa8K72IBC8yQlhD9bU")
+"""
+
+import json
+import re
+import sqlite3
+import threading
+import time
+import zlib
+
+from pathlib import Path
+from typing import Any, Dict, Iterable, List, Optional
+
+
+class CacheError(Exception):
+    """
+    Base class for all exceptions related to caches.
+    """
+
+
+# SQLite limits the number of host parameters in a single statement
+MAX_QUERY_PARAMETERS = 500
+
+
+class PersistentCache:
+    """
+    Thread-safe key/value cache stored in a SQLite table.
+    Values are serialized to JSON and expire after `ttl` seconds.
+    """
+
+    def __init__(
+        self,
+        path: Path,
+        table: str = "cache",
+        ttl: Optional[int] = None,
+        compress: bool = False,
+    ) -> None:
+        """
+        Open (or create) the cache database.
+
+        ### Arguments
+        - path: Path to the SQLite database file.
+        - table: Name of the table to store the entries in.
+        - ttl: Default time to live of the entries in seconds, None means no expiry.
+        - compress: Whether to store the values compressed with zlib.
+
+        ### Notes
+        - Compressed and uncompressed values can be read from the same table.
+
+        ### Errors
+        - CacheError if the table name is not a valid identifier.
+        """
+
+        if re.fullmatch(r"[A-Za-z_][A-Za-z0-9_]*", table) is None:
+            raise CacheError(f"Invalid cache table name: {table}")
+
+        self.path = path
+        self.table = table
+        self.ttl = ttl
+        self.compress = compress
+        self.lock = threading.Lock()
+
+        self.connection = sqlite3.connect(
+            str(path), check_same_thread=False, timeout=30
+        )
+
+        with self.lock, self.connection:
+            # WAL allows readers from other processes while we are writing
+            self.connection.execute("PRAGMA journal_mode=WAL")
+            self.connection.execute(
+                f"CREATE TABLE IF NOT EXISTS {self.table} ("
+                "key TEXT PRIMARY KEY, value TEXT NOT NULL, expires REAL)"
+            )
+
+    def get(self, key: str) -> Optional[Any]:
+        """
+        Get a value from the cache.
+
+        ### Arguments
+        - key: The key of the entry.
+
+        ### Returns
+        - The cached value or None if the entry is missing or expired.
+        """
+
+        return self.get_many([key]).get(key)
+
+    def get_many(self, keys: Iterable[str]) -> Dict[str, Any]:
+        """
+        Get multiple values from the cache.
+
+        ### Arguments
+        - keys: The keys of the entries.
+
+        ### Returns
+        - Dictionary with the keys that were found and not expired.
+        """
+
+        keys = list(keys)
+        now = time.time()
+        results: Dict[str, Any] = {}
+
+        with self.lock:
+            for index in range(0, len(keys), MAX_QUERY_PARAMETERS):
+                chunk = keys[index : index + MAX_QUERY_PARAMETERS]
+                rows = self.connection.execute(
+                    f"SELECT key, value FROM {self.table} "
+                    f"WHERE key IN ({', '.join('?' * len(chunk))}) "
+                    "AND (expires IS NULL OR expires > ?)",
+                    [*chunk, now],
+                ).fetchall()
+
+                for key, value in rows:
+                    if isinstance(value, bytes):
+                        value = zlib.decompress(value).decode("utf-8")
+
+                    results[key] = json.loads(value)
+
+        return results
+
+    def set(self, key: str, value: Any, ttl: Optional[int] = None) -> None:
+        """
+        Store a value in the cache.
+
+        ### Arguments
+        - key: The key of the entry.
+        - value: JSON serializable value to store.
+        - ttl: Time to live in seconds, defaults to the cache ttl.
+        """
+
+        self.set_many({key: value}, ttl)
+
+    def set_many(self, items: Dict[str, Any], ttl: Optional[int] = None) -> None:
+        """
+        Store multiple values in the cache in a single transaction.
+
+        ### Arguments
+        - items: Dictionary of keys and JSON serializable values.
+        - ttl: Time to live in seconds, defaults to the cache ttl.
+        """
+
+        ttl = self.ttl if ttl is None else ttl
+        expires = None if ttl is None else time.time() + ttl
+
+        rows: List[tuple] = []
+        for key, value in items.items():
+            data: Any = json.dumps(value, ensure_ascii=False)
+            if self.compress:
+                # Stored as a BLOB, which tells `get_many` to decompress it
+                data = zlib.compress(data.encode("utf-8"))
+
+            rows.append((key, data, expires))
+
+        with self.lock, self.connection:
+            self.connection.executemany(
+                f"INSERT OR REPLACE INTO {self.table} (key, value, expires) "
+                "VALUES (?, ?, ?)",
+                rows,
+            )
+
+    def delete(self, key: str) -> None:
+        """
+        Remove an entry from the cache.
+
+        ### Arguments
+        - key: The key of the entry.
+        """
+
+        with self.lock, self.connection:
+            self.connection.execute(f"DELETE FROM {self.table} WHERE key = ?", (key,))
+
+    def purge_expired(self) -> int:
+        """
+        Remove all expired entries from the cache.
+
+        ### Returns
+        - The number of removed entries.
+        """
+
+        with self.lock, self.connection:
+            cursor = self.connection.execute(
+                f"DELETE FROM {self.table} WHERE expires IS NOT NULL AND expires <= ?",
+                (time.time(),),
+            )
+
+        return cursor.rowcount
+
+    def clear(self) -> None:
+        """
+        Remove all entries from the cache.
+        """
+
+        with self.lock, self.connection:
+            self.connection.execute(f"DELETE FROM {self.table}")
+
+    def close(self) -> None:
+        """
+        Close the database connection.
+        """
+
+        with self.lock:
+            self.connection.close()
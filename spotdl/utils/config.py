@@ -57,6 +57,57 @@ def get_cache_path() -> Path:
     return get_spotdl_path() / ".spotipy"
 
 
+def get_metadata_cache_path() -> Path:
+    """
+    Get the path to the metadata cache database.
+
+    ### Returns
+    - The path to the spotify metadata cache database.
+    """
+
+    return get_spotdl_path() / "metadata.db"
+
+
+def get_search_cache_path() -> Path:
+    """
+    Get the path to the search cache database.
+
+    ### Returns
+    - The path to the audio provider search cache database.
+    """
+
+    return get_spotdl_path() / "search.db"
+
+
+def get_lyrics_cache_path() -> Path:
+    """
+    Get the path to the lyrics cache database.
+
+    ### Returns
+    - The path to the lyrics cache database.
+    """
+
+    return get_spotdl_path() / "lyrics.db"
+
+
+def get_covers_path() -> Path:
+    """
+    Get the path to the cover art cache folder.
+
+    ### Returns
+    - The path to the covers folder.
+
+    ### Notes
+    - If the covers directory does not exist, it will be created.
+    """
+
+    covers_path = get_spotdl_path() / "covers"
+    if not covers_path.exists():
+        os.mkdir(covers_path)
+
+    return covers_path
+
+
 def get_temp_path() -> Path:
     """
     Get the path to the temp folder.
@@ -135,10 +186,17 @@ def get_config() -> Dict[str, Any]:
     "search_query": None,
     "filter_results": True,
     "threads": 4,
+    "search_threads": None,
+    "download_threads": None,
+    "transcode_workers": None,
     "no_cache": False,
+    "no_search_cache": False,
+    "purge_search_cache": False,
     "cookie_file": None,
     "headless": False,
     "restrict": False,
     "print_errors": False,
     "sponsor_block": False,
+    "cover_size": None,
+    "journal": None,
 }
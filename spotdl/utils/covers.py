@@ -0,0 +1,296 @@
+"""
+Module for downloading cover art once and sharing it between tracks.
+
+    >>> cache = CoverCache(get_covers_path(), max_size=600)
+    >>> cover = cache.get("https://i.scdn.co/image/ab67616d0000b273...")
+"""
+
+import concurrent.futures
+import hashlib
+import io
+import os
+import threading
+
+from collections import OrderedDict
+from pathlib import Path
+from typing import Dict, Optional
+
+from spotdl.utils.http import get_session
+
+try:
+    from PIL import Image
+except ImportError:  # pragma: no cover
+    Image = None  # type: ignore  # pylint: disable=C0103
+
+# Number of covers kept in memory
+COVER_MEMORY_SIZE = 32
+
+# JPEG quality used when covers are resized
+COVER_QUALITY = 90
+
+# Maximum size of the covers on disk in bytes, the least recently used
+# covers are removed until the cache is below COVER_DISK_PRUNE_RATIO of it
+COVER_DISK_SIZE = 256 * 1024 * 1024
+COVER_DISK_PRUNE_RATIO = 0.9
+
+
+class CoverError(Exception):
+    """
+    Base class for all exceptions related to cover art.
+    """
+
+
+class CoverCache:
+    """
+    Cover art cache keyed by the cover url, covers are kept in memory (LRU)
+    and on disk, so every cover is downloaded only once.
+    Spotify cover urls contain the hash of the image, so they change with it.
+    """
+
+    def __init__(
+        self,
+        directory: Optional[Path] = None,
+        memory_size: int = COVER_MEMORY_SIZE,
+        max_size: Optional[int] = None,
+        quality: int = COVER_QUALITY,
+        max_disk_size: Optional[int] = COVER_DISK_SIZE,
+    ) -> None:
+        """
+        Initialize the cover cache.
+
+        ### Arguments
+        - directory: Directory to store the covers in, None keeps them only in memory.
+        - memory_size: Number of covers kept in memory.
+        - max_size: Maximum width/height of the covers in pixels, None keeps the original.
+        - quality: JPEG quality of the resized covers.
+        - max_disk_size: Maximum size of the covers on disk in bytes, None for no limit.
+
+        ### Notes
+        - Resizing requires Pillow, without it the original covers are used.
+        - Covers on disk are removed by their last use (modification time)
+            when the cache grows over `max_disk_size`.
+        """
+
+        self.directory = directory
+        self.memory_size = memory_size
+        self.max_size = max_size
+        self.quality = quality
+        self.max_disk_size = max_disk_size
+
+        self._memory: "OrderedDict[str, bytes]" = OrderedDict()
+        self._in_flight: Dict[str, concurrent.futures.Future] = {}
+        self._lock = threading.Lock()
+
+        # Size of the covers on disk, computed when the first cover is written
+        self._disk_usage: Optional[int] = None
+        self._disk_lock = threading.Lock()
+
+        if self.directory is not None:
+            self.directory.mkdir(parents=True, exist_ok=True)
+
+    def get(self, url: str) -> bytes:
+        """
+        Get the cover image, downloads it only if it's not cached.
+
+        ### Arguments
+        - url: The url of the cover.
+
+        ### Returns
+        - The image data.
+
+        ### Notes
+        - Threads asking for a cover that is being downloaded
+            wait for that download instead of starting a new one.
+        """
+
+        with self._lock:
+            data = self._memory.get(url)
+            if data is not None:
+                self._memory.move_to_end(url)
+                return data
+
+            future = self._in_flight.get(url)
+            owner = future is None
+            if future is None:
+                future = concurrent.futures.Future()
+                self._in_flight[url] = future
+
+        if not owner:
+            return future.result()
+
+        try:
+            data = self._load(url)
+        except BaseException as exception:
+            with self._lock:
+                del self._in_flight[url]
+
+            future.set_exception(exception)
+            raise
+
+        with self._lock:
+            self._memory[url] = data
+            while len(self._memory) > self.memory_size:
+                self._memory.popitem(last=False)
+
+            del self._in_flight[url]
+
+        future.set_result(data)
+
+        return data
+
+    def get_path(self, url: str) -> Optional[Path]:
+        """
+        Get the path of the cover on disk.
+
+        ### Arguments
+        - url: The url of the cover.
+
+        ### Returns
+        - The path or None if the cache is memory only.
+        """
+
+        if self.directory is None:
+            return None
+
+        name = hashlib.sha256(url.encode("utf-8")).hexdigest()
+        if self.max_size and Image is not None:
+            name += f"-{self.max_size}"
+
+        return self.directory / f"{name}.jpg"
+
+    def clear(self) -> None:
+        """
+        Remove all covers from memory and disk.
+        """
+
+        with self._lock:
+            self._memory.clear()
+
+        if self.directory is not None:
+            with self._disk_lock:
+                for path in self.directory.glob("*.jpg"):
+                    path.unlink()
+
+                self._disk_usage = 0
+
+    def prune(self) -> int:
+        """
+        Remove the least recently used covers from disk
+        if they take more than `max_disk_size` bytes.
+
+        ### Returns
+        - The number of removed covers.
+        """
+
+        if self.directory is None or self.max_disk_size is None:
+            return 0
+
+        with self._disk_lock:
+            covers = []
+            for path in self.directory.glob("*.jpg"):
+                try:
+                    stat = path.stat()
+                except OSError:
+                    # Removed by another process
+                    continue
+
+                covers.append((stat.st_mtime, stat.st_size, path))
+
+            self._disk_usage = sum(size for _, size, _ in covers)
+            if self._disk_usage <= self.max_disk_size:
+                return 0
+
+            removed = 0
+            target = self.max_disk_size * COVER_DISK_PRUNE_RATIO
+            for _, size, path in sorted(covers, key=lambda cover: cover[0]):
+                if self._disk_usage <= target:
+                    break
+
+                try:
+                    path.unlink()
+                except OSError:
+                    continue
+
+                self._disk_usage -= size
+                removed += 1
+
+            return removed
+
+    def _load(self, url: str) -> bytes:
+        path = self.get_path(url)
+        if path is not None and path.is_file():
+            try:
+                data = path.read_bytes()
+
+                # Mark the cover as used, so it's pruned last
+                os.utime(path)
+
+                return data
+            except OSError:
+                # Pruned in the meantime, download it again
+                pass
+
+        response = get_session().get(url)
+        response.raise_for_status()
+
+        data = self._resize(response.content)
+
+        if path is not None:
+            # Write to a temporary file first,
+            # so other processes never read a partially written cover
+            temp_path = path.with_name(f"{path.name}.{threading.get_ident()}.tmp")
+            temp_path.write_bytes(data)
+            os.replace(temp_path, path)
+
+            self._add_disk_usage(len(data))
+
+        return data
+
+    def _add_disk_usage(self, size: int) -> None:
+        if self.max_disk_size is None:
+            return
+
+        with self._disk_lock:
+            if self._disk_usage is not None:
+                self._disk_usage += size
+
+            prune = self._disk_usage is None or self._disk_usage > self.max_disk_size
+
+        if prune:
+            self.prune()
+
+    def _resize(self, data: bytes) -> bytes:
+        if not self.max_size or Image is None:
+            return data
+
+        with Image.open(io.BytesIO(data)) as image:
+            if max(image.size) <= self.max_size and image.format == "JPEG":
+                return data
+
+            image.thumbnail((self.max_size, self.max_size))
+
+            output = io.BytesIO()
+            image.convert("RGB").save(output, "JPEG", quality=self.quality)
+
+        return output.getvalue()
+
+
+_default_cache: Optional[CoverCache] = None
+_default_cache_lock = threading.Lock()
+
+
+def get_default_cover_cache() -> CoverCache:
+    """
+    Get the memory only cover cache that is used when no other cache is provided.
+
+    ### Returns
+    - The shared cover cache.
+    """
+
+    global _default_cache  # pylint: disable=W0603
+
+    with _default_cache_lock:
+        if _default_cache is None:
+            _default_cache = CoverCache()
+
+        return _default_cache
@@ -10,14 +10,19 @@
 import stat
 import platform
 import asyncio
+import json
+import queue
 import shlex
+import threading
 
-from typing import Any, Callable, Dict, List, Optional, Tuple, Union
+from collections import deque
+from functools import partial
+from typing import Any, Callable, Deque, Dict, List, Optional, Tuple, Union
 from pathlib import Path
 
-import requests
 from spotdl.utils.config import get_spotdl_path
 from spotdl.utils.formatter import to_ms
+from spotdl.utils.http import get_session
 
 FFMPEG_URLS = {
     "windows": {
@@ -44,6 +49,42 @@
     "m4a": ["-codec:a", "aac"],
 }
 
+# Codec that every output format is encoded with
+FORMAT_CODECS = {
+    "mp3": "mp3",
+    "flac": "flac",
+    "ogg": "vorbis",
+    "opus": "opus",
+    "m4a": "aac",
+}
+
+# Containers that are written for every output format
+FORMAT_CONTAINERS = {
+    "mp3": ["mp3"],
+    "flac": ["flac"],
+    "ogg": ["ogg", "oga"],
+    "opus": ["opus", "ogg"],
+    "m4a": ["m4a", "mp4"],
+}
+
+# Codec names used by yt-dlp that differ from the ffmpeg ones
+CODEC_ALIASES = {"mp4a": "aac"}
+
+# Ways of getting the source stream to the output format
+CONVERSION_COPY = "copy"
+CONVERSION_REMUX = "remux"
+CONVERSION_TRANSCODE = "transcode"
+
+# Muxers of the output formats, a remuxed stream is written with the muxer
+# of the output format instead of the one guessed from the source
+FORMAT_MUXERS = {
+    "mp3": "mp3",
+    "flac": "flac",
+    "ogg": "ogg",
+    "opus": "opus",
+    "m4a": "ipod",
+}
+
 DUR_REGEX = re.compile(
     r"Duration: (?P<hour>\d{2}):(?P<min>\d{2}):(?P<sec>\d{2})\.(?P<ms>\d{2})"
 )
@@ -53,6 +94,9 @@
 VERSION_REGEX = re.compile(r"ffmpeg version \w?(\d+\.)?(\d+)")
 YEAR_REGEX = re.compile(r"Copyright \(c\) \d\d\d\d\-\d\d\d\d")
 
+# Number of ffmpeg output lines kept for error reports
+OUTPUT_TAIL_LINES = 200
+
 
 class FFmpegError(Exception):
     """
@@ -215,7 +259,10 @@ def download_ffmpeg() -> Path:
         raise FFmpegError("FFmpeg binary is not available for your system.")
 
     # Download binary and save it to a file in spotdl directory
-    ffmpeg_binary = requests.get(ffmpeg_url, allow_redirects=True).content
+    response = get_session().get(ffmpeg_url, allow_redirects=True)
+    response.raise_for_status()
+
+    ffmpeg_binary = response.content
     with open(ffmpeg_path, "wb") as ffmpeg_file:
         ffmpeg_file.write(ffmpeg_binary)
 
@@ -226,6 +273,187 @@ def download_ffmpeg() -> Path:
     return ffmpeg_path
 
 
+def get_ffprobe_path(ffmpeg: str = "ffmpeg") -> Optional[Path]:
+    """
+    Get path to the ffprobe binary that belongs to the ffmpeg executable.
+
+    ### Arguments
+    - ffmpeg: ffmpeg executable to use
+
+    ### Returns
+    - Path to ffprobe binary or None if not found.
+    """
+
+    ffmpeg_path = Path(ffmpeg)
+    if ffmpeg_path.parent != Path("."):
+        ffprobe_path = ffmpeg_path.with_name(
+            ffmpeg_path.name.replace("ffmpeg", "ffprobe")
+        )
+        if ffprobe_path.is_file():
+            return ffprobe_path
+
+    global_ffprobe = shutil.which("ffprobe")
+    if global_ffprobe:
+        return Path(global_ffprobe)
+
+    return None
+
+
+def get_codec_name(codec: Optional[str]) -> Optional[str]:
+    """
+    Normalize a codec name reported by yt-dlp or ffprobe.
+
+    ### Arguments
+    - codec: codec name, e.g. "mp4a.40.2" or "opus"
+
+    ### Returns
+    - The ffmpeg codec name or None if the codec is unknown.
+    """
+
+    if not codec or codec == "none":
+        return None
+
+    codec = codec.split(".")[0].lower()
+
+    return CODEC_ALIASES.get(codec, codec)
+
+
+def get_stream_info(
+    download_info: Dict[str, Any]
+) -> Tuple[Optional[str], Optional[str], Optional[float]]:
+    """
+    Get the audio stream details from yt-dlp metadata.
+
+    ### Arguments
+    - download_info: metadata returned by yt-dlp for the selected format
+
+    ### Returns
+    - Tuple of codec, container and bitrate in kbps, None for unknown values.
+    """
+
+    return (
+        get_codec_name(download_info.get("acodec")),
+        download_info.get("ext"),
+        download_info.get("abr") or download_info.get("tbr"),
+    )
+
+
+def probe_file(
+    input_file: Union[Path, str], ffmpeg: str = "ffmpeg"
+) -> Tuple[Optional[str], Optional[str], Optional[float]]:
+    """
+    Get the audio stream details of a file or url using ffprobe.
+
+    ### Arguments
+    - input_file: path or url of the media
+    - ffmpeg: ffmpeg executable whose ffprobe should be used
+
+    ### Returns
+    - Tuple of codec, container and bitrate in kbps, None for unknown values.
+    """
+
+    ffprobe = get_ffprobe_path(ffmpeg)
+    if ffprobe is None:
+        return None, None, None
+
+    with subprocess.Popen(
+        [
+            str(ffprobe),
+            "-v",
+            "error",
+            "-select_streams",
+            "a:0",
+            "-show_entries",
+            "stream=codec_name,bit_rate:format=format_name",
+            "-of",
+            "json",
+            str(input_file),
+        ],
+        stdout=subprocess.PIPE,
+        stderr=subprocess.PIPE,
+        encoding="utf-8",
+    ) as process:
+        output, _ = process.communicate()
+
+    if process.returncode != 0:
+        return None, None, None
+
+    try:
+        data = json.loads(output)
+    except ValueError:
+        return None, None, None
+
+    streams = data.get("streams") or [{}]
+    bit_rate = streams[0].get("bit_rate")
+
+    if isinstance(input_file, Path):
+        container = input_file.suffix[1:].lower()
+    else:
+        # e.g. "mov,mp4,m4a,3gp,3g2,mj2"
+        container = data.get("format", {}).get("format_name")
+
+    return (
+        get_codec_name(streams[0].get("codec_name")),
+        container,
+        int(bit_rate) / 1000 if bit_rate else None,
+    )
+
+
+def choose_conversion(
+    codec: Optional[str],
+    container: Optional[str],
+    source_bitrate: Optional[float] = None,
+    output_format: str = "mp3",
+    bitrate: Optional[str] = None,
+    ffmpeg_args: Optional[str] = None,
+) -> Tuple[str, str]:
+    """
+    Decide how the source stream gets to the output format.
+
+    ### Arguments
+    - codec: codec of the source stream
+    - container: container (or comma separated containers) of the source
+    - source_bitrate: bitrate of the source stream in kbps
+    - output_format: output format
+    - bitrate: requested constant bitrate, e.g. "128k"
+    - ffmpeg_args: ffmpeg arguments
+
+    ### Returns
+    - Tuple of the conversion (copy, remux or transcode) and the reason for it.
+
+    ### Notes
+    - The stream is copied when it already has the codec of the output format,
+        remuxed if it is in another container, and transcoded otherwise.
+    """
+
+    if ffmpeg_args:
+        return CONVERSION_TRANSCODE, "custom ffmpeg arguments"
+
+    if codec is None:
+        return CONVERSION_TRANSCODE, "unknown source codec"
+
+    if codec != FORMAT_CODECS.get(output_format):
+        return CONVERSION_TRANSCODE, f"source codec is {codec}"
+
+    if bitrate:
+        requested = int(bitrate.rstrip("k"))
+        if source_bitrate is None:
+            return CONVERSION_TRANSCODE, "unknown source bitrate"
+
+        # Re-encoding to a higher bitrate doesn't improve the quality
+        if source_bitrate > requested * 1.05:
+            return (
+                CONVERSION_TRANSCODE,
+                f"source bitrate {source_bitrate:.0f}k is higher than {bitrate}",
+            )
+
+    containers = FORMAT_CONTAINERS.get(output_format, [])
+    if container and any(part in containers for part in container.split(",")):
+        return CONVERSION_COPY, f"source is already {codec} in {container}"
+
+    return CONVERSION_REMUX, f"source is {codec} in {container or 'unknown container'}"
+
+
 async def convert(
     input_file: Union[Path, Tuple[str, str]],
     output_file: Path,
@@ -332,6 +560,7 @@ def convert_sync(
     bitrate: Optional[str] = None,
     ffmpeg_args: Optional[str] = None,
     progress_handler: Optional[Callable[[int], None]] = None,
+    conversion: Optional[str] = None,
 ) -> Tuple[bool, Optional[Dict[str, Any]]]:
     """
     Convert the input file to the output file synchronously with progress handler.
@@ -345,12 +574,16 @@ def convert_sync(
     - constant_bitrate: constant bitrate.
     - ffmpeg_args: ffmpeg arguments.
     - progress_handler: progress handler, has to accept an integer as argument.
+    - conversion: copy, remux or transcode, see `choose_conversion`.
+        If not set, the stream is copied only for m4a and opus.
 
     ### Returns
     - Tuple of conversion status and error dictionary.
 
     ### Notes
     - Make sure to check if ffmpeg is installed before calling this function.
+    - The output is parsed line by line and only the last `OUTPUT_TAIL_LINES` lines
+        are kept for the error dictionary.
     """
 
     # Initialize ffmpeg command
@@ -376,10 +609,20 @@ def convert_sync(
     )
 
     # Add output format to command
+    # if the conversion was decided by the probe, use it
     # -c:a is used if the file is not an matroska container
     # and we want to convert to opus
     # otherwise we use arguments from FFMPEG_FORMATS
-    if output_format == "opus" and file_format != "webm":
+    if conversion == CONVERSION_COPY:
+        arguments.extend(["-vn", "-c:a", "copy"])
+    elif conversion == CONVERSION_REMUX:
+        # Only the first audio stream is moved to the container of the output format
+        arguments.extend(
+            ["-map", "0:a:0", "-c:a", "copy", "-f", FORMAT_MUXERS[output_format]]
+        )
+    elif conversion == CONVERSION_TRANSCODE:
+        arguments.extend(FFMPEG_FORMATS[output_format])
+    elif output_format == "opus" and file_format != "webm":
         arguments.extend(["-c:a", "libopus"])
     else:
         if output_format in ["m4a", "opus"] and not (bitrate or ffmpeg_args):
@@ -388,8 +631,8 @@ def convert_sync(
         else:
             arguments.extend(FFMPEG_FORMATS[output_format])
 
-    # Add constant bitrate if specified
-    if bitrate:
+    # Add constant bitrate if specified, copied streams keep their bitrate
+    if bitrate and conversion not in [CONVERSION_COPY, CONVERSION_REMUX]:
         arguments.extend(["-b:a", bitrate])
 
     # Add other ffmpeg arguments if specified
@@ -407,70 +650,178 @@ def convert_sync(
         stderr=subprocess.STDOUT,
         universal_newlines=False,
     ) as process:
-        if not progress_handler:
-            # Wait for process to finish
-            proc_out = process.communicate()
+        if progress_handler:
+            progress_handler(0)
 
-            if process.returncode != 0:
-                # get version and build year
-                version = get_ffmpeg_version(ffmpeg)
+        # Only the last lines are kept for the error report,
+        # so memory and cpu usage don't grow with the length of the track
+        output_tail: Deque[str] = deque(maxlen=OUTPUT_TAIL_LINES)
+        total_dur = None
+        last_progress = 0
 
-                # join stdout and stderr and decode to utf-8
-                message = b"".join(proc_out).decode("utf-8")
+        for raw_line in process.stdout:  # type: ignore
+            line = raw_line.decode("utf-8", errors="replace").strip()
+            output_tail.append(line)
 
-                # return error dictionary
-                return False, {
-                    "error": message,
-                    "arguments": arguments,
-                    "ffmpeg": ffmpeg,
-                    "version": version[0],
-                    "build_year": version[1],
-                }
+            if progress_handler is None:
+                continue
 
-            return True, None
+            if total_dur is None:
+                total_dur_match = DUR_REGEX.search(line)
+                if total_dur_match:
+                    total_dur = to_ms(**total_dur_match.groupdict())  # type: ignore
 
-        progress_handler(0)
+                continue
 
-        stderr_buffer = []
-        total_dur = None
-        stderr: str = ""
-        while True:
-            if process.stdout is None:
+            if not line.startswith("out_time="):
                 continue
 
-            stderr_line = (
-                process.stdout.readline().decode("utf-8", errors="replace").strip()
-            )
+            progress_time = TIME_REGEX.match(line)
+            if progress_time and total_dur:
+                elapsed_time = to_ms(**progress_time.groupdict())  # type: ignore
+                progress = min(int(elapsed_time / total_dur * 100), 100)
 
-            if stderr_line == "" and process.poll() is not None:
-                break
+                # Report only changes, ffmpeg prints progress many times per second
+                if progress != last_progress:
+                    last_progress = progress
+                    progress_handler(progress)
 
-            stderr_buffer.append(stderr_line.strip())
+        process.wait()
 
-            stderr = "\n".join(stderr_buffer)
+    if process.returncode != 0:
+        # get version and build year
+        version = get_ffmpeg_version(ffmpeg)
 
-            total_dur_match = DUR_REGEX.search(stderr_line)
-            if total_dur is None and total_dur_match:
-                total_dur = to_ms(**total_dur_match.groupdict())  # type: ignore
-                continue
-            if total_dur:
-                progress_time = TIME_REGEX.search(stderr_line)
-                if progress_time:
-                    elapsed_time = to_ms(**progress_time.groupdict())  # type: ignore
-                    progress_handler(int(elapsed_time / total_dur * 100))  # type: ignore
-
-        if process.returncode != 0:
-            # get version and build year
-            version = get_ffmpeg_version(ffmpeg)
-
-            return False, {
-                "error": stderr,
-                "arguments": arguments,
-                "ffmpeg": ffmpeg,
-                "version": version[0],
-                "build_year": version[1],
-            }
+        return False, {
+            "error": "\n".join(output_tail),
+            "arguments": arguments,
+            "ffmpeg": ffmpeg,
+            "version": version[0],
+            "build_year": version[1],
+        }
 
+    if progress_handler:
         progress_handler(100)
 
-        return True, None
+    return True, None
+
+
+class TranscodePool:
+    """
+    Transcoding engine that runs at most `workers` ffmpeg processes at the same time.
+    Progress updates are delivered to the progress handlers from a single
+    dispatcher thread, so slow handlers (e.g. rendering the progress bar)
+    don't slow down reading the ffmpeg output.
+
+    ### Notes
+    - This is not a process pool, conversions run in the calling thread
+        and the "workers" are slots of a semaphore. Every conversion already
+        runs in its own ffmpeg subprocess, so the calling thread only waits
+        on pipes and the GIL is not a bottleneck. Limiting the number of
+        concurrent ffmpeg processes is all that's needed to keep the cpu
+        from being oversubscribed.
+    """
+
+    def __init__(self, workers: int) -> None:
+        """
+        Initialize the transcode pool.
+
+        ### Arguments
+        - workers: Maximum number of ffmpeg processes running at the same time.
+        """
+
+        if workers < 1:
+            raise FFmpegError("Transcode pool requires at least one worker")
+
+        self.workers = workers
+        self.slots = threading.BoundedSemaphore(workers)
+        self.progress_queue: "queue.SimpleQueue[Any]" = queue.SimpleQueue()
+        self.dispatcher = threading.Thread(
+            target=self._dispatch_progress, name="ffmpeg-progress", daemon=True
+        )
+        self.dispatcher.start()
+
+    def convert(
+        self,
+        input_file: Union[Path, Tuple[str, str]],
+        output_file: Path,
+        ffmpeg: str = "ffmpeg",
+        output_format: str = "mp3",
+        bitrate: Optional[str] = None,
+        ffmpeg_args: Optional[str] = None,
+        progress_handler: Optional[Callable[[int], None]] = None,
+        conversion: Optional[str] = None,
+    ) -> Tuple[bool, Optional[Dict[str, Any]]]:
+        """
+        Convert the input file to the output file, waits for a free worker first.
+
+        ### Arguments
+        - input_file: Path to input file or tuple of (url, file_format).
+        - output_file: Path to output file.
+        - ffmpeg: ffmpeg executable to use.
+        - output_format: output format.
+        - bitrate: constant bitrate.
+        - ffmpeg_args: ffmpeg arguments.
+        - progress_handler: progress handler, has to accept an integer as argument.
+        - conversion: copy, remux or transcode, see `choose_conversion`.
+
+        ### Returns
+        - Tuple of conversion status and error dictionary.
+
+        ### Notes
+        - All progress updates are delivered before this method returns.
+        """
+
+        channel = None
+        if progress_handler is not None:
+            channel = partial(self._send_progress, progress_handler)
+
+        with self.slots:
+            try:
+                return convert_sync(
+                    input_file,
+                    output_file,
+                    ffmpeg,
+                    output_format,
+                    bitrate,
+                    ffmpeg_args,
+                    channel,
+                    conversion,
+                )
+            finally:
+                if progress_handler is not None:
+                    self._flush()
+
+    def close(self) -> None:
+        """
+        Stop the progress dispatcher thread.
+        """
+
+        self.progress_queue.put(None)
+        self.dispatcher.join()
+
+    def _send_progress(self, progress_handler: Callable[[int], None], progress: int):
+        self.progress_queue.put((progress_handler, progress))
+
+    def _flush(self) -> None:
+        # Wait until the dispatcher has delivered everything queued so far
+        delivered = threading.Event()
+        self.progress_queue.put(delivered)
+        delivered.wait()
+
+    def _dispatch_progress(self) -> None:
+        while True:
+            message = self.progress_queue.get()
+            if message is None:
+                return
+
+            if isinstance(message, threading.Event):
+                message.set()
+                continue
+
+            progress_handler, progress = message
+            try:
+                progress_handler(progress)
+            except Exception:  # pylint: disable=W0703
+                # Progress reporting must never break a conversion
+                pass
@@ -0,0 +1,155 @@
+"""
+Module for the shared HTTP session, which keeps connections alive
+and reuses them between requests and threads.
+
+    >>> response = get_session().get("https://api.genius.com/search")
+"""
+
+import threading
+
+from typing import Any, Optional, Tuple
+from urllib.parse import urlparse
+
+import requests
+
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
+
+from spotdl.utils.ratelimit import RateLimiter, get_rate_limiter
+
+# Timeout of requests that don't set their own, in seconds
+HTTP_TIMEOUT = 10
+
+# Number of connections kept open to a single host
+HTTP_POOL_SIZE = 16
+
+# Number of hosts to keep connection pools for
+HTTP_POOL_HOSTS = 16
+
+# Failed requests are retried after 0.5, 1, 2... seconds
+HTTP_RETRIES = 3
+HTTP_BACKOFF = 0.5
+HTTP_RETRY_STATUSES = (429, 500, 502, 503, 504)
+
+
+class TimeoutHTTPAdapter(HTTPAdapter):
+    """
+    HTTP adapter that sets a default timeout for every request
+    and limits the rate of requests to every host.
+    """
+
+    def __init__(
+        self,
+        *args,
+        timeout: Optional[float] = HTTP_TIMEOUT,
+        rate_limiter: Optional[RateLimiter] = None,
+        **kwargs,
+    ):
+        """
+        Initialize the adapter.
+
+        ### Arguments
+        - timeout: The default timeout in seconds.
+        - rate_limiter: The rate limiter to use, None disables rate limiting.
+        - args: Arguments passed to the HTTPAdapter.
+        - kwargs: Keyword arguments passed to the HTTPAdapter.
+        """
+
+        self.timeout = timeout
+        self.rate_limiter = rate_limiter
+        super().__init__(*args, **kwargs)
+
+    def send(self, request, **kwargs) -> Any:  # pylint: disable=W0221
+        """
+        Send the request, with the default timeout if none was set.
+
+        ### Notes
+        - The rate limiter sees only the final response,
+            retries of the request are delayed by the retry backoff.
+        """
+
+        if kwargs.get("timeout") is None:
+            kwargs["timeout"] = self.timeout
+
+        if self.rate_limiter is None:
+            return super().send(request, **kwargs)
+
+        host = urlparse(request.url).hostname or ""
+        self.rate_limiter.acquire(host)
+
+        response = super().send(request, **kwargs)
+        self.rate_limiter.update(
+            host, response.status_code, response.headers.get("Retry-After")
+        )
+
+        return response
+
+
+def create_session(
+    pool_size: int = HTTP_POOL_SIZE,
+    retries: int = HTTP_RETRIES,
+    timeout: Optional[float] = HTTP_TIMEOUT,
+    retry_statuses: Tuple[int, ...] = HTTP_RETRY_STATUSES,
+    rate_limiter: Optional[RateLimiter] = None,
+) -> requests.Session:
+    """
+    Create a session with connection pooling, retries, rate limiting
+    and a default timeout.
+
+    ### Arguments
+    - pool_size: Maximum number of connections to a single host.
+    - retries: Number of retries of failed requests.
+    - timeout: Default timeout of the requests in seconds.
+    - retry_statuses: Status codes of responses that are retried.
+    - rate_limiter: The rate limiter to use, defaults to the shared one.
+
+    ### Returns
+    - The session.
+
+    ### Notes
+    - Threads wait for a free connection once `pool_size` connections
+        to a host are in use, so a host never gets more concurrent requests.
+    """
+
+    retry = Retry(
+        total=retries,
+        backoff_factor=HTTP_BACKOFF,
+        status_forcelist=retry_statuses,
+        raise_on_status=False,
+    )
+
+    adapter = TimeoutHTTPAdapter(
+        timeout=timeout,
+        rate_limiter=rate_limiter or get_rate_limiter(),
+        pool_connections=HTTP_POOL_HOSTS,
+        pool_maxsize=pool_size,
+        pool_block=True,
+        max_retries=retry,
+    )
+
+    session = requests.Session()
+    session.mount("http://", adapter)
+    session.mount("https://", adapter)
+
+    return session
+
+
+_session: Optional[requests.Session] = None
+_session_lock = threading.Lock()
+
+
+def get_session() -> requests.Session:
+    """
+    Get the session shared by all threads.
+
+    ### Returns
+    - The shared session.
+    """
+
+    global _session  # pylint: disable=W0603
+
+    with _session_lock:
+        if _session is None:
+            _session = create_session()
+
+        return _session
@@ -0,0 +1,305 @@
+"""
+Module for the library index, a SQLite manifest of the downloaded songs
+and synced playlists that is stored in the output directory and used to sync it.
+
+    >>> library = LibraryIndex(Path("Music"))
+    >>> library.add(song, Path("Music/Salem Ilese - Ropes.mp3"), "mp3")
+    >>> library.get_entries()
+"""
+
+import hashlib
+import json
+import sqlite3
+import threading
+
+from dataclasses import dataclass
+from pathlib import Path
+from typing import Dict, Iterable, List, Optional
+
+from spotdl.types.song import Song
+
+# Name of the index file in the library directory
+LIBRARY_INDEX_NAME = ".spotdl-index.db"
+
+# Song fields that are written to the tags of the files
+TAG_FIELDS = (
+    "name",
+    "artists",
+    "artist",
+    "album_name",
+    "album_artist",
+    "genres",
+    "disc_number",
+    "disc_count",
+    "year",
+    "date",
+    "track_number",
+    "tracks_count",
+    "cover_url",
+    "explicit",
+    "publisher",
+    "copyright_text",
+)
+
+
+class LibraryError(Exception):
+    """
+    Base class for all exceptions related to the library index.
+    """
+
+
+@dataclass
+class LibraryEntry:
+    """
+    A downloaded song in the library index.
+    """
+
+    song_id: str
+    path: Path
+    size: int
+    mtime: float
+    file_format: str
+    download_url: Optional[str]
+    tag_hash: str
+
+
+@dataclass
+class PlaylistState:
+    """
+    A synced playlist, used to skip playlists that didn't change.
+    """
+
+    url: str
+    snapshot_id: str
+    songs: List[Song]
+
+
+def get_tag_hash(song: Song) -> str:
+    """
+    Get the hash of the song metadata that is written to the tags.
+
+    ### Arguments
+    - song: The song.
+
+    ### Returns
+    - The hash, it changes when the tags of the file would change.
+    """
+
+    tags = {field: getattr(song, field) for field in TAG_FIELDS}
+    data = json.dumps(tags, sort_keys=True, ensure_ascii=False)
+
+    return hashlib.sha1(data.encode("utf-8")).hexdigest()
+
+
+def is_file_changed(entry: LibraryEntry) -> bool:
+    """
+    Check if the file of a library entry changed since it was recorded.
+
+    ### Arguments
+    - entry: The library entry.
+
+    ### Returns
+    - True if the size or modification time of the file differ from the entry,
+        or if the file can't be read.
+    """
+
+    try:
+        stat = entry.path.stat()
+    except OSError:
+        return True
+
+    return stat.st_size != entry.size or stat.st_mtime != entry.mtime
+
+
+def get_library_path(output: str) -> Path:
+    """
+    Get the directory of the library index for an output template.
+
+    ### Arguments
+    - output: The output template of the downloader.
+
+    ### Returns
+    - The part of the output directory before the first template variable.
+    """
+
+    parts = []
+    for part in Path(output).parent.parts:
+        if "{" in part:
+            break
+
+        parts.append(part)
+
+    return Path(*parts)
+
+
+class LibraryIndex:
+    """
+    Thread-safe index of the downloaded songs, keyed by the song id.
+    """
+
+    def __init__(self, directory: Path) -> None:
+        """
+        Open (or create) the library index.
+
+        ### Arguments
+        - directory: The library directory, the index is stored in it.
+        """
+
+        self.directory = directory
+        self.path = directory / LIBRARY_INDEX_NAME
+        self.lock = threading.Lock()
+
+        directory.mkdir(parents=True, exist_ok=True)
+
+        self.connection = sqlite3.connect(
+            str(self.path), check_same_thread=False, timeout=30
+        )
+
+        with self.lock, self.connection:
+            self.connection.execute(
+                "CREATE TABLE IF NOT EXISTS songs ("
+                "song_id TEXT PRIMARY KEY, path TEXT NOT NULL, size INTEGER, "
+                "mtime REAL, format TEXT, download_url TEXT, tag_hash TEXT)"
+            )
+            self.connection.execute(
+                "CREATE TABLE IF NOT EXISTS playlists ("
+                "url TEXT PRIMARY KEY, snapshot_id TEXT NOT NULL, songs TEXT NOT NULL)"
+            )
+
+    def get_entries(self) -> Dict[str, LibraryEntry]:
+        """
+        Get all songs in the index.
+
+        ### Returns
+        - Dictionary of the entries keyed by the song id.
+        """
+
+        with self.lock:
+            rows = self.connection.execute(
+                "SELECT song_id, path, size, mtime, format, download_url, tag_hash "
+                "FROM songs"
+            ).fetchall()
+
+        return {
+            row[0]: LibraryEntry(row[0], self.directory / row[1], *row[2:])
+            for row in rows
+        }
+
+    def add(self, song: Song, path: Path, file_format: str) -> LibraryEntry:
+        """
+        Add a downloaded song to the index, replaces the previous entry of the song.
+
+        ### Arguments
+        - song: The song.
+        - path: The path of the downloaded file.
+        - file_format: The format of the file.
+
+        ### Returns
+        - The new entry.
+
+        ### Errors
+        - LibraryError if the file doesn't exist.
+        """
+
+        try:
+            stat = path.stat()
+        except OSError as exception:
+            raise LibraryError(
+                f"Can't add missing file to library: {path}"
+            ) from exception
+
+        entry = LibraryEntry(
+            song_id=song.song_id,
+            path=path,
+            size=stat.st_size,
+            mtime=stat.st_mtime,
+            file_format=file_format,
+            download_url=song.download_url,
+            tag_hash=get_tag_hash(song),
+        )
+
+        # Store the path relative to the library, so the library can be moved
+        try:
+            relative_path = str(path.relative_to(self.directory))
+        except ValueError:
+            relative_path = str(path.absolute())
+
+        with self.lock, self.connection:
+            self.connection.execute(
+                "INSERT OR REPLACE INTO songs "
+                "(song_id, path, size, mtime, format, download_url, tag_hash) "
+                "VALUES (?, ?, ?, ?, ?, ?, ?)",
+                (
+                    entry.song_id,
+                    relative_path,
+                    entry.size,
+                    entry.mtime,
+                    entry.file_format,
+                    entry.download_url,
+                    entry.tag_hash,
+                ),
+            )
+
+        return entry
+
+    def remove(self, song_ids: Iterable[str]) -> None:
+        """
+        Remove songs from the index.
+
+        ### Arguments
+        - song_ids: The ids of the songs.
+        """
+
+        with self.lock, self.connection:
+            self.connection.executemany(
+                "DELETE FROM songs WHERE song_id = ?",
+                [(song_id,) for song_id in song_ids],
+            )
+
+    def get_playlist(self, url: str) -> Optional[PlaylistState]:
+        """
+        Get the state of a playlist from the last sync.
+
+        ### Arguments
+        - url: The URL of the playlist.
+
+        ### Returns
+        - The playlist state or None if the playlist wasn't synced before.
+        """
+
+        with self.lock:
+            row = self.connection.execute(
+                "SELECT snapshot_id, songs FROM playlists WHERE url = ?", (url,)
+            ).fetchone()
+
+        if row is None:
+            return None
+
+        return PlaylistState(
+            url, row[0], [Song.from_dict(song) for song in json.loads(row[1])]
+        )
+
+    def set_playlist(self, state: PlaylistState) -> None:
+        """
+        Save the state of a synced playlist, replaces the previous state.
+
+        ### Arguments
+        - state: The playlist state.
+        """
+
+        songs = json.dumps([song.json for song in state.songs], ensure_ascii=False)
+
+        with self.lock, self.connection:
+            self.connection.execute(
+                "INSERT OR REPLACE INTO playlists (url, snapshot_id, songs) "
+                "VALUES (?, ?, ?)",
+                (state.url, state.snapshot_id, songs),
+            )
+
+    def close(self) -> None:
+        """
+        Close the database connection.
+        """
+
+        with self.lock:
+            self.connection.close()
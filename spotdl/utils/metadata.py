@@ -12,16 +12,32 @@
 import base64
 
 from pathlib import Path
-from urllib.request import urlopen
+from typing import Optional
 
 from mutagen.oggopus import OggOpus
 from mutagen.mp4 import MP4, MP4Cover
 from mutagen.flac import Picture, FLAC
 from mutagen.oggvorbis import OggVorbis
-from mutagen.easyid3 import EasyID3, ID3
-from mutagen.id3 import APIC as AlbumCover, USLT
+from mutagen.id3 import (
+    APIC as AlbumCover,
+    ID3,
+    TALB,
+    TCON,
+    TCOP,
+    TDOR,
+    TDRC,
+    TENC,
+    TIT2,
+    TPE1,
+    TPE2,
+    TPOS,
+    TRCK,
+    TSOT,
+    USLT,
+)
 
 from spotdl.types import Song
+from spotdl.utils.covers import CoverCache, get_default_cover_cache
 
 
 class MetadataError(Exception):
@@ -57,8 +73,14 @@ class MetadataError(Exception):
 
 TAG_PRESET = {key: key for key in M4A_TAG_PRESET}
 
+# Free space reserved in the ID3 tag, so the tags can be updated later
+# without moving the audio data
+MP3_TAG_PADDING = 4096
 
-def _set_id3_mp3(output_file: Path, song: Song, lyrics: str = ""):
+
+def _set_id3_mp3(
+    output_file: Path, song: Song, lyrics: str = "", cover: Optional[bytes] = None
+):
     """
     Set ID3 tags for MP3 files.
 
@@ -66,19 +88,51 @@ def _set_id3_mp3(output_file: Path, song: Song, lyrics: str = ""):
     - output_file: Path to the output file.
     - song: Song object.
     - lyrics: Lyrics to embed.
+    - cover: Cover image data to embed.
+
+    ### Notes
+    - All frames are built in memory and the file is written only once,
+        existing tags are replaced.
     """
-    audio_file = EasyID3(str(output_file.resolve()))
 
-    audio_file = _embed_mp3_metadata(audio_file, song)
-    audio_file.save(v2_version=3)
+    audio_file = ID3()
 
-    audio_file = _embed_mp3_cover(output_file, song)
+    audio_file = _embed_mp3_metadata(audio_file, song)
+    audio_file = _embed_mp3_cover(audio_file, cover)
     audio_file = _embed_mp3_lyrics(audio_file, lyrics)
 
-    audio_file.save(v2_version=3)
+    audio_file.save(
+        str(output_file.resolve()),
+        v1=0,
+        v2_version=3,
+        padding=_get_mp3_padding,
+    )
+
+
+def _get_mp3_padding(info) -> int:
+    """
+    Get the padding of the ID3 tag.
+
+    ### Arguments
+    - info: Mutagen padding info.
+
+    ### Returns
+    - The size of the padding in bytes.
+
+    ### Notes
+    - Existing free space is used if the new tag fits, so the audio data isn't moved.
+        Otherwise the file has to be rewritten anyway and `MP3_TAG_PADDING` is reserved.
+    """
+
+    if info.padding >= 0:
+        return info.padding
 
+    return MP3_TAG_PADDING
 
-def _set_id3_m4a(output_file: Path, song: Song, lyrics: str = ""):
+
+def _set_id3_m4a(
+    output_file: Path, song: Song, lyrics: str = "", cover: Optional[bytes] = None
+):
     """
     Set ID3 tags for M4A files.
 
@@ -86,17 +140,20 @@ def _set_id3_m4a(output_file: Path, song: Song, lyrics: str = ""):
     - output_file: Path to the output file.
     - song: Song object.
     - lyrics: Lyrics to embed.
+    - cover: Cover image data to embed.
     """
 
     audio_file = MP4(str(output_file.resolve()))
 
     audio_file = _embed_basic_metadata(audio_file, song, "m4a", M4A_TAG_PRESET)
-    audio_file = _embed_m4a_metadata(audio_file, song, lyrics)
+    audio_file = _embed_m4a_metadata(audio_file, song, lyrics, cover)
 
     audio_file.save()
 
 
-def _set_id3_flac(output_file: Path, song: Song, lyrics: str = ""):
+def _set_id3_flac(
+    output_file: Path, song: Song, lyrics: str = "", cover: Optional[bytes] = None
+):
     """
     Set ID3 tags for FLAC files.
 
@@ -104,18 +161,21 @@ def _set_id3_flac(output_file: Path, song: Song, lyrics: str = ""):
     - output_file: Path to the output file.
     - song: Song object.
     - lyrics: Lyrics to embed.
+    - cover: Cover image data to embed.
     """
 
     audio_file = FLAC(str(output_file.resolve()))
 
     audio_file = _embed_basic_metadata(audio_file, song, "flac")
     audio_file = _embed_ogg_metadata(audio_file, song, lyrics)
-    audio_file = _embed_cover(audio_file, song, "flac")
+    audio_file = _embed_cover(audio_file, "flac", cover)
 
     audio_file.save()
 
 
-def _set_id3_opus(output_file: Path, song: Song, lyrics: str = ""):
+def _set_id3_opus(
+    output_file: Path, song: Song, lyrics: str = "", cover: Optional[bytes] = None
+):
     """
     Set ID3 tags for Opus files.
 
@@ -123,18 +183,21 @@ def _set_id3_opus(output_file: Path, song: Song, lyrics: str = ""):
     - output_file: Path to the output file.
     - song: Song object.
     - lyrics: Lyrics to embed.
+    - cover: Cover image data to embed.
     """
 
     audio_file = OggOpus(str(output_file.resolve()))
 
     audio_file = _embed_basic_metadata(audio_file, song, "opus")
     audio_file = _embed_ogg_metadata(audio_file, song, lyrics)
-    audio_file = _embed_cover(audio_file, song, "opus")
+    audio_file = _embed_cover(audio_file, "opus", cover)
 
     audio_file.save()
 
 
-def _set_id3_ogg(output_file: Path, song: Song, lyrics: str = ""):
+def _set_id3_ogg(
+    output_file: Path, song: Song, lyrics: str = "", cover: Optional[bytes] = None
+):
     """
     Set ID3 tags for OGG files.
 
@@ -142,13 +205,14 @@ def _set_id3_ogg(output_file: Path, song: Song, lyrics: str = ""):
     - output_file: Path to the output file.
     - song: Song object.
     - lyrics: Lyrics to embed.
+    - cover: Cover image data to embed.
     """
 
     audio_file = OggVorbis(str(output_file.resolve()))
 
     audio_file = _embed_basic_metadata(audio_file, song, "ogg")
     audio_file = _embed_ogg_metadata(audio_file, song, lyrics)
-    audio_file = _embed_cover(audio_file, song, "ogg")
+    audio_file = _embed_cover(audio_file, "ogg", cover)
 
     audio_file.save()
 
@@ -158,57 +222,61 @@ def _embed_mp3_metadata(audio_file, song: Song):
     Embed basic metadata into the audio file.
 
     ### Arguments
-    - audio_file: Mutagen audio file object.
+    - audio_file: Mutagen ID3 object.
     - song: Song object.
 
     ### Returns
     - Modified audio_file object.
     """
 
-    audio_file.delete()
-
-    audio_file["title"] = song.name
-    audio_file["titlesort"] = song.name
-    audio_file["tracknumber"] = [song.track_number, song.tracks_count]
-    audio_file["discnumber"] = [song.disc_number, song.disc_count]
-    audio_file["artist"] = song.artists
-    audio_file["album"] = song.album_name
-    audio_file["albumartist"] = song.artists
-    audio_file["date"] = song.date
-    audio_file["originaldate"] = song.date
-    audio_file["encodedby"] = song.publisher
+    frames = [
+        TIT2(encoding=3, text=song.name),
+        TSOT(encoding=3, text=song.name),
+        TRCK(encoding=3, text=f"{song.track_number}/{song.tracks_count}"),
+        TPOS(encoding=3, text=f"{song.disc_number}/{song.disc_count}"),
+        TPE1(encoding=3, text=song.artists),
+        TALB(encoding=3, text=song.album_name),
+        TPE2(encoding=3, text=song.artists),
+        TDRC(encoding=3, text=song.date),
+        TDOR(encoding=3, text=song.date),
+        TENC(encoding=3, text=song.publisher),
+    ]
+
     if song.copyright_text:
-        audio_file["copyright"] = song.copyright_text
+        frames.append(TCOP(encoding=3, text=song.copyright_text))
 
     genres = song.genres
     if len(genres) > 0:
-        audio_file["genre"] = genres[0]
+        frames.append(TCON(encoding=3, text=genres[0]))
+
+    for frame in frames:
+        # Skip the values that are missing
+        if frame.text and frame.text[0]:
+            audio_file.add(frame)
 
     return audio_file
 
 
-def _embed_mp3_cover(file_path, song: Song):
+def _embed_mp3_cover(audio_file, cover: Optional[bytes] = None):
     """
     Embed cover into the audio file.
 
     ### Arguments
-    - file_path: Path to the audio file.
-    - song: Song object.
+    - audio_file: Mutagen ID3 object.
+    - cover: Cover image data.
 
     ### Returns
     - Modified audio_file object.
     """
 
-    audio_file = ID3(file_path)
-    if song.cover_url:
-        with urlopen(song.cover_url) as raw_album_art:
-            audio_file["APIC"] = AlbumCover(
-                encoding=3,
-                mime="image/jpeg",
-                type=3,
-                desc="Cover",
-                data=raw_album_art.read(),
-            )
+    if cover:
+        audio_file["APIC"] = AlbumCover(
+            encoding=3,
+            mime="image/jpeg",
+            type=3,
+            desc="Cover",
+            data=cover,
+        )
 
     return audio_file
 
@@ -218,20 +286,21 @@ def _embed_mp3_lyrics(audio_file, lyrics: str = ""):
     Embed lyrics into the audio file.
 
     ### Arguments
-    - audio_file: Mutagen audio file object.
+    - audio_file: Mutagen ID3 object.
     - lyrics: Lyrics to embed.
 
     ### Returns
     - Modified audio_file object.
     """
 
-    uslt_output = USLT(encoding=3, lang="eng", desc="desc", text=lyrics)
-    audio_file["USLT::'eng'"] = uslt_output
+    audio_file.add(USLT(encoding=3, lang="eng", desc="desc", text=lyrics))
 
     return audio_file
 
 
-def _embed_m4a_metadata(audio_file, song: Song, lyrics: str = ""):
+def _embed_m4a_metadata(
+    audio_file, song: Song, lyrics: str = "", cover: Optional[bytes] = None
+):
     """
     Embed basic metadata into the audio file.
 
@@ -239,6 +308,7 @@ def _embed_m4a_metadata(audio_file, song: Song, lyrics: str = ""):
     - audio_file: Mutagen audio file object.
     - song: Song object.
     - lyrics: Lyrics to embed.
+    - cover: Cover image data.
 
     ### Returns
     - Modified audio_file object.
@@ -248,17 +318,10 @@ def _embed_m4a_metadata(audio_file, song: Song, lyrics: str = ""):
     audio_file[M4A_TAG_PRESET["lyrics"]] = lyrics
     audio_file[M4A_TAG_PRESET["explicit"]] = (4 if song.explicit is True else 2,)
 
-    if song.cover_url:
-        try:
-            with urlopen(song.cover_url) as raw_album_art:
-                audio_file[M4A_TAG_PRESET["albumart"]] = [
-                    MP4Cover(
-                        raw_album_art.read(),
-                        imageformat=MP4Cover.FORMAT_JPEG,
-                    )
-                ]
-        except IndexError:
-            pass
+    if cover:
+        audio_file[M4A_TAG_PRESET["albumart"]] = [
+            MP4Cover(cover, imageformat=MP4Cover.FORMAT_JPEG)
+        ]
 
     return audio_file
 
@@ -330,29 +393,27 @@ def _embed_ogg_metadata(audio_file, song: Song, lyrics: str = ""):
     return audio_file
 
 
-def _embed_cover(audio_file, song: Song, encoding: str):
+def _embed_cover(audio_file, encoding: str, cover: Optional[bytes] = None):
     """
     Embed cover into the audio file.
 
     ### Arguments
     - audio_file: Mutagen audio file object.
-    - song: Song object.
     - encoding: Encoding of the audio file.
+    - cover: Cover image data.
 
     ### Returns
     - Modified audio_file object.
     """
 
-    if song.cover_url is None:
+    if not cover:
         return audio_file
 
     image = Picture()
     image.type = 3
     image.desc = "Cover"
     image.mime = "image/jpeg"
-
-    with urlopen(song.cover_url) as raw_album_art:
-        image.data = raw_album_art.read()
+    image.data = cover
 
     if encoding == "flac":
         audio_file.add_picture(image)
@@ -375,7 +436,11 @@ def _embed_cover(audio_file, song: Song, encoding: str):
 
 
 def embed_metadata(
-    output_file: Path, song: Song, file_format: str, lyrics: str = ""
+    output_file: Path,
+    song: Song,
+    file_format: str,
+    lyrics: str = "",
+    cover_cache: Optional[CoverCache] = None,
 ) -> None:
     """
     Embeds metadata into the output file.
@@ -385,8 +450,15 @@ def embed_metadata(
     - song: Song object.
     - file_format: File format of the output file.
     - lyrics: Lyrics to embed.
+    - cover_cache: Cache to get the cover from, defaults to a shared in-memory cache.
     """
 
     function = AVAILABLE_FORMATS.get(file_format)
-    if function:
-        function(output_file, song, lyrics)
+    if function is None:
+        return
+
+    cover = None
+    if song.cover_url:
+        cover = (cover_cache or get_default_cover_cache()).get(song.cover_url)
+
+    function(output_file, song, lyrics, cover)
@@ -0,0 +1,55 @@
+"""
+Module for normalizing strings before they are matched.
+Song, album and artist names are compared many times per song,
+so the results are cached.
+
+    >>> slugify("Beyoncé - Halo")
+    'beyonce-halo'
+"""
+
+import re
+
+from functools import lru_cache
+
+from slugify import slugify as _slugify
+
+# Number of slugified strings kept in memory
+SLUGIFY_CACHE_SIZE = 8192
+
+# Strings that slugify would return unchanged
+SLUG_PATTERN = re.compile(r"[a-z0-9]+(?:-[a-z0-9]+)*")
+
+
+@lru_cache(maxsize=SLUGIFY_CACHE_SIZE)
+def _slugify_cached(text: str) -> str:
+    return _slugify(text)
+
+
+def slugify(text: str) -> str:
+    """
+    Make a slug from the given text, like `slugify.slugify` with default options.
+
+    ### Arguments
+    - text: The text to slugify.
+
+    ### Returns
+    - The slug.
+
+    ### Notes
+    - Text that is already a slug is returned as is,
+        without the unidecode and regex pipeline.
+    - Other results are kept in a LRU cache of `SLUGIFY_CACHE_SIZE` entries.
+    """
+
+    if SLUG_PATTERN.fullmatch(text) is not None:
+        return text
+
+    return _slugify_cached(text)
+
+
+def clear_cache() -> None:
+    """
+    Remove all cached slugs.
+    """
+
+    _slugify_cached.cache_clear()
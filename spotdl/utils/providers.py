@@ -2,8 +2,19 @@
 Module for provider utilities.
 """
 
-from rapidfuzz import fuzz
-from slugify import slugify
+import logging
+
+from functools import lru_cache
+from typing import List, Sequence
+
+from rapidfuzz import fuzz, process
+
+try:
+    import numpy
+except ImportError:  # pragma: no cover
+    numpy = None  # type: ignore  # pylint: disable=C0103
+
+from spotdl.utils.normalize import slugify
 
 
 def match_percentage(str1: str, str2: str, score_cutoff: float = 0) -> float:
@@ -29,3 +40,97 @@ def match_percentage(str1: str, str2: str, score_cutoff: float = 0) -> float:
         return fuzz.partial_ratio(
             str1, str2, score_cutoff=score_cutoff, processor=slugify
         )
+
+
+@lru_cache(maxsize=None)
+def cdist_available() -> bool:
+    """
+    Check if rapidfuzz `process.cdist` can be used by `match_percentages`.
+
+    ### Returns
+    - True if numpy is installed and rapidfuzz supports the `dtype` argument.
+
+    ### Notes
+    - The check is done once, the result is logged at debug level.
+    """
+
+    if numpy is None:
+        logging.debug(
+            "numpy is not installed, comparing every pair of strings separately"
+        )
+        return False
+
+    try:
+        process.cdist(
+            ["a"], ["a"], scorer=fuzz.partial_ratio, processor=None, dtype=numpy.float64
+        )
+    except (ImportError, TypeError) as exception:
+        # rapidfuzz < 2.0 doesn't support `dtype`
+        logging.debug(
+            "rapidfuzz process.cdist is not available (%s), "
+            "comparing every pair of strings separately",
+            exception,
+        )
+        return False
+
+    logging.debug("Comparing strings with rapidfuzz process.cdist")
+
+    return True
+
+
+def match_percentages(
+    queries: Sequence[str], choices: Sequence[str]
+) -> List[List[float]]:
+    """
+    Compare every query with every choice in a single call.
+
+    ### Arguments
+    - queries: The strings to compare, used as the first argument of `match_percentage`.
+    - choices: The strings to compare the queries with.
+
+    ### Returns
+    - Matrix (list of rows) with `match_percentage(query, choice)`
+        for every query (row) and choice (column).
+
+    ### Notes
+    - Uses rapidfuzz `process.cdist` if numpy is installed (it's not a dependency
+        of spotdl), otherwise every pair is compared separately.
+    """
+
+    if len(queries) == 0 or len(choices) == 0:
+        return [[] for _ in queries]
+
+    if cdist_available():
+        try:
+            return process.cdist(
+                queries,
+                choices,
+                scorer=fuzz.partial_ratio,
+                processor=None,
+                dtype=numpy.float64,
+            ).tolist()
+        except (TypeError, ValueError):
+            # Fall back to `match_percentage` which handles unicode characters
+            pass
+
+    return [
+        [match_percentage(query, choice) for choice in choices] for query in queries
+    ]
+
+
+def time_matches(durations: Sequence[float], duration: float) -> List[float]:
+    """
+    Calculate how close the durations of the results are to the song duration.
+
+    ### Arguments
+    - durations: The durations of the results in seconds.
+    - duration: The duration of the song in seconds.
+
+    ### Returns
+    - The time match of every result, 100 for an exact match.
+
+    ### Errors
+    - ZeroDivisionError if the song has no duration and there are results.
+    """
+
+    return [100 - ((result - duration) ** 2) / duration * 100 for result in durations]
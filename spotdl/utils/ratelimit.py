@@ -0,0 +1,291 @@
+"""
+Module for adaptive rate limiting of requests, one token bucket per host or provider.
+The rate is halved when the server responds with 429 or 5xx
+and raised again slowly after successful requests.
+
+    >>> limiter = get_rate_limiter()
+    >>> limiter.acquire("music.youtube.com")
+    >>> limiter.update("music.youtube.com", 429, "10")
+"""
+
+import email.utils
+import threading
+import time
+
+from typing import Dict, Optional
+
+# Requests per second every host starts with
+RATE_LIMIT = 10.0
+
+# Limits of the adaptive rate, in requests per second
+MIN_RATE_LIMIT = 0.2
+MAX_RATE_LIMIT = 50.0
+
+# Number of requests that can be made at once after an idle period
+RATE_LIMIT_BURST = 10
+
+# The rate is multiplied by the factor on a throttled response,
+# and increased by the step after every successful one
+RATE_LIMIT_BACKOFF = 0.5
+RATE_LIMIT_INCREASE = 0.1
+
+# Status codes that mean that we are sending too many requests
+THROTTLE_STATUSES = (429, 500, 502, 503, 504)
+
+
+class TokenBucket:
+    """
+    Thread-safe token bucket with an adjustable rate.
+    """
+
+    def __init__(
+        self,
+        rate: float = RATE_LIMIT,
+        burst: int = RATE_LIMIT_BURST,
+        min_rate: float = MIN_RATE_LIMIT,
+        max_rate: float = MAX_RATE_LIMIT,
+    ) -> None:
+        """
+        Initialize the token bucket.
+
+        ### Arguments
+        - rate: Initial rate in requests per second.
+        - burst: Maximum number of tokens in the bucket.
+        - min_rate: Lowest rate the bucket backs off to.
+        - max_rate: Highest rate the bucket recovers to.
+        """
+
+        self.rate = rate
+        self.burst = burst
+        self.min_rate = min_rate
+        self.max_rate = max_rate
+
+        self.tokens = float(burst)
+        self.updated = time.monotonic()
+        self.paused_until = 0.0
+        self.lock = threading.Lock()
+
+    def acquire(self) -> float:
+        """
+        Take a token from the bucket, waits until one is available.
+
+        ### Returns
+        - The number of seconds waited.
+
+        ### Notes
+        - Tokens are reserved before waiting,
+            so concurrent callers are spread out by the rate.
+        """
+
+        with self.lock:
+            now = time.monotonic()
+            self._refill(now)
+
+            self.tokens -= 1
+            wait = max(-self.tokens / self.rate, self.paused_until - now, 0.0)
+
+        if wait > 0:
+            time.sleep(wait)
+
+        return wait
+
+    def backoff(self, retry_after: Optional[float] = None) -> None:
+        """
+        Lower the rate after a throttled request.
+
+        ### Arguments
+        - retry_after: Seconds to wait before the next request, if the server sent them.
+        """
+
+        with self.lock:
+            now = time.monotonic()
+            self._refill(now)
+
+            self.rate = max(self.min_rate, self.rate * RATE_LIMIT_BACKOFF)
+
+            # Don't let the saved up tokens burst into the throttled server
+            self.tokens = min(self.tokens, 0.0)
+
+            if retry_after is not None:
+                self.paused_until = max(self.paused_until, now + retry_after)
+
+    def recover(self) -> None:
+        """
+        Raise the rate after a successful request.
+        """
+
+        with self.lock:
+            self.rate = min(self.max_rate, self.rate + RATE_LIMIT_INCREASE)
+
+    def _refill(self, now: float) -> None:
+        self.tokens = min(self.burst, self.tokens + (now - self.updated) * self.rate)
+        self.updated = now
+
+
+class RateLimiter:
+    """
+    Collection of token buckets, keyed by host or provider name.
+    """
+
+    def __init__(
+        self,
+        rate: float = RATE_LIMIT,
+        burst: int = RATE_LIMIT_BURST,
+        min_rate: float = MIN_RATE_LIMIT,
+        max_rate: float = MAX_RATE_LIMIT,
+    ) -> None:
+        """
+        Initialize the rate limiter.
+
+        ### Arguments
+        - rate: Initial rate of every bucket in requests per second.
+        - burst: Maximum number of tokens in every bucket.
+        - min_rate: Lowest rate the buckets back off to.
+        - max_rate: Highest rate the buckets recover to.
+        """
+
+        self.rate = rate
+        self.burst = burst
+        self.min_rate = min_rate
+        self.max_rate = max_rate
+
+        self.buckets: Dict[str, TokenBucket] = {}
+        self.lock = threading.Lock()
+
+    def get_bucket(self, key: str) -> TokenBucket:
+        """
+        Get the token bucket of a host or provider, it's created on first use.
+
+        ### Arguments
+        - key: The host or provider name.
+
+        ### Returns
+        - The token bucket.
+        """
+
+        with self.lock:
+            bucket = self.buckets.get(key)
+            if bucket is None:
+                bucket = TokenBucket(
+                    self.rate, self.burst, self.min_rate, self.max_rate
+                )
+                self.buckets[key] = bucket
+
+            return bucket
+
+    def acquire(self, key: str) -> float:
+        """
+        Wait until a request to the host or provider can be made.
+
+        ### Arguments
+        - key: The host or provider name.
+
+        ### Returns
+        - The number of seconds waited.
+        """
+
+        return self.get_bucket(key).acquire()
+
+    def update(
+        self, key: str, status_code: Optional[int], retry_after: Optional[str] = None
+    ) -> None:
+        """
+        Adapt the rate to the response of a request.
+
+        ### Arguments
+        - key: The host or provider name.
+        - status_code: The status code of the response, None if it's not known.
+        - retry_after: The value of the Retry-After header.
+        """
+
+        bucket = self.get_bucket(key)
+
+        if status_code in THROTTLE_STATUSES:
+            bucket.backoff(parse_retry_after(retry_after))
+        elif status_code is not None and status_code < 400:
+            bucket.recover()
+
+    def rates(self) -> Dict[str, float]:
+        """
+        Get the current rates, for monitoring.
+
+        ### Returns
+        - Dictionary with the rate (requests per second) of every host or provider.
+        """
+
+        with self.lock:
+            return {key: bucket.rate for key, bucket in self.buckets.items()}
+
+
+def parse_retry_after(value: Optional[str]) -> Optional[float]:
+    """
+    Parse the value of a Retry-After header.
+
+    ### Arguments
+    - value: Number of seconds or a HTTP date.
+
+    ### Returns
+    - The number of seconds to wait or None if the value is missing or invalid.
+    """
+
+    if not value:
+        return None
+
+    try:
+        return max(float(value), 0.0)
+    except ValueError:
+        pass
+
+    try:
+        date = email.utils.parsedate_to_datetime(value)
+    except (TypeError, ValueError):
+        return None
+
+    return max(date.timestamp() - time.time(), 0.0)
+
+
+def get_status_code(exception: BaseException) -> Optional[int]:
+    """
+    Get the HTTP status code of an exception raised by a client library.
+
+    ### Arguments
+    - exception: The exception.
+
+    ### Returns
+    - The status code or None if the exception isn't caused by a HTTP error.
+
+    ### Notes
+    - Supports urllib (`code`), requests (`response.status_code`)
+        and spotipy (`http_status`) errors.
+    """
+
+    for status_code in (
+        getattr(exception, "http_status", None),
+        getattr(getattr(exception, "response", None), "status_code", None),
+        getattr(exception, "code", None),
+    ):
+        if isinstance(status_code, int):
+            return status_code
+
+    return None
+
+
+_rate_limiter: Optional[RateLimiter] = None
+_rate_limiter_lock = threading.Lock()
+
+
+def get_rate_limiter() -> RateLimiter:
+    """
+    Get the rate limiter shared by all threads.
+
+    ### Returns
+    - The shared rate limiter.
+    """
+
+    global _rate_limiter  # pylint: disable=W0603
+
+    with _rate_limiter_lock:
+        if _rate_limiter is None:
+            _rate_limiter = RateLimiter()
+
+        return _rate_limiter
@@ -0,0 +1,322 @@
+"""
+Module for reading and writing .spotdl save files.
+Songs are stored as one JSON object per line, so they can be written
+as soon as they are finished and read lazily.
+
+    >>> with SaveFileWriter("songs.spotdl.gz") as save_file:
+    >>>     save_file.write(song)
+    >>> songs = load_songs("songs.spotdl.gz")
+"""
+
+import gzip
+import io
+import json
+import os
+import threading
+
+from pathlib import Path
+from typing import IO, Any, Dict, Iterable, Iterator, Optional, Set, Union
+
+from spotdl.types.song import Song, SongList
+
+try:
+    import zstandard
+except ImportError:  # pragma: no cover
+    zstandard = None  # type: ignore  # pylint: disable=C0103
+
+# Compression of the save file is picked by its extension
+COMPRESSION_NONE = "none"
+COMPRESSION_GZIP = "gzip"
+COMPRESSION_ZSTD = "zstd"
+SAVE_FILE_EXTENSIONS = {
+    ".spotdl": COMPRESSION_NONE,
+    ".spotdl.gz": COMPRESSION_GZIP,
+    ".spotdl.zst": COMPRESSION_ZSTD,
+}
+
+# Compressed files are recognized by their magic bytes when reading
+GZIP_MAGIC = b"\x1f\x8b"
+ZSTD_MAGIC = b"\x28\xb5\x2f\xfd"
+
+# Suffix of the file the songs are written to until the save file is complete
+PART_SUFFIX = ".part"
+
+
+class SaveFileError(Exception):
+    """
+    Base class for all exceptions related to save files.
+    """
+
+
+def is_save_file(path: Union[str, Path]) -> bool:
+    """
+    Check if a path is a save file.
+
+    ### Arguments
+    - path: The path.
+
+    ### Returns
+    - True if the path has one of the save file extensions.
+    """
+
+    return str(path).endswith(tuple(SAVE_FILE_EXTENSIONS))
+
+
+def get_compression(path: Union[str, Path]) -> str:
+    """
+    Get the compression of a save file from its extension.
+
+    ### Arguments
+    - path: The path of the save file.
+
+    ### Returns
+    - The compression, "none", "gzip" or "zstd".
+    """
+
+    for extension, compression in SAVE_FILE_EXTENSIONS.items():
+        if str(path).endswith(extension):
+            return compression
+
+    return COMPRESSION_NONE
+
+
+def open_save_file(
+    path: Union[str, Path], mode: str = "r", compression: Optional[str] = None
+) -> IO[str]:
+    """
+    Open a save file as text, compressed files are (de)compressed on the fly.
+
+    ### Arguments
+    - path: The path of the save file.
+    - mode: "r" to read, "w" to write.
+    - compression: The compression of a written file, defaults to the one
+        of the extension. Read files are recognized by their content.
+
+    ### Returns
+    - The text stream.
+
+    ### Errors
+    - SaveFileError if the file is compressed with zstd and zstandard is not installed.
+    """
+
+    if mode == "r":
+        with open(path, "rb") as raw_file:
+            magic = raw_file.read(len(ZSTD_MAGIC))
+
+        if magic.startswith(GZIP_MAGIC):
+            compression = COMPRESSION_GZIP
+        elif magic == ZSTD_MAGIC:
+            compression = COMPRESSION_ZSTD
+        else:
+            compression = COMPRESSION_NONE
+    elif compression is None:
+        compression = get_compression(path)
+
+    if compression == COMPRESSION_GZIP:
+        return gzip.open(path, mode + "t", encoding="utf-8")  # type: ignore
+
+    if compression == COMPRESSION_ZSTD:
+        if zstandard is None:
+            raise SaveFileError(
+                "zstandard is not installed, install it to use .spotdl.zst files"
+            )
+
+        raw_file = open(path, mode + "b")  # pylint: disable=R1732
+        if mode == "r":
+            stream = zstandard.ZstdDecompressor().stream_reader(raw_file)
+        else:
+            stream = zstandard.ZstdCompressor().stream_writer(raw_file)
+
+        return io.TextIOWrapper(stream, encoding="utf-8")  # type: ignore
+
+    return open(path, mode, encoding="utf-8")  # pylint: disable=R1732
+
+
+def load_songs(path: Union[str, Path]) -> Iterator[Song]:
+    """
+    Read the songs from a save file, one at a time.
+
+    ### Arguments
+    - path: The path of the save file.
+
+    ### Returns
+    - Generator yielding the songs.
+
+    ### Errors
+    - SaveFileError if a song in the file is invalid.
+
+    ### Notes
+    - Save files in the old format (a single JSON array) are loaded at once.
+    - A broken last line, e.g. from a crash while the file was written, is skipped.
+    - Song lists are restored from their records (see `SaveFileWriter.write`)
+        or from the song list dictionaries of older save files. The songs of
+        a restored list are added to it as they are read.
+    """
+
+    song_lists: Dict[str, SongList] = {}
+    for data in _read_lines(path):
+        if data.keys() == {"song_list"}:
+            _restore_song_list(song_lists, data["song_list"])
+            continue
+
+        if isinstance(data.get("song_list"), dict):
+            _restore_song_list(song_lists, data["song_list"])
+
+        song = Song.from_dict(data, song_lists)
+        if song.song_list is not None:
+            song.song_list.songs.append(song)
+
+        yield song
+
+
+def _restore_song_list(song_lists: Dict[str, SongList], data: Dict[str, Any]) -> None:
+    if data["url"] not in song_lists:
+        song_lists[data["url"]] = SongList(
+            name=data["name"], url=data["url"], urls=data["urls"], songs=[]
+        )
+
+
+def _read_lines(path: Union[str, Path]) -> Iterator[Dict[str, Any]]:
+    with open_save_file(path) as save_file:
+        first_line = _read_line(save_file)
+
+        # Old save files are a single (indented) JSON array
+        if first_line.lstrip().startswith("["):
+            yield from json.loads(first_line + save_file.read())
+            return
+
+        line_number = 1
+        line = first_line
+        while line:
+            next_line = _read_line(save_file)
+
+            if line.strip():
+                try:
+                    yield json.loads(line)
+                except ValueError as exception:
+                    if next_line:
+                        raise SaveFileError(
+                            f"Invalid song on line {line_number} of {path}"
+                        ) from exception
+
+            line = next_line
+            line_number += 1
+
+
+def _read_line(save_file: IO[str]) -> str:
+    try:
+        return save_file.readline()
+    except EOFError:
+        # Compressed file that wasn't closed, the rest of it is incomplete
+        return ""
+
+
+class SaveFileWriter:
+    """
+    Thread-safe writer of save files, songs are written as soon as they are added.
+    """
+
+    def __init__(self, path: Union[str, Path]) -> None:
+        """
+        Create the save file.
+
+        ### Arguments
+        - path: The path of the save file.
+
+        ### Notes
+        - The songs are written to `<path>.part`, which is moved to the path
+            when the writer is closed. An existing save file can be read
+            while the new one is written, and the songs written before a crash
+            are kept in the part file.
+        """
+
+        self.path = Path(path)
+        self.part_path = self.path.with_name(self.path.name + PART_SUFFIX)
+        self.count = 0
+        self.song_lists: Set[str] = set()
+        self.lock = threading.Lock()
+
+        # The part file is compressed like the save file
+        self.file = open_save_file(self.part_path, "w", get_compression(self.path))
+
+    def write(self, song: Union[Song, Dict[str, Any]]) -> None:
+        """
+        Append a song to the save file.
+
+        ### Arguments
+        - song: The song or its dictionary.
+
+        ### Notes
+        - Songs reference their song list by url, the name and urls of the list
+            are written once, in a record before its first song.
+        """
+
+        data = song.json if isinstance(song, Song) else song
+        line = json.dumps(data, ensure_ascii=False) + "\n"
+
+        song_list = song.song_list if isinstance(song, Song) else None
+
+        with self.lock:
+            if song_list is not None and song_list.url not in self.song_lists:
+                record = {
+                    "song_list": {
+                        "name": song_list.name,
+                        "url": song_list.url,
+                        "urls": song_list.urls,
+                    }
+                }
+                self.file.write(json.dumps(record, ensure_ascii=False) + "\n")
+                self.song_lists.add(song_list.url)
+
+            self.file.write(line)
+            self.file.flush()
+            self.count += 1
+
+    def close(self) -> None:
+        """
+        Finish the save file.
+        """
+
+        with self.lock:
+            if self.file.closed:
+                return
+
+            self.file.close()
+            os.replace(self.part_path, self.path)
+
+    def abort(self) -> None:
+        """
+        Stop writing, the songs written so far are kept in the part file.
+        """
+
+        with self.lock:
+            self.file.close()
+
+    def __enter__(self) -> "SaveFileWriter":
+        return self
+
+    def __exit__(self, exc_type, *_) -> None:
+        # Keep the previous save file if the songs weren't all written
+        if exc_type is None:
+            self.close()
+        else:
+            self.abort()
+
+
+def save_songs(path: Union[str, Path], songs: Iterable[Union[Song, Dict]]) -> int:
+    """
+    Write songs to a save file.
+
+    ### Arguments
+    - path: The path of the save file.
+    - songs: The songs or their dictionaries.
+
+    ### Returns
+    - The number of songs written.
+    """
+
+    with SaveFileWriter(path) as save_file:
+        for song in songs:
+            save_file.write(song)
+
+    return save_file.count
@@ -5,14 +5,12 @@
 To use this module you must first initialize the SpotifyClient.
 """
 
-import json
-import concurrent.futures
-
-from typing import List, Optional
+from typing import Any, Dict, List, Optional, Union
 
 from spotdl.utils.spotify import SpotifyClient
 from spotdl.types import Playlist, Album, Artist, Saved
 from spotdl.types.song import SongList, SongError, Song
+from spotdl.utils.savefile import is_save_file, load_songs
 
 
 class QueryError(Exception):
@@ -41,16 +39,8 @@ def get_search_results(search_term: str) -> List[Song]:
     ):
         raise SongError("No songs matches found on spotify")
 
-    songs = []
-    for index, _ in enumerate(raw_search_results["tracks"]["items"]):
-        songs.append(
-            Song.from_url(
-                "http://open.spotify.com/track/"
-                + raw_search_results["tracks"]["items"][index]["id"]
-            )
-        )
-
-    return songs
+    # search results contain full track objects, so they don't have to be refetched
+    return Song.list_from_tracks(raw_search_results["tracks"]["items"])
 
 
 def parse_query(
@@ -68,7 +58,9 @@ def parse_query(
     - List of song objects
     """
 
-    urls: List[str] = []
+    # Track objects from playlist/saved responses are used directly,
+    # single tracks, albums and artists are passed as urls and fetched in batches
+    tracks: List[Union[str, Dict[str, Any]]] = []
     songs: List[Song] = []
     for request in query:
         if (
@@ -98,27 +90,23 @@ def parse_query(
                 )
             )
         elif "open.spotify.com" in request and "track" in request:
-            urls.append(request)
+            tracks.append(request)
         elif "open.spotify.com" in request and "playlist" in request:
-            urls.extend(Playlist.get_urls(request))
+            tracks.extend(Playlist.get_tracks(request))
         elif "open.spotify.com" in request and "album" in request:
-            urls.extend(Album.get_urls(request))
+            tracks.extend(Album.get_urls(request))
         elif "open.spotify.com" in request and "artist" in request:
             for album_url in Artist.get_albums(request):
-                urls.extend(Album.get_urls(album_url))
+                tracks.extend(Album.get_urls(album_url))
         elif request == "saved":
-            urls.extend(Saved.get_urls("saved"))
-        elif request.endswith(".spotdl"):
-            with open(request, "r", encoding="utf-8") as m3u_file:
-                for track in json.load(m3u_file):
-                    # Append to songs
-                    songs.append(Song.from_dict(track))
+            tracks.extend(Saved.get_tracks("saved"))
+        elif is_save_file(request):
+            songs.extend(load_songs(request))
         else:
             songs.append(Song.from_search_term(request))
 
-    with concurrent.futures.ThreadPoolExecutor(max_workers=threads) as executor:
-        for song in executor.map(Song.from_url, urls):
-            songs.append(song)
+    # Fetch missing metadata in batches
+    songs.extend(Song.list_from_tracks(tracks, threads))
 
     return songs
 
@@ -249,11 +237,8 @@ def get_simple_songs(
             lists.append(Artist.create_basic_list(request))
         elif request == "saved":
             lists.append(Saved.create_basic_list())
-        elif request.endswith(".spotdl"):
-            with open(request, "r", encoding="utf-8") as save_file:
-                for track in json.load(save_file):
-                    # Append to songs
-                    songs.append(Song.from_dict(track))
+        elif is_save_file(request):
+            songs.extend(load_songs(request))
         else:
             songs.append(Song.from_search_term(request))
 
@@ -6,13 +6,32 @@
     >>> spotify.Spotify.init(client_id, client_secret)
 """
 
-from typing import Optional
+import threading
+
+from collections import OrderedDict
+from concurrent.futures import Future, ThreadPoolExecutor
+from typing import Any, Callable, Dict, List, Optional
+from urllib.parse import parse_qs, urlencode, urlparse
 
 from spotipy import Spotify
 from spotipy.cache_handler import CacheFileHandler, MemoryCacheHandler
 from spotipy.oauth2 import SpotifyClientCredentials, SpotifyOAuth
 
-from spotdl.utils.config import get_cache_path
+from spotdl.utils.cache import PersistentCache
+from spotdl.utils.config import get_cache_path, get_metadata_cache_path
+from spotdl.utils.http import create_session
+
+# Track, album and artist metadata rarely changes, a week is a safe default
+METADATA_CACHE_TTL = 7 * 24 * 60 * 60
+
+# Maximum number of items kept in the in-process memo
+MEMO_SIZE = 2048
+
+# Maximum number of pages fetched at the same time
+PAGINATION_WORKERS = 8
+
+# Number of times a page that couldn't be fetched is requested again
+PAGE_RETRIES = 2
 
 
 class SpotifyError(Exception):
@@ -53,6 +72,7 @@ def init(  # pylint: disable=bad-mcs-method-argument
         cache_path: Optional[str] = None,
         no_cache: bool = False,
         open_browser: bool = True,
+        metadata_cache_ttl: int = METADATA_CACHE_TTL,
     ) -> "Singleton":
         """
         Initializes the SpotifyClient.
@@ -64,6 +84,8 @@ def init(  # pylint: disable=bad-mcs-method-argument
         - cache_path: The path to the cache file.
         - no_cache: Whether or not to use the cache.
         - open_browser: Whether or not to open the browser.
+        - metadata_cache_ttl: How long (in seconds) track, album and artist
+            metadata is kept in the persistent metadata cache.
 
         ### Returns
         - The instance of the SpotifyClient.
@@ -100,10 +122,22 @@ def init(  # pylint: disable=bad-mcs-method-argument
 
         self.user_auth = user_auth
 
+        # Persistent metadata cache, shared between runs
+        metadata_cache = (
+            PersistentCache(get_metadata_cache_path(), "metadata", metadata_cache_ttl)
+            if not no_cache
+            else None
+        )
+
         # Create instance
+        # Spotify requests go through a rate limited session,
+        # which backs off when spotify starts to throttle us
         self._instance = super().__call__(
             auth_manager=credential_manager,
-            status_forcelist=(429, 500, 502, 503, 504, 404),
+            requests_session=create_session(
+                retry_statuses=(429, 500, 502, 503, 504, 404)
+            ),
+            metadata_cache=metadata_cache,
         )
 
         # Return instance
@@ -119,13 +153,346 @@ class SpotifyClient(Spotify, metaclass=Singleton):
 
     _initialized = False
 
-    def __init__(self, *args, **kwargs):
+    def __init__(
+        self, *args, metadata_cache: Optional[PersistentCache] = None, **kwargs
+    ):
         """
         Initializes the SpotifyClient.
 
         ### Arguments
         - auth_manager: The auth manager to use.
+        - metadata_cache: The persistent cache for track, album and artist metadata.
         """
 
         super().__init__(*args, **kwargs)
+        self.metadata_cache = metadata_cache
+
+        # In-process memo of (pending) items, shared by all threads
+        self._memo: "OrderedDict[str, Future]" = OrderedDict()
+        self._memo_lock = threading.Lock()
+
         self._initialized = True
+
+    def track(self, track_id: str, market: Optional[str] = None):
+        """
+        Get track metadata, using the metadata cache if possible.
+
+        ### Arguments
+        - track_id: The track ID, URI or URL.
+        - market: An ISO 3166-1 alpha-2 country code.
+
+        ### Returns
+        - The track metadata.
+        """
+
+        return self._get_cached(
+            self._get_track_type(market),
+            self._get_id("track", track_id),
+            lambda item_id: super(SpotifyClient, self).track(item_id, market=market),
+        )
+
+    def album(self, album_id: str):
+        """
+        Get album metadata, using the metadata cache if possible.
+
+        ### Arguments
+        - album_id: The album ID, URI or URL.
+
+        ### Returns
+        - The album metadata.
+        """
+
+        return self._get_cached(
+            "album",
+            self._get_id("album", album_id),
+            lambda item_id: super(SpotifyClient, self).album(item_id),
+        )
+
+    def artist(self, artist_id: str):
+        """
+        Get artist metadata, using the metadata cache if possible.
+
+        ### Arguments
+        - artist_id: The artist ID, URI or URL.
+
+        ### Returns
+        - The artist metadata.
+        """
+
+        return self._get_cached(
+            "artist",
+            self._get_id("artist", artist_id),
+            lambda item_id: super(SpotifyClient, self).artist(item_id),
+        )
+
+    def tracks(self, tracks: List[str], market: Optional[str] = None):
+        """
+        Get metadata for multiple tracks, using the metadata cache if possible.
+
+        ### Arguments
+        - tracks: List of track IDs, URIs or URLs. Maximum: 50 IDs.
+        - market: An ISO 3166-1 alpha-2 country code.
+
+        ### Returns
+        - Dictionary with the list of tracks, in the same order as the IDs.
+        """
+
+        return {
+            "tracks": self._get_many_cached(
+                self._get_track_type(market),
+                [self._get_id("track", track) for track in tracks],
+                lambda ids: super(SpotifyClient, self).tracks(ids, market=market)[
+                    "tracks"
+                ],
+            )
+        }
+
+    def albums(self, albums: List[str]):
+        """
+        Get metadata for multiple albums, using the metadata cache if possible.
+
+        ### Arguments
+        - albums: List of album IDs, URIs or URLs. Maximum: 20 IDs.
+
+        ### Returns
+        - Dictionary with the list of albums, in the same order as the IDs.
+        """
+
+        return {
+            "albums": self._get_many_cached(
+                "album",
+                [self._get_id("album", album) for album in albums],
+                lambda ids: super(SpotifyClient, self).albums(ids)["albums"],
+            )
+        }
+
+    def artists(self, artists: List[str]):
+        """
+        Get metadata for multiple artists, using the metadata cache if possible.
+
+        ### Arguments
+        - artists: List of artist IDs, URIs or URLs. Maximum: 50 IDs.
+
+        ### Returns
+        - Dictionary with the list of artists, in the same order as the IDs.
+        """
+
+        return {
+            "artists": self._get_many_cached(
+                "artist",
+                [self._get_id("artist", artist) for artist in artists],
+                lambda ids: super(SpotifyClient, self).artists(ids)["artists"],
+            )
+        }
+
+    def get_all_items(self, response: Dict[str, Any]) -> List[Any]:
+        """
+        Get the items of all pages of a paged response.
+        The offsets of the remaining pages are computed from the first page,
+        and the pages are fetched concurrently.
+
+        ### Arguments
+        - response: The first page of a paged response.
+
+        ### Returns
+        - The items of all pages, in order.
+        """
+
+        items = list(response["items"])
+        if not response.get("next"):
+            return items
+
+        # Build the urls of the remaining pages from the url of the next page
+        next_url = urlparse(response["next"])
+        query = parse_qs(next_url.query)
+        limit = response["limit"]
+        first_offset = int(query.get("offset", [response["offset"] + limit])[0])
+
+        page_urls = []
+        for offset in range(first_offset, response["total"], limit):
+            query["offset"] = [str(offset)]
+            page_urls.append(
+                next_url._replace(query=urlencode(query, doseq=True)).geturl()
+            )
+
+        with ThreadPoolExecutor(max_workers=PAGINATION_WORKERS) as executor:
+            for page in executor.map(self._get_page, page_urls):
+                items.extend(page["items"])
+
+        return items
+
+    def _get_page(self, url: str) -> Dict[str, Any]:
+        """
+        Get a page of a paged response, failed requests are retried.
+
+        ### Arguments
+        - url: The url of the page.
+
+        ### Returns
+        - The page.
+
+        ### Errors
+        - SpotifyError if the page couldn't be fetched.
+        """
+
+        for _ in range(PAGE_RETRIES + 1):
+            page = self._get(url)
+            if page is not None:
+                return page
+
+        raise SpotifyError(f"Failed to get page: {url}")
+
+    @staticmethod
+    def _get_track_type(market: Optional[str]) -> str:
+        """
+        Get the item type used in the cache keys of tracks.
+        Track metadata depends on the market (availability, relinked tracks),
+        so tracks fetched for a market are cached separately.
+
+        ### Arguments
+        - market: An ISO 3166-1 alpha-2 country code.
+
+        ### Returns
+        - The item type of the tracks.
+        """
+
+        return "track" if market is None else f"track@{market.upper()}"
+
+    def _get_cached(
+        self,
+        item_type: str,
+        item_id: str,
+        fetch: Callable[[str], Optional[Dict[str, Any]]],
+    ) -> Optional[Dict[str, Any]]:
+        """
+        Get an item from the metadata cache or fetch it from Spotify.
+
+        ### Arguments
+        - item_type: The type of the item (track, album, artist).
+        - item_id: The Spotify ID of the item.
+        - fetch: Function that fetches the item from Spotify.
+
+        ### Returns
+        - The item metadata or None if Spotify didn't return anything.
+        """
+
+        return self._get_many_cached(
+            item_type, [item_id], lambda item_ids: [fetch(item_ids[0])]
+        )[0]
+
+    def _get_many_cached(
+        self,
+        item_type: str,
+        item_ids: List[str],
+        fetch_many: Callable[[List[str]], List[Optional[Dict[str, Any]]]],
+    ) -> List[Optional[Dict[str, Any]]]:
+        """
+        Get multiple items from the in-process memo or the metadata cache
+        and fetch the missing ones from Spotify in a single request.
+
+        ### Arguments
+        - item_type: The type of the items (track, album, artist).
+        - item_ids: The Spotify IDs of the items.
+        - fetch_many: Function that fetches a list of items from Spotify.
+
+        ### Returns
+        - List of items (or None for unknown IDs) in the same order as `item_ids`.
+
+        ### Notes
+        - If another thread is already fetching one of the items,
+            we wait for its result instead of requesting it again.
+        """
+
+        keys = {item_id: f"{item_type}:{item_id}" for item_id in item_ids}
+
+        # Claim the items that nobody is fetching yet,
+        # and collect futures for all of them
+        futures: Dict[str, Future] = {}
+        claimed: Dict[str, Future] = {}
+        with self._memo_lock:
+            for item_id, key in keys.items():
+                future = self._memo.get(key)
+                if future is None:
+                    future = Future()
+                    self._memo[key] = future
+                    claimed[item_id] = future
+                else:
+                    self._memo.move_to_end(key)
+
+                futures[item_id] = future
+
+        if claimed:
+            try:
+                self._resolve_items(item_type, claimed, fetch_many)
+            except Exception as exception:
+                with self._memo_lock:
+                    for item_id, future in claimed.items():
+                        self._memo.pop(keys[item_id], None)
+                        future.set_exception(exception)
+
+                raise
+
+            self._trim_memo()
+
+        return [futures[item_id].result() for item_id in item_ids]
+
+    def _resolve_items(
+        self,
+        item_type: str,
+        claimed: Dict[str, Future],
+        fetch_many: Callable[[List[str]], List[Optional[Dict[str, Any]]]],
+    ) -> None:
+        """
+        Resolve claimed futures using the metadata cache and Spotify.
+
+        ### Arguments
+        - item_type: The type of the items (track, album, artist).
+        - claimed: Futures of the items claimed by the current thread.
+        - fetch_many: Function that fetches a list of items from Spotify.
+        """
+
+        items: Dict[str, Optional[Dict[str, Any]]] = {}
+
+        if self.metadata_cache is not None:
+            cached = self.metadata_cache.get_many(
+                f"{item_type}:{item_id}" for item_id in claimed
+            )
+            for key, value in cached.items():
+                items[key.split(":", 1)[1]] = value
+
+        missing_ids = [item_id for item_id in claimed if item_id not in items]
+        if missing_ids:
+            fetched = fetch_many(missing_ids)
+            items.update(zip(missing_ids, fetched))
+
+            if self.metadata_cache is not None:
+                self.metadata_cache.set_many(
+                    {
+                        f"{item_type}:{item_id}": item
+                        for item_id, item in zip(missing_ids, fetched)
+                        if item is not None
+                    }
+                )
+
+        with self._memo_lock:
+            for item_id, future in claimed.items():
+                item = items.get(item_id)
+
+                # Don't memoize unknown items, they might be a temporary error
+                if item is None:
+                    self._memo.pop(f"{item_type}:{item_id}", None)
+
+                future.set_result(item)
+
+    def _trim_memo(self) -> None:
+        """
+        Remove the oldest resolved items from the memo if it's over its limit.
+        """
+
+        with self._memo_lock:
+            for key in list(self._memo):
+                if len(self._memo) <= MEMO_SIZE:
+                    break
+
+                if self._memo[key].done():
+                    del self._memo[key]
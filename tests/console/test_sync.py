@@ -0,0 +1,134 @@
+from spotdl.console import sync as sync_module
+from spotdl.console.sync import parse_sync_query
+from spotdl.utils.library import LibraryIndex
+from spotdl.utils.search import create_empty_song
+
+PLAYLIST_URL = "https://open.spotify.com/playlist/37i9dQZF1DX0XUsuxWHRQd"
+
+
+def test_parse_sync_query(tmp_path, monkeypatch):
+    """
+    Test that unchanged playlists are loaded from the library index
+    and only the added tracks of changed playlists are resolved.
+    """
+
+    playlist = {"snapshot_id": "1", "tracks": [{"id": "a"}, {"id": "b"}]}
+    resolved = []
+
+    def list_from_tracks(tracks, threads=1):
+        resolved.append([track["id"] for track in tracks])
+        return [
+            create_empty_song(name=track["id"], song_id=track["id"]) for track in tracks
+        ]
+
+    monkeypatch.setattr(
+        sync_module.Playlist, "get_snapshot_id", lambda url: playlist["snapshot_id"]
+    )
+    monkeypatch.setattr(
+        sync_module.Playlist, "get_tracks", lambda url: playlist["tracks"]
+    )
+    monkeypatch.setattr(sync_module.Song, "list_from_tracks", list_from_tracks)
+
+    library = LibraryIndex(tmp_path)
+
+    songs = parse_sync_query([PLAYLIST_URL + "?si=1"], library)
+    assert [song.song_id for song in songs] == ["a", "b"]
+    assert resolved == [["a", "b"]]
+
+    # Unchanged snapshot, nothing is fetched
+    playlist["tracks"] = None
+    songs = parse_sync_query([PLAYLIST_URL], library)
+    assert [song.song_id for song in songs] == ["a", "b"]
+    assert resolved == [["a", "b"]]
+
+    # Changed snapshot, only the added track is resolved
+    playlist["snapshot_id"] = "2"
+    playlist["tracks"] = [{"id": "c"}, {"id": "a"}]
+    songs = parse_sync_query([PLAYLIST_URL], library)
+    assert [song.song_id for song in songs] == ["c", "a"]
+    assert resolved == [["a", "b"], ["c"]]
+
+    assert library.get_playlist(PLAYLIST_URL).snapshot_id == "2"
+    library.close()
+
+
+class FakeProgressHandler:
+    def __init__(self):
+        self.messages = []
+
+    def log(self, message):
+        self.messages.append(message)
+
+    debug = log
+    error = log
+
+
+class FakeDownloader:
+    """
+    Downloader that records the songs it would update or download.
+    """
+
+    def __init__(self, library_path):
+        self.library = LibraryIndex(library_path)
+        self.output = str(library_path / "{title}.{output-ext}")
+        self.output_format = "mp3"
+        self.overwrite = "skip"
+        self.search_threads = 1
+        self.progress_handler = FakeProgressHandler()
+
+        self.updated = []
+        self.downloaded = []
+
+    def open_library(self):
+        return self.library
+
+    def create_output_file(self, song):
+        return self.library.directory / f"{song.name}.mp3"
+
+    def update_metadata(self, song, path):
+        self.updated.append(song.song_id)
+        if song.song_id == "broken":
+            raise ValueError("can't write tags")
+
+        self.library.add(song, path, self.output_format)
+
+    def download_multiple_songs(self, songs):
+        self.downloaded.extend(song.song_id for song in songs)
+
+
+def test_sync_updates(tmp_path, monkeypatch):
+    """
+    Test that changed songs are updated and that a failed update
+    doesn't stop the sync.
+    """
+
+    downloader = FakeDownloader(tmp_path)
+    songs = {
+        song_id: create_empty_song(name=song_id, song_id=song_id)
+        for song_id in ["broken", "changed", "unchanged", "new"]
+    }
+
+    for song_id in ["broken", "changed", "unchanged"]:
+        path = tmp_path / f"{song_id}.mp3"
+        path.write_bytes(b"audio")
+        downloader.library.add(songs[song_id], path, "mp3")
+
+    songs["broken"].album_name = "New album"
+    (tmp_path / "changed.mp3").write_bytes(b"edited audio")
+
+    monkeypatch.setattr(
+        sync_module,
+        "parse_sync_query",
+        lambda query, library, threads: list(songs.values()),
+    )
+
+    sync_module.sync(["query"], downloader, tmp_path)  # type: ignore
+
+    assert downloader.updated == ["broken", "changed"]
+    assert downloader.downloaded == ["new"]
+    assert any(
+        msg.endswith("broken: can't write tags")
+        for msg in downloader.progress_handler.messages
+    )
+
+    downloader.library.close()
@@ -0,0 +1,484 @@
+import os
+import time
+
+import pytest
+
+import spotdl.download.downloader
+from spotdl.download.downloader import Downloader
+from spotdl.download.journal import STAGE_TAGGED, DownloadJournal, JournalEntry
+from spotdl.download.pipeline import Pipeline, Stage
+from spotdl.utils.savefile import load_songs
+from spotdl.utils.search import create_empty_song
+
+
+def test_downloader_stage_limits():
+    """
+    Test that every pipeline stage gets its own concurrency limit.
+    """
+
+    downloader = Downloader(
+        audio_providers=["youtube"],
+        ffmpeg="ffmpeg-test",
+        no_search_cache=True,
+        threads=3,
+        search_threads=2,
+        download_threads=5,
+        transcode_workers=7,
+        simple_tui=True,
+    )
+
+    workers = {stage.name: stage.workers for stage in downloader.stages}
+
+    assert workers == {
+        "resolve": 2,
+        "search": 2,
+        "fetch": 5,
+        "probe": 5,
+        "transcode": 7,
+        "tag": 5,
+        "finalize": 1,
+    }
+    assert downloader.thread_executor._max_workers == sum(workers.values())
+
+    defaults = Downloader(
+        audio_providers=["youtube"],
+        ffmpeg="ffmpeg-test",
+        no_search_cache=True,
+        threads=3,
+        simple_tui=True,
+    )
+
+    assert defaults.search_threads == 3
+    assert defaults.download_threads == 3
+    assert defaults.transcode_workers == (os.cpu_count() or 1)
+
+
+def test_downloader_close():
+    """
+    Test that closing the downloader stops its worker threads.
+    """
+
+    downloader = Downloader(
+        audio_providers=["youtube"],
+        ffmpeg="ffmpeg-test",
+        no_search_cache=True,
+        simple_tui=True,
+    )
+
+    downloader.close()
+
+    assert not downloader.transcode_pool.dispatcher.is_alive()
+    with pytest.raises(RuntimeError):
+        downloader.thread_executor.submit(time.sleep, 0)
+    with pytest.raises(RuntimeError):
+        downloader.lyrics_executor.submit(time.sleep, 0)
+
+
+class FakeProvider:
+    """
+    Audio provider that counts the searches.
+    """
+
+    name = "FakeProvider"
+
+    def __init__(self, results):
+        self.results = results
+        self.searches = 0
+        self.healthy = None
+
+    def search_with_score(self, song):
+        self.searches += 1
+        url = self.results.get(song.song_id)
+        return url, 90.0 if url else None
+
+
+def test_downloader_search_cache(monkeypatch, tmp_path):
+    """
+    Test that search results (also failed ones) are cached.
+    """
+
+    monkeypatch.setattr(
+        spotdl.download.downloader,
+        "get_search_cache_path",
+        lambda: tmp_path / "search.db",
+    )
+
+    downloader = Downloader(
+        audio_providers=["youtube"], ffmpeg="ffmpeg-test", simple_tui=True
+    )
+
+    provider = FakeProvider({"found": "https://youtube.com/watch?v=found"})
+    downloader.audio_providers = [provider]  # type: ignore
+
+    found = create_empty_song(name="Found", artists=["Artist"], song_id="found")
+    missing = create_empty_song(name="Missing", artists=["Artist"], song_id="missing")
+
+    for _ in range(2):
+        assert downloader.search(found) == (
+            "https://youtube.com/watch?v=found",
+            provider,
+        )
+        with pytest.raises(LookupError):
+            downloader.search(missing)
+
+    assert provider.searches == 2
+    assert downloader.search_cache.get(
+        downloader.get_search_cache_key(provider, found)
+    ) == {
+        "url": "https://youtube.com/watch?v=found",
+        "score": 90.0,
+    }
+
+    # Results are cached per filtering mode and output format
+    downloader.filter_results = False
+    downloader.search(found)
+    downloader.output_format = "flac"
+    downloader.search(found)
+
+    assert provider.searches == 4
+
+    # Bypassing the cache searches again
+    uncached = Downloader(
+        audio_providers=["youtube"],
+        ffmpeg="ffmpeg-test",
+        simple_tui=True,
+        no_search_cache=True,
+    )
+    uncached.audio_providers = [provider]  # type: ignore
+    uncached.search(found)
+
+    assert provider.searches == 5
+
+    # Purging removes the cached results
+    Downloader(
+        audio_providers=["youtube"],
+        ffmpeg="ffmpeg-test",
+        simple_tui=True,
+        purge_search_cache=True,
+    )
+    downloader.search(found)
+
+    assert provider.searches == 6
+
+
+class FakeLyricsProvider:
+    """
+    Lyrics provider that returns the given lyrics after a delay.
+    """
+
+    def __init__(self, name, lyrics, delay=0.0):
+        self.name = name
+        self.lyrics = lyrics
+        self.delay = delay
+
+        self.queries = 0
+
+    def get_lyrics(self, name, artists, **_):
+        self.queries += 1
+        time.sleep(self.delay)
+        if isinstance(self.lyrics, Exception):
+            raise self.lyrics
+
+        return self.lyrics
+
+
+def test_downloader_lyrics_priority():
+    """
+    Test that lyrics providers are queried concurrently
+    and that the provider order decides which lyrics are used.
+    """
+
+    downloader = Downloader(
+        audio_providers=["youtube"],
+        ffmpeg="ffmpeg-test",
+        no_search_cache=True,
+        simple_tui=True,
+    )
+
+    song = create_empty_song(name="name", artists=["artist"], song_id="id")
+
+    downloader.lyrics_providers = [
+        FakeLyricsProvider("slow", "slow lyrics", delay=0.2),
+        FakeLyricsProvider("fast", "fast lyrics"),
+    ]
+    assert downloader.search_lyrics(song) == "slow lyrics"
+
+    downloader.lyrics_providers = [
+        FakeLyricsProvider("missing", None, delay=0.1),
+        FakeLyricsProvider("fast", "fast lyrics"),
+    ]
+    assert downloader.search_lyrics(song) == "fast lyrics"
+
+    downloader.lyrics_providers = [FakeLyricsProvider("missing", None)]
+    with pytest.raises(LookupError):
+        downloader.search_lyrics(song)
+
+
+def test_downloader_lyrics_cancel():
+    """
+    Test that queued queries of providers with lower priority
+    are cancelled once the lyrics are found.
+    """
+
+    downloader = Downloader(
+        audio_providers=["youtube"],
+        ffmpeg="ffmpeg-test",
+        no_search_cache=True,
+        download_threads=1,
+        simple_tui=True,
+    )
+
+    assert downloader.lyrics_executor._max_workers == 1
+
+    found = FakeLyricsProvider("found", "lyrics", delay=0.1)
+    unused = FakeLyricsProvider("unused", "other lyrics")
+    downloader.lyrics_providers = [found, unused]
+
+    song = create_empty_song(name="name", artists=["artist"], song_id="id")
+    assert downloader.search_lyrics(song) == "lyrics"
+
+    downloader.lyrics_executor.shutdown(wait=True)
+    assert unused.queries == 0
+
+
+def test_downloader_lyrics_cache(monkeypatch, tmp_path):
+    """
+    Test that lyrics (also missing ones) are cached per provider.
+    """
+
+    monkeypatch.setattr(
+        spotdl.download.downloader,
+        "get_lyrics_cache_path",
+        lambda: tmp_path / "lyrics.db",
+    )
+    monkeypatch.setattr(
+        spotdl.download.downloader,
+        "get_search_cache_path",
+        lambda: tmp_path / "search.db",
+    )
+
+    downloader = Downloader(
+        audio_providers=["youtube"], ffmpeg="ffmpeg-test", simple_tui=True
+    )
+
+    missing = FakeLyricsProvider("missing", None)
+    found = FakeLyricsProvider("found", "lyrics")
+    downloader.lyrics_providers = [missing, found]
+
+    song = create_empty_song(name="name", artists=["artist"], song_id="id")
+    assert downloader.search_lyrics(song) == "lyrics"
+
+    missing.get_lyrics = found.get_lyrics = None
+    assert downloader.search_lyrics(song) == "lyrics"
+    assert downloader.lyrics_cache.get("missing|id") == {"lyrics": None}
+
+    # Missing lyrics aren't cached if another provider failed
+    broken = FakeLyricsProvider("broken", ConnectionError("timed out"))
+    missing = FakeLyricsProvider("missing", None)
+    downloader.lyrics_providers = [broken, missing]
+
+    other = create_empty_song(name="name", artists=["artist"], song_id="other")
+    with pytest.raises(LookupError):
+        downloader.search_lyrics(other)
+
+    assert downloader.lyrics_cache.get("broken|other") is None
+    assert downloader.lyrics_cache.get("missing|other") is None
+
+    # and are cached once every provider answered
+    broken.lyrics = None
+    with pytest.raises(LookupError):
+        downloader.search_lyrics(other)
+
+    assert downloader.lyrics_cache.get("broken|other") == {"lyrics": None}
+    assert downloader.lyrics_cache.get("missing|other") == {"lyrics": None}
+
+
+class BrokenProvider(FakeProvider):
+    """
+    Audio provider that can't connect to its API.
+    """
+
+    name = "BrokenProvider"
+
+    def search_with_score(self, song):
+        self.searches += 1
+        raise ConnectionError("no connection")
+
+
+def test_downloader_lazy_providers():
+    """
+    Test that creating the downloader doesn't connect to the audio providers
+    and that providers which fail their first search are skipped.
+    """
+
+    downloader = Downloader(
+        audio_providers=["youtube-music", "soundcloud"],
+        ffmpeg="ffmpeg-test",
+        no_search_cache=True,
+        simple_tui=True,
+    )
+
+    assert all(provider._client is None for provider in downloader.audio_providers)
+
+    broken = BrokenProvider({})
+    working = FakeProvider({"1": "https://youtube.com/watch?v=1"})
+    downloader.audio_providers = [broken, working]
+
+    song = create_empty_song(name="name", artists=["artist"], song_id="1")
+
+    assert downloader.search(song) == ("https://youtube.com/watch?v=1", working)
+    assert downloader.search(song) == ("https://youtube.com/watch?v=1", working)
+    assert broken.healthy is False
+    assert broken.searches == 1
+    assert working.healthy is True
+
+
+class FlakyProvider(FakeProvider):
+    """
+    Audio provider whose searches fail while it's offline.
+    """
+
+    name = "FlakyProvider"
+
+    def __init__(self, results):
+        super().__init__(results)
+        self.offline = False
+
+    def search_with_score(self, song):
+        if self.offline:
+            self.searches += 1
+            raise ConnectionError("timed out")
+
+        return super().search_with_score(song)
+
+
+def test_downloader_provider_fails_later():
+    """
+    Test that a provider failing after it worked before falls back
+    to the next provider for that song only, and that the error is raised
+    if no provider is left.
+    """
+
+    downloader = Downloader(
+        audio_providers=["youtube"],
+        ffmpeg="ffmpeg-test",
+        no_search_cache=True,
+        simple_tui=True,
+    )
+
+    flaky = FlakyProvider(
+        {"1": "https://youtube.com/watch?v=1", "3": "https://youtube.com/watch?v=3"}
+    )
+    working = FakeProvider({"2": "https://youtube.com/watch?v=2"})
+    downloader.audio_providers = [flaky, working]
+
+    first = create_empty_song(name="name", artists=["artist"], song_id="1")
+    second = create_empty_song(name="name", artists=["artist"], song_id="2")
+    third = create_empty_song(name="name", artists=["artist"], song_id="3")
+
+    assert downloader.search(first) == ("https://youtube.com/watch?v=1", flaky)
+
+    flaky.offline = True
+    assert downloader.search(second) == ("https://youtube.com/watch?v=2", working)
+    assert flaky.healthy is True
+
+    # The provider is used again for the next song
+    flaky.offline = False
+    assert downloader.search(third) == ("https://youtube.com/watch?v=3", flaky)
+    assert flaky.searches == 3
+
+    flaky.offline = True
+    downloader.audio_providers = [flaky]
+    with pytest.raises(ConnectionError):
+        downloader.search(second)
+
+
+def test_downloader_journal_resume(tmp_path):
+    """
+    Test that songs in the journal continue after their last completed stage.
+    """
+
+    url = "https://open.spotify.com/track/1"
+    song = create_empty_song(
+        name="name", artists=["artist"], song_id="1", url=url, genres=[]
+    )
+    output_file = tmp_path / "artist - name.mp3"
+    part_file = tmp_path / "artist - name.part.mp3"
+    part_file.write_bytes(b"audio")
+
+    journal = DownloadJournal(tmp_path / "download.journal")
+    journal.record(
+        url,
+        JournalEntry(
+            STAGE_TAGGED,
+            {**song.json, "download_url": "https://youtube.com/watch?v=1"},
+            url="https://youtube.com/watch?v=1",
+            audio_provider="FakeProvider",
+            part_file=str(part_file),
+        ),
+    )
+    journal.close()
+
+    downloader = Downloader(
+        audio_providers=["youtube"],
+        ffmpeg="ffmpeg-test",
+        output=str(tmp_path / "{artists} - {title}.{output-ext}"),
+        no_search_cache=True,
+        simple_tui=True,
+        journal=str(tmp_path / "download.journal"),
+    )
+
+    provider = FakeProvider({})
+    downloader.audio_providers = [provider]
+
+    # The placeholder would have to be fetched from spotify without the journal
+    placeholder = create_empty_song(url=url)
+
+    result_song, path = downloader.search_and_download(placeholder)
+
+    assert path == output_file
+    assert output_file.read_bytes() == b"audio"
+    assert not part_file.exists()
+    assert result_song.name == "name"
+    assert result_song.download_url == "https://youtube.com/watch?v=1"
+    assert provider.searches == 0
+    assert downloader.journal.get(url) is None
+
+
+def test_downloader_save_file(tmp_path):
+    """
+    Test that finished songs are written to the save file.
+    """
+
+    save_file = tmp_path / "songs.spotdl"
+
+    downloader = Downloader(
+        audio_providers=["youtube"],
+        ffmpeg="ffmpeg-test",
+        no_search_cache=True,
+        simple_tui=True,
+        save_file=str(save_file),
+    )
+
+    written = []
+
+    def finalize(job):
+        written.append(list(load_songs(save_file.with_name("songs.spotdl.part"))))
+        return True
+
+    downloader.pipeline = Pipeline(
+        [Stage("finalize", finalize, 1)],
+        downloader.loop,
+        downloader.thread_executor,
+        downloader.handle_error,
+        downloader.save_result,
+    )
+
+    songs = [
+        create_empty_song(name=f"name {index}", artists=["artist"], song_id=str(index))
+        for index in range(2)
+    ]
+    downloader.download_multiple_songs(iter(songs))
+
+    assert written == [[], songs[:1]]
+    assert list(load_songs(save_file)) == songs
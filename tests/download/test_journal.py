@@ -0,0 +1,65 @@
+import json
+
+import pytest
+
+from spotdl.download.journal import (
+    STAGE_MATCHED,
+    STAGE_RESOLVED,
+    STAGE_TAGGED,
+    DownloadJournal,
+    JournalEntry,
+    JournalError,
+)
+
+
+def test_journal_entry_reached():
+    """
+    Test that later stages include the earlier ones.
+    """
+
+    entry = JournalEntry(STAGE_MATCHED, {})
+
+    assert entry.reached(STAGE_RESOLVED)
+    assert entry.reached(STAGE_MATCHED)
+    assert not entry.reached(STAGE_TAGGED)
+
+
+def test_journal_round_trip(tmp_path):
+    """
+    Test that the journal is written atomically and read back on restart.
+    """
+
+    path = tmp_path / "download.journal"
+
+    journal = DownloadJournal(path, flush_interval=3600)
+    journal.record("a", JournalEntry(STAGE_RESOLVED, {"name": "a"}))
+    assert path.is_file()
+
+    # Writes within the flush interval are delayed
+    journal.record("b", JournalEntry(STAGE_MATCHED, {"name": "b"}, url="url"))
+    journal.remove("a")
+    assert list(json.loads(path.read_text())["songs"]) == ["a"]
+
+    journal.flush()
+    assert list(tmp_path.iterdir()) == [path]
+
+    restarted = DownloadJournal(path)
+    assert restarted.get("a") is None
+    assert restarted.get("b") == JournalEntry(STAGE_MATCHED, {"name": "b"}, url="url")
+
+    # The journal is removed once every song is finished
+    restarted.remove("b")
+    restarted.close()
+    assert not path.exists()
+
+
+def test_journal_invalid(tmp_path):
+    """
+    Test that an invalid journal isn't silently ignored.
+    """
+
+    path = tmp_path / "download.journal"
+    path.write_text("[]")
+
+    with pytest.raises(JournalError):
+        DownloadJournal(path)
@@ -0,0 +1,125 @@
+import asyncio
+import concurrent.futures
+import threading
+import time
+
+import pytest
+
+from spotdl.download.pipeline import Pipeline, PipelineError, Stage
+
+
+def make_pipeline(stages, error_handler=None, result_handler=None):
+    loop = asyncio.new_event_loop()
+    executor = concurrent.futures.ThreadPoolExecutor(
+        max_workers=max(1, sum(stage.workers for stage in stages))
+    )
+
+    return Pipeline(stages, loop, executor, error_handler, result_handler)
+
+
+def test_pipeline_order_and_concurrency():
+    """
+    Test that items keep their order and stages respect their worker limits.
+    """
+
+    lock = threading.Lock()
+    running = {"slow": 0, "fast": 0}
+    peak = {"slow": 0, "fast": 0}
+
+    def track(name, delay):
+        def function(item):
+            with lock:
+                running[name] += 1
+                peak[name] = max(peak[name], running[name])
+
+            time.sleep(delay)
+            item.append(name)
+
+            with lock:
+                running[name] -= 1
+
+            return True
+
+        return function
+
+    pipeline = make_pipeline(
+        [Stage("fast", track("fast", 0.001), 4), Stage("slow", track("slow", 0.01), 2)]
+    )
+
+    items = [[index] for index in range(20)]
+    results = pipeline.run(iter(items))
+
+    assert results == [[index, "fast", "slow"] for index in range(20)]
+    assert peak["slow"] <= 2
+    assert peak["fast"] <= 4
+
+
+def test_pipeline_stops_items():
+    """
+    Test that finished and failed items skip the remaining stages.
+    """
+
+    failed = []
+
+    def first(item):
+        if item["value"] == 2:
+            raise ValueError("failed")
+
+        return item["value"] % 2 == 0
+
+    def second(item):
+        item["second"] = True
+        return True
+
+    pipeline = make_pipeline(
+        [Stage("first", first, 2), Stage("second", second, 1)],
+        lambda item, exception: failed.append((item["value"], str(exception))),
+    )
+
+    results = pipeline.run([{"value": value} for value in range(5)])
+
+    assert [item.get("second", False) for item in results] == [
+        True,
+        False,
+        False,
+        False,
+        True,
+    ]
+    assert failed == [(2, "failed")]
+
+
+def test_pipeline_result_handler():
+    """
+    Test that every item is passed to the result handler once it's finished.
+    """
+
+    finished = []
+
+    def function(item):
+        if item == 2:
+            raise ValueError("failed")
+
+        time.sleep(0.01 * (3 - item))
+        return item != 1
+
+    pipeline = make_pipeline(
+        [Stage("first", function, 4), Stage("second", lambda item: True, 1)],
+        lambda item, exception: None,
+        finished.append,
+    )
+
+    assert pipeline.run(range(4)) == [0, 1, 2, 3]
+    assert finished[0] == 2
+    assert sorted(finished) == [0, 1, 2, 3]
+
+
+def test_pipeline_requires_stages():
+    """
+    Test that the pipeline can't be created without valid stages.
+    """
+
+    with pytest.raises(PipelineError):
+        make_pipeline([])
+
+    with pytest.raises(PipelineError):
+        make_pipeline([Stage("empty", lambda item: True, 0)])
@@ -1,5 +1,8 @@
+from types import SimpleNamespace
+
 from spotdl.providers.audio import SoundCloud
 from spotdl.types.song import Song
+from spotdl.utils.search import create_empty_song
 
 
 def test_find_song():
@@ -10,3 +13,101 @@ def test_find_song():
     results = provider.search(song)
 
     assert results == "https://soundcloud.com/salemilese/ps5-feat-alan-walker"
+
+
+class FakeClient:
+    """
+    SoundCloud client that returns the same tracks for every search
+    and records the album lookups.
+    """
+
+    def __init__(self, tracks):
+        self.tracks = tracks
+        self.album_lookups = []
+
+    def search(self, _):
+        return iter(self.tracks)
+
+    def get_track_albums(self, track_id):
+        self.album_lookups.append(track_id)
+        return iter([SimpleNamespace(title=f"album {track_id}")])
+
+
+def make_track(track_id, title, username, duration=180):
+    return SimpleNamespace(
+        id=track_id,
+        kind="track",
+        title=title,
+        permalink_url=f"https://soundcloud.com/{username}/{track_id}",
+        full_duration=duration,
+        user=SimpleNamespace(username=username, verified=False),
+    )
+
+
+def test_album_lookups():
+    """
+    Test that results are deduplicated
+    and albums are fetched only for matching results.
+    """
+
+    provider = SoundCloud()
+    provider._client = FakeClient(
+        [
+            make_track(1, "Ropes", "Dave Salem"),
+            make_track(2, "Ropes", "someone else"),
+            make_track(3, "Something different", "Salem Ilese"),
+        ]
+    )
+
+    results = provider.get_results("salem ilese - ropes")
+
+    assert [result["id"] for result in results] == [1, 2, 3]
+    assert provider.client.album_lookups == []
+
+    song = create_empty_song(
+        name="Ropes", artists=["Dave Salem"], album_name="album 1", duration=180
+    )
+    song.artist = "Dave Salem"
+
+    assert provider.order_results(results, song) == {
+        "https://soundcloud.com/Dave Salem/1": 100
+    }
+    assert provider.client.album_lookups == []
+
+    song.artist = "Dave Salm"
+    song.artists = ["Dave Salm"]
+
+    assert list(provider.order_results(results, song)) == [
+        "https://soundcloud.com/Dave Salem/1"
+    ]
+    assert provider.client.album_lookups == [1]
+    assert results[0]["album"] == "album 1"
+    assert "album" not in results[1]
+
+
+def test_perfect_match_not_first():
+    """
+    Test that a result from an artist of the song is returned on its own,
+    even if other matching results come before it.
+    """
+
+    provider = SoundCloud()
+    provider._client = FakeClient(
+        [
+            make_track(1, "Ropes", "Salem Ilse"),
+            make_track(2, "Ropes", "Salem Ilese"),
+            make_track(3, "Ropes (Remix)", "Salem Ilese"),
+        ]
+    )
+
+    results = provider.get_results("salem ilese - ropes")
+
+    song = create_empty_song(
+        name="Ropes", artists=["Salem Ilese"], album_name="album 2", duration=180
+    )
+    song.artist = "Salem Ilese"
+
+    assert provider.order_results(results, song) == {
+        "https://soundcloud.com/Salem Ilese/2": 100
+    }
+    assert provider.client.album_lookups == []
@@ -1,7 +1,13 @@
 # import pytest
 
+from types import SimpleNamespace
+
+from rapidfuzz import fuzz
+
+import spotdl.utils.providers
 from spotdl.providers.audio import YouTubeMusic
 from spotdl.types.song import Song
+from spotdl.utils.search import create_empty_song
 
 
 # @pytest.mark.vcr()
@@ -21,3 +27,48 @@ def test_find_song():
     results = provider.search(song)
 
     assert results == "https://youtube.com/watch?v=0h6XAAwX8II"
+
+
+def test_order_results_scorer_calls(monkeypatch):
+    """
+    Test that only the artists are compared for all results,
+    the other scores are computed for the results matching the artist.
+    """
+
+    calls = []
+
+    def partial_ratio(str1, str2, **kwargs):
+        calls.append((str1, str2))
+        return fuzz.partial_ratio(str1, str2, **kwargs)
+
+    monkeypatch.setattr(
+        spotdl.utils.providers, "fuzz", SimpleNamespace(partial_ratio=partial_ratio)
+    )
+    monkeypatch.setattr(spotdl.utils.providers, "numpy", None)
+    spotdl.utils.providers.cdist_available.cache_clear()
+
+    def make_result(link, artists):
+        return {
+            "name": "Ropes",
+            "type": "song",
+            "link": link,
+            "album": "Ropes",
+            "duration": 180,
+            "artists": artists,
+        }
+
+    results = [make_result("match", "Salem Ilese")] + [
+        make_result(f"other-{index}", "Someone Else") for index in range(5)
+    ]
+
+    song = create_empty_song(
+        name="Ropes", artists=["Salem Ilese"], album_name="Ropes", duration=180
+    )
+    song.artist = "Salem Ilese"
+
+    assert list(YouTubeMusic().order_results(results, song)) == ["match"]
+
+    # 6 artist matches, name, album and album name match of the matching result
+    assert len(calls) == 9
+
+    spotdl.utils.providers.cdist_available.cache_clear()
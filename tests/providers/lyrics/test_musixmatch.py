@@ -1,4 +1,5 @@
 import pytest
+import requests
 
 from spotdl.providers.lyrics.musixmatch import MusixMatch
 
@@ -10,3 +11,19 @@ def test_get_musixmatch_lyrics():
     musixmatch = MusixMatch()
 
     assert musixmatch.get_lyrics("Mortals", ["Warriyo"]) == lyrics
+
+
+def test_musixmatch_request_error(monkeypatch):
+    """
+    Test that failed requests are raised instead of reported as missing lyrics.
+    """
+
+    musixmatch = MusixMatch()
+
+    def get(*_, **__):
+        raise requests.ConnectionError("timed out")
+
+    monkeypatch.setattr(musixmatch.session, "get", get)
+
+    with pytest.raises(requests.RequestException):
+        musixmatch.get_lyrics("Mortals", ["Warriyo"])
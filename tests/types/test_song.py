@@ -1,4 +1,6 @@
-from spotdl.types.song import Song
+import json
+
+from spotdl.types.song import Song, SongError, SongList
 from spotdl.utils.spotify import SpotifyClient
 
 import pytest
@@ -253,3 +255,151 @@ def test_song_from_dict():
         == "https://i.scdn.co/image/ab67616d0000b273fe2cb38e4d2412dbb0e54332"
     )
     assert song.explicit == False
+
+
+def make_raw_track(index):
+    """
+    Creates a fake spotify track object.
+    """
+
+    return {
+        "id": f"track{index}",
+        "name": f"Track {index}",
+        "artists": [{"id": "artist0", "name": "Artist"}],
+        "album": {"id": f"album{index % 2}"},
+        "disc_number": 1,
+        "duration_ms": 1000,
+        "track_number": index + 1,
+        "explicit": False,
+        "external_ids": {"isrc": f"ISRC{index}"},
+        "external_urls": {"spotify": f"https://open.spotify.com/track/track{index}"},
+    }
+
+
+class FakeSpotifyClient:
+    """
+    Fake spotify client that records the batch requests.
+    """
+
+    calls = []
+
+    def tracks(self, ids):
+        self.calls.append(("tracks", len(ids)))
+        return {"tracks": [make_raw_track(int(i.split("track")[-1])) for i in ids]}
+
+    def albums(self, ids):
+        self.calls.append(("albums", len(ids)))
+        return {
+            "albums": [
+                {
+                    "id": album_id,
+                    "name": album_id,
+                    "artists": [{"name": "Artist"}],
+                    "copyrights": [],
+                    "genres": [],
+                    "tracks": {"items": [{"disc_number": 1}]},
+                    "release_date": "2021-10-28",
+                    "total_tracks": 60,
+                    "label": "NCS",
+                    "images": [{"url": "cover"}],
+                }
+                for album_id in ids
+            ]
+        }
+
+    def artists(self, ids):
+        self.calls.append(("artists", len(ids)))
+        return {"artists": [{"id": i, "genres": ["edm"]} for i in ids]}
+
+
+@pytest.fixture()
+def fake_spotify_client(monkeypatch):
+    FakeSpotifyClient.calls = []
+    monkeypatch.setattr("spotdl.types.song.SpotifyClient", FakeSpotifyClient)
+    yield FakeSpotifyClient
+
+
+def test_song_list_from_urls(fake_spotify_client):
+    """
+    Tests if Song.list_from_urls() batches and deduplicates requests.
+    """
+
+    urls = [f"https://open.spotify.com/track/track{index}" for index in range(60)]
+    songs = Song.list_from_urls(urls)
+
+    assert [song.song_id for song in songs] == [f"track{i}" for i in range(60)]
+    assert songs[1].album_name == "album1"
+    assert songs[0].genres == ["edm"]
+    assert fake_spotify_client.calls == [
+        ("tracks", 50),
+        ("tracks", 10),
+        ("albums", 2),
+        ("artists", 1),
+    ]
+
+
+def test_song_list_from_tracks(fake_spotify_client):
+    """
+    Tests if Song.list_from_tracks() only fetches the missing data.
+    """
+
+    songs = Song.list_from_tracks(
+        [make_raw_track(0), "https://open.spotify.com/track/track1", make_raw_track(2)]
+    )
+
+    assert [song.song_id for song in songs] == ["track0", "track1", "track2"]
+    assert fake_spotify_client.calls == [
+        ("tracks", 1),
+        ("albums", 2),
+        ("artists", 1),
+    ]
+
+
+def test_song_json_song_list(fake_spotify_client):
+    """
+    Tests if Song.json references the song list by url and doesn't copy the songs.
+    """
+
+    songs = Song.list_from_tracks([make_raw_track(0), make_raw_track(2)])
+    song_list = SongList(
+        name="list", url="https://open.spotify.com/playlist/list", urls=[], songs=songs
+    )
+    song = songs[0]
+    song.song_list = song_list
+
+    assert not hasattr(song, "__dict__")
+    assert song.json["song_list"] == song_list.url
+    assert song.json["artists"] is song.artists
+
+    # Songs of the same album share their values
+    assert songs[0].album_name is songs[1].album_name
+
+    loaded = Song.from_dict(json.loads(json.dumps(song.json)))
+    assert loaded.song_list is None
+    assert loaded == Song.from_dict({**song.json, "song_list": None})
+
+    loaded = Song.from_dict(song.json, {song_list.url: song_list})
+    assert loaded.song_list is song_list
+
+    # Older save files contain the whole song list
+    legacy = Song.from_dict({**song.json, "song_list": {"url": song_list.url}})
+    assert legacy.song_list is None
+
+
+def test_song_from_search_term_missing_album(fake_spotify_client, monkeypatch):
+    """
+    Tests if Song.from_search_term() raises SongError when the track is dropped.
+    """
+
+    monkeypatch.setattr(
+        FakeSpotifyClient,
+        "search",
+        lambda self, term: {"tracks": {"items": [make_raw_track(0)]}},
+        raising=False,
+    )
+    monkeypatch.setattr(
+        FakeSpotifyClient, "albums", lambda self, ids: {"albums": [None] * len(ids)}
+    )
+
+    with pytest.raises(SongError):
+        Song.from_search_term("track 0")
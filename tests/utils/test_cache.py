@@ -0,0 +1,90 @@
+import time
+
+import pytest
+
+from spotdl.utils.cache import CacheError, PersistentCache
+
+
+def test_cache_set_get(tmp_path):
+    """
+    Test if values can be stored and retrieved.
+    """
+
+    cache = PersistentCache(tmp_path / "cache.db", "tracks")
+
+    cache.set("track:1", {"name": "Ropes"})
+    cache.set_many({"track:2": {"name": "PS5"}, "track:3": ["a", "b"]})
+
+    assert cache.get("track:1") == {"name": "Ropes"}
+    assert cache.get("track:4") is None
+    assert cache.get_many(["track:2", "track:3", "track:4"]) == {
+        "track:2": {"name": "PS5"},
+        "track:3": ["a", "b"],
+    }
+
+
+def test_cache_expiry(tmp_path, monkeypatch):
+    """
+    Test if expired entries are not returned and can be purged.
+    """
+
+    cache = PersistentCache(tmp_path / "cache.db", "tracks", ttl=10)
+    cache.set("track:1", {"name": "Ropes"})
+    cache.set("track:2", {"name": "PS5"}, ttl=1000)
+
+    now = time.time()
+    monkeypatch.setattr(time, "time", lambda: now + 100)
+
+    assert cache.get("track:1") is None
+    assert cache.get("track:2") == {"name": "PS5"}
+    assert cache.purge_expired() == 1
+
+
+def test_cache_persistence(tmp_path):
+    """
+    Test if entries survive reopening the database.
+    """
+
+    cache = PersistentCache(tmp_path / "cache.db", "tracks")
+    cache.set("track:1", {"name": "Ropes"})
+    cache.close()
+
+    cache = PersistentCache(tmp_path / "cache.db", "tracks")
+    assert cache.get("track:1") == {"name": "Ropes"}
+
+    cache.clear()
+    assert cache.get("track:1") is None
+
+
+def test_cache_invalid_table(tmp_path):
+    """
+    Test if invalid table names are rejected.
+    """
+
+    with pytest.raises(CacheError):
+        PersistentCache(tmp_path / "cache.db", "tracks; DROP TABLE x")
+
+
+def test_cache_compression(tmp_path):
+    """
+    Test if compressed values are stored as blobs and read back.
+    """
+
+    cache = PersistentCache(tmp_path / "cache.db", "lyrics", compress=True)
+    cache.set("lyrics:1", {"lyrics": "la la la\n" * 100})
+    cache.set("lyrics:2", {"lyrics": None})
+
+    value = cache.connection.execute(
+        "SELECT value FROM lyrics WHERE key = 'lyrics:1'"
+    ).fetchone()[0]
+
+    assert isinstance(value, bytes)
+    assert len(value) < 100
+    assert cache.get("lyrics:1") == {"lyrics": "la la la\n" * 100}
+    assert cache.get("lyrics:2") == {"lyrics": None}
+
+    # Values stored without compression are still readable
+    cache.compress = False
+    cache.set("lyrics:3", {"lyrics": "text"})
+    cache.compress = True
+    assert cache.get("lyrics:3") == {"lyrics": "text"}
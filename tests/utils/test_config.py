@@ -39,6 +39,38 @@ def test_get_cache_path(setup):
     assert get_cache_path() == Path(setup.directory, ".spotdl", ".spotipy")
 
 
+def test_get_metadata_cache_path(setup):
+    """
+    Tests if the path to the metadata cache database is correct.
+    """
+
+    assert get_metadata_cache_path() == Path(setup.directory, ".spotdl", "metadata.db")
+
+
+def test_get_search_cache_path(setup):
+    """
+    Tests if the path to the search cache database is correct.
+    """
+
+    assert get_search_cache_path() == Path(setup.directory, ".spotdl", "search.db")
+
+
+def test_get_lyrics_cache_path(setup):
+    """
+    Tests if the path to the lyrics cache database is correct.
+    """
+
+    assert get_lyrics_cache_path() == Path(setup.directory, ".spotdl", "lyrics.db")
+
+
+def test_get_covers_path(setup):
+    """
+    Tests if the path to the covers folder is correct.
+    """
+
+    assert get_covers_path() == Path(setup.directory, ".spotdl", "covers")
+
+
 def test_get_temp_path(setup):
     """
     Tests if the path to the temp folder is correct.
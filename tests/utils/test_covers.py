@@ -0,0 +1,131 @@
+import concurrent.futures
+import os
+import threading
+import time
+
+import spotdl.utils.covers
+from spotdl.utils.covers import CoverCache
+
+
+class FakeResponse:
+    """
+    Response returned by the fake session.
+    """
+
+    def __init__(self, content):
+        self.content = content
+
+    def raise_for_status(self):
+        pass
+
+
+class FakeSession:
+    """
+    Session that counts the downloads of every url.
+    """
+
+    def __init__(self, counter, delay=0.0):
+        self.counter = counter
+        self.delay = delay
+        self.lock = threading.Lock()
+
+    def get(self, url):
+        with self.lock:
+            self.counter[url] = self.counter.get(url, 0) + 1
+
+        time.sleep(self.delay)
+
+        return FakeResponse(f"image of {url}".encode("utf-8"))
+
+
+def test_cover_cache_memory_and_disk(monkeypatch, tmp_path):
+    """
+    Test that covers are downloaded once and stored on disk.
+    """
+
+    downloads = {}
+    monkeypatch.setattr(
+        spotdl.utils.covers, "get_session", lambda: FakeSession(downloads)
+    )
+
+    cache = CoverCache(tmp_path, memory_size=1)
+
+    assert (
+        cache.get("https://i.scdn.co/image/a") == b"image of https://i.scdn.co/image/a"
+    )
+    assert (
+        cache.get("https://i.scdn.co/image/a") == b"image of https://i.scdn.co/image/a"
+    )
+    assert len(list(tmp_path.glob("*.jpg"))) == 1
+
+    # "a" is evicted from memory, but read from disk
+    cache.get("https://i.scdn.co/image/b")
+    assert (
+        cache.get("https://i.scdn.co/image/a") == b"image of https://i.scdn.co/image/a"
+    )
+
+    # A new cache (e.g. next run) uses the covers on disk
+    CoverCache(tmp_path).get("https://i.scdn.co/image/b")
+
+    assert downloads == {"https://i.scdn.co/image/a": 1, "https://i.scdn.co/image/b": 1}
+
+    cache.clear()
+    assert len(list(tmp_path.glob("*.jpg"))) == 0
+
+
+def test_cover_cache_in_flight(monkeypatch):
+    """
+    Test that concurrent requests for the same cover share the download.
+    """
+
+    downloads = {}
+    session = FakeSession(downloads, delay=0.05)
+    monkeypatch.setattr(spotdl.utils.covers, "get_session", lambda: session)
+
+    cache = CoverCache()
+
+    with concurrent.futures.ThreadPoolExecutor(max_workers=8) as executor:
+        covers = list(
+            executor.map(lambda _: cache.get("https://i.scdn.co/image/c"), range(8))
+        )
+
+    assert covers == [b"image of https://i.scdn.co/image/c"] * 8
+    assert downloads == {"https://i.scdn.co/image/c": 1}
+
+
+def test_cover_cache_disk_size(monkeypatch, tmp_path):
+    """
+    Test that the least recently used covers are removed
+    when the covers on disk grow over the size limit.
+    """
+
+    downloads = {}
+    monkeypatch.setattr(
+        spotdl.utils.covers, "get_session", lambda: FakeSession(downloads)
+    )
+
+    # Every cover is 34 bytes
+    cache = CoverCache(tmp_path, memory_size=0, max_disk_size=80)
+    cache.get("https://i.scdn.co/image/a")
+    cache.get("https://i.scdn.co/image/b")
+
+    now = time.time()
+    path_a = cache.get_path("https://i.scdn.co/image/a")
+    path_b = cache.get_path("https://i.scdn.co/image/b")
+    os.utime(path_a, (now - 100, now - 100))
+    os.utime(path_b, (now - 50, now - 50))
+
+    # Reading a cover from disk marks it as used
+    cache.get("https://i.scdn.co/image/a")
+    assert path_a.stat().st_mtime > path_b.stat().st_mtime
+
+    cache.get("https://i.scdn.co/image/c")
+
+    assert path_a.is_file()
+    assert not path_b.is_file()
+    assert cache.get_path("https://i.scdn.co/image/c").is_file()
+    assert downloads == {
+        "https://i.scdn.co/image/a": 1,
+        "https://i.scdn.co/image/b": 1,
+        "https://i.scdn.co/image/c": 1,
+    }
@@ -80,12 +80,158 @@ def test_download_ffmpeg(monkeypatch, tmp_path):
 
     class MockResponse:
         """
-        Mock response for requests.get.
+        Mock response for the http session.
         """
 
         content = b"\0"
 
+        def raise_for_status(self):
+            pass
+
+    class MockSession:
+        """
+        Mock http session.
+        """
+
+        def get(self, *_, **__):
+            return MockResponse()
+
     monkeypatch.setattr(spotdl.utils.ffmpeg, "get_spotdl_path", lambda *_: tmp_path)
-    monkeypatch.setattr(requests, "get", lambda *_, **__: MockResponse)
+    monkeypatch.setattr(spotdl.utils.ffmpeg, "get_session", MockSession)
 
     assert download_ffmpeg() is not None
+
+
+def make_fake_ffmpeg(tmp_path, exit_code=0, progress_lines=1000):
+    """
+    Create a script that prints ffmpeg like progress output.
+    """
+
+    script = tmp_path / "ffmpeg"
+    script.write_text(
+        "#!/bin/sh\n"
+        'if [ "$1" = "-version" ]; then\n'
+        "  echo 'ffmpeg version 4.4 Copyright (c) 2000-2021'\n"
+        "  exit 0\n"
+        "fi\n"
+        "echo '  Duration: 00:00:10.00, start: 0.000000, bitrate: 128 kb/s'\n"
+        f"for i in $(seq 1 {progress_lines}); do\n"
+        "  echo 'debug line'\n"
+        "  echo out_time=00:00:0$((i * 9 / " + str(progress_lines) + ")).00\n"
+        "done\n"
+        f"exit {exit_code}\n"
+    )
+    script.chmod(0o755)
+
+    return str(script)
+
+
+def test_transcode_pool_progress(tmp_path):
+    """
+    Test that the transcode pool reports only progress changes.
+    """
+
+    ffmpeg = make_fake_ffmpeg(tmp_path)
+    pool = TranscodePool(2)
+    progress = []
+
+    success, error = pool.convert(
+        ("https://example.com/audio", "webm"),
+        tmp_path / "song.mp3",
+        ffmpeg,
+        progress_handler=progress.append,
+    )
+    pool.close()
+
+    assert success is True and error is None
+    assert progress == [0, 10, 20, 30, 40, 50, 60, 70, 80, 90, 100]
+
+
+def test_convert_sync_error_tail(tmp_path):
+    """
+    Test that only the tail of the ffmpeg output is kept for errors.
+    """
+
+    ffmpeg = make_fake_ffmpeg(tmp_path, exit_code=1)
+
+    success, error = convert_sync(
+        ("https://example.com/audio", "webm"),
+        tmp_path / "song.mp3",
+        ffmpeg,
+        progress_handler=lambda _: None,
+    )
+
+    assert success is False and error is not None
+    assert len(error["error"].splitlines()) == OUTPUT_TAIL_LINES
+    assert error["version"] == 4.4
+
+
+def test_choose_conversion():
+    """
+    Test that streams are copied or remuxed when they match the output codec.
+    """
+
+    youtube_opus = {"acodec": "opus", "ext": "webm", "abr": 160.0}
+    youtube_aac = {"acodec": "mp4a.40.2", "ext": "m4a", "abr": 129.5}
+    soundcloud_mp3 = {"acodec": "mp3", "ext": "mp3", "abr": 128}
+
+    assert get_stream_info(youtube_aac) == ("aac", "m4a", 129.5)
+
+    assert choose_conversion(*get_stream_info(youtube_opus), "opus")[0] == "remux"
+    assert choose_conversion(*get_stream_info(youtube_aac), "m4a")[0] == "copy"
+    assert choose_conversion(*get_stream_info(soundcloud_mp3), "mp3")[0] == "copy"
+    assert choose_conversion(*get_stream_info(youtube_opus), "mp3")[0] == "transcode"
+
+    # Source bitrate higher than the requested one
+    assert (
+        choose_conversion(*get_stream_info(youtube_opus), "opus", bitrate="96k")[0]
+        == "transcode"
+    )
+    assert (
+        choose_conversion(*get_stream_info(soundcloud_mp3), "mp3", bitrate="128k")[0]
+        == "copy"
+    )
+
+    assert (
+        choose_conversion(*get_stream_info(youtube_aac), "m4a", ffmpeg_args="-ar 48k")[
+            0
+        ]
+        == "transcode"
+    )
+    assert choose_conversion(None, None, None, "mp3")[0] == "transcode"
+
+
+@pytest.mark.parametrize(
+    "conversion, expected",
+    [
+        ("copy", "-vn -c:a copy"),
+        ("remux", "-map 0:a:0 -c:a copy -f opus"),
+    ],
+)
+def test_convert_sync_conversion_arguments(tmp_path, conversion, expected):
+    """
+    Test that copied and remuxed streams get their own ffmpeg arguments.
+    """
+
+    ffmpeg = tmp_path / "ffmpeg"
+    ffmpeg.write_text(
+        "#!/bin/sh\n"
+        'if [ "$1" = "-version" ]; then\n'
+        "  echo 'ffmpeg version 4.4 Copyright (c) 2000-2021'\n"
+        "  exit 0\n"
+        "fi\n"
+        'echo "$@"\n'
+        "exit 1\n"
+    )
+    ffmpeg.chmod(0o755)
+
+    _, error = convert_sync(
+        ("https://example.com/audio", "webm"),
+        tmp_path / "song.opus",
+        str(ffmpeg),
+        output_format="opus",
+        conversion=conversion,
+    )
+
+    assert error is not None
+    assert f" {expected} " in error["error"]
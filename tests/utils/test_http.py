@@ -0,0 +1,67 @@
+from types import SimpleNamespace
+
+import requests
+
+from requests.adapters import HTTPAdapter
+
+from spotdl.utils.http import *
+from spotdl.utils.ratelimit import RateLimiter
+
+
+def test_get_session():
+    """
+    Test that the session is shared and pools connections.
+    """
+
+    session = get_session()
+
+    assert get_session() is session
+
+    adapter = session.get_adapter("https://api.genius.com")
+    assert isinstance(adapter, TimeoutHTTPAdapter)
+    assert adapter._pool_maxsize == HTTP_POOL_SIZE
+    assert adapter._pool_block is True
+    assert adapter.max_retries.total == HTTP_RETRIES
+    assert 429 in adapter.max_retries.status_forcelist
+
+
+def test_default_timeout(monkeypatch):
+    """
+    Test that requests without a timeout get the default one.
+    """
+
+    timeouts = []
+    monkeypatch.setattr(
+        HTTPAdapter,
+        "send",
+        lambda self, request, **kwargs: timeouts.append(kwargs["timeout"])
+        or SimpleNamespace(status_code=200, headers={}),
+    )
+
+    adapter = create_session(timeout=5).get_adapter("https://example.com")
+    request = requests.Request("GET", "https://example.com").prepare()
+
+    adapter.send(request)
+    adapter.send(request, timeout=30)
+
+    assert timeouts == [5, 30]
+
+
+def test_rate_limit(monkeypatch):
+    """
+    Test that responses update the rate limit of the host.
+    """
+
+    monkeypatch.setattr(
+        HTTPAdapter,
+        "send",
+        lambda self, request, **kwargs: SimpleNamespace(
+            status_code=429, headers={"Retry-After": "0"}
+        ),
+    )
+
+    limiter = RateLimiter(rate=10)
+    adapter = create_session(rate_limiter=limiter).get_adapter("https://example.com")
+    adapter.send(requests.Request("GET", "https://example.com/a").prepare())
+
+    assert limiter.rates() == {"example.com": 5}
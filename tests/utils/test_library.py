@@ -0,0 +1,114 @@
+from pathlib import Path
+
+import pytest
+
+from spotdl.utils.library import (
+    LIBRARY_INDEX_NAME,
+    LibraryError,
+    LibraryIndex,
+    get_library_path,
+    get_tag_hash,
+    is_file_changed,
+)
+from spotdl.utils.search import create_empty_song
+
+
+def make_song(song_id="1", name="Ropes"):
+    song = create_empty_song(name=name, artists=["Salem Ilese"], song_id=song_id)
+    song.artist = "Salem Ilese"
+    return song
+
+
+def test_get_tag_hash():
+    """
+    Test that the tag hash changes only with the tagged metadata.
+    """
+
+    song = make_song()
+    tag_hash = get_tag_hash(song)
+
+    song.download_url = "https://music.youtube.com/watch?v=1"
+    assert get_tag_hash(song) == tag_hash
+
+    song.album_name = "Unsponsored Content"
+    assert get_tag_hash(song) != tag_hash
+
+
+def test_get_library_path():
+    """
+    Test that the library path stops at the first template variable.
+    """
+
+    assert get_library_path("Music/{artists} - {title}.{output-ext}") == Path("Music")
+    assert get_library_path("Music/{artist}/{album}/{title}.{output-ext}") == Path(
+        "Music"
+    )
+    assert get_library_path("{artists} - {title}.{output-ext}") == Path(".")
+
+
+def test_library_index(tmp_path):
+    """
+    Test adding, reading and removing songs from the library index.
+    """
+
+    song = make_song()
+    path = tmp_path / "Salem Ilese - Ropes.mp3"
+    path.write_bytes(b"audio")
+
+    library = LibraryIndex(tmp_path)
+    entry = library.add(song, path, "mp3")
+    library.close()
+
+    assert (tmp_path / LIBRARY_INDEX_NAME).is_file()
+    assert entry.size == 5
+
+    # Paths are stored relative to the library directory
+    moved = tmp_path.parent / (tmp_path.name + "-moved")
+    tmp_path.rename(moved)
+
+    library = LibraryIndex(moved)
+    entries = library.get_entries()
+
+    assert list(entries) == ["1"]
+    assert entries["1"].path == moved / "Salem Ilese - Ropes.mp3"
+    assert entries["1"].file_format == "mp3"
+    assert entries["1"].tag_hash == get_tag_hash(song)
+
+    library.remove(["1"])
+    assert library.get_entries() == {}
+    library.close()
+
+
+def test_library_index_missing_file(tmp_path):
+    """
+    Test that missing files are not added to the library index.
+    """
+
+    library = LibraryIndex(tmp_path)
+
+    with pytest.raises(LibraryError):
+        library.add(make_song(), tmp_path / "missing.mp3", "mp3")
+
+    assert library.get_entries() == {}
+    library.close()
+
+
+def test_is_file_changed(tmp_path):
+    """
+    Test that files changed after they were indexed are detected.
+    """
+
+    path = tmp_path / "Salem Ilese - Ropes.mp3"
+    path.write_bytes(b"audio")
+
+    library = LibraryIndex(tmp_path)
+    library.add(make_song(), path, "mp3")
+
+    assert not is_file_changed(library.get_entries()["1"])
+
+    path.write_bytes(b"other audio")
+    assert is_file_changed(library.get_entries()["1"])
+
+    path.unlink()
+    assert is_file_changed(library.get_entries()["1"])
+    library.close()
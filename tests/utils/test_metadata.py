@@ -0,0 +1,57 @@
+from mutagen.id3 import ID3
+
+from spotdl.utils.covers import CoverCache
+from spotdl.utils.metadata import MP3_TAG_PADDING, embed_metadata
+from spotdl.utils.search import create_empty_song
+
+# MPEG audio frame header followed by silence
+AUDIO_DATA = b"\xff\xfb\x90\x64" + b"\x00" * 4096
+
+
+def test_embed_mp3_metadata(tmp_path):
+    """
+    Test that mp3 tags are written in one pass with reserved padding.
+    """
+
+    song = create_empty_song(
+        name="Ropes",
+        artists=["Dirty Palm", "Chandler Jewels"],
+        album_name="Ropes",
+        genres=["gaming edm"],
+        disc_number=1,
+        disc_count=1,
+        date="2021-10-28",
+        track_number=1,
+        tracks_count=1,
+        publisher="Dirty Palm",
+        copyright_text="2021 Dirty Palm",
+        cover_url="https://i.scdn.co/image/cover",
+    )
+
+    cover_cache = CoverCache()
+    cover_cache._memory["https://i.scdn.co/image/cover"] = b"cover"
+
+    output_file = tmp_path / "song.mp3"
+    output_file.write_bytes(AUDIO_DATA)
+
+    embed_metadata(output_file, song, "mp3", "la la la", cover_cache)
+
+    tags = ID3(output_file)
+
+    assert tags["TIT2"].text == ["Ropes"]
+    assert tags["TPE1"].text == ["Dirty Palm/Chandler Jewels"]
+    assert tags["TRCK"].text == ["1/1"]
+    assert tags["TCON"].text == ["gaming edm"]
+    assert tags["APIC:Cover"].data == b"cover"
+    assert tags.getall("USLT")[0].text == "la la la"
+    assert output_file.read_bytes().endswith(AUDIO_DATA)
+
+    # The tag has free space, so updating it doesn't change the file size
+    size = output_file.stat().st_size
+    assert size >= len(AUDIO_DATA) + MP3_TAG_PADDING
+
+    song.name = "Ropes (Remix)"
+    embed_metadata(output_file, song, "mp3", "la la la", cover_cache)
+
+    assert ID3(output_file)["TIT2"].text == ["Ropes (Remix)"]
+    assert output_file.stat().st_size == size
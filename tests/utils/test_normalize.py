@@ -0,0 +1,54 @@
+import pytest
+
+from slugify import slugify as python_slugify
+
+import spotdl.utils.normalize
+from spotdl.utils.normalize import clear_cache, slugify
+
+
+@pytest.mark.parametrize(
+    "text",
+    [
+        "ropes",
+        "the-beatles",
+        "Ropes",
+        "Beyoncé - Halo",
+        "Tomorrow x Together, Seori",
+        "AC/DC",
+        "1,000 Years",
+        "-leading-dash",
+        "double--dash",
+        "Rock &amp; Roll",
+        "💩",
+        "",
+    ],
+)
+def test_slugify(text):
+    """
+    Test that slugify gives the same results as python-slugify.
+    """
+
+    assert slugify(text) == python_slugify(text)
+
+
+def test_slugify_cache(monkeypatch):
+    """
+    Test that slugs are cached and that slug-safe text skips slugify.
+    """
+
+    calls = []
+
+    def fake_slugify(text):
+        calls.append(text)
+        return python_slugify(text)
+
+    clear_cache()
+    monkeypatch.setattr(spotdl.utils.normalize, "_slugify", fake_slugify)
+
+    assert slugify("Salem Ilese") == "salem-ilese"
+    assert slugify("Salem Ilese") == "salem-ilese"
+    assert slugify("salem-ilese") == "salem-ilese"
+
+    assert calls == ["Salem Ilese"]
+
+    clear_cache()
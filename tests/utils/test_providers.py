@@ -1,4 +1,14 @@
-from spotdl.utils.providers import match_percentage
+from types import SimpleNamespace
+
+import pytest
+
+import spotdl.utils.providers
+from spotdl.utils.providers import (
+    cdist_available,
+    match_percentage,
+    match_percentages,
+    time_matches,
+)
 
 
 def test_match_percentage():
@@ -10,3 +20,67 @@ def test_match_percentage():
     assert match_percentage("test", "test", score_cutoff=0.5) == 100.0
     assert match_percentage("test", "test", score_cutoff=101.0) == 0.0
     assert match_percentage("test", "💩") == 0.0
+
+
+@pytest.mark.parametrize("use_numpy", [False, True])
+def test_match_percentages(monkeypatch, use_numpy):
+    """
+    Test that match_percentages scores every pair like match_percentage
+    """
+
+    if use_numpy:
+        pytest.importorskip("numpy")
+    else:
+        monkeypatch.setattr(spotdl.utils.providers, "numpy", None)
+
+    cdist_available.cache_clear()
+    assert cdist_available() == use_numpy
+
+    queries = ["the-beatles", "queen", "salem-ilese", ""]
+    choices = ["the-beatles-love-me-do", "queen-bohemian-rhapsody", "ps5", "💩"]
+
+    assert match_percentages(queries, choices) == [
+        [match_percentage(query, choice) for choice in choices] for query in queries
+    ]
+    assert match_percentages([], choices) == []
+    assert match_percentages(queries, []) == [[], [], [], []]
+
+    cdist_available.cache_clear()
+
+
+def test_cdist_unsupported(monkeypatch):
+    """
+    Test that rapidfuzz versions without the `dtype` argument of cdist
+    compare every pair of strings separately.
+    """
+
+    def cdist(*_, **__):
+        raise TypeError("cdist() got an unexpected keyword argument 'dtype'")
+
+    monkeypatch.setattr(spotdl.utils.providers, "numpy", SimpleNamespace(float64=float))
+    monkeypatch.setattr(spotdl.utils.providers.process, "cdist", cdist)
+
+    cdist_available.cache_clear()
+    assert cdist_available() is False
+
+    assert match_percentages(["queen"], ["queen-bohemian-rhapsody", "ps5"]) == [
+        [100.0, match_percentage("queen", "ps5")]
+    ]
+
+    cdist_available.cache_clear()
+
+
+def test_time_matches():
+    """
+    Test that time_matches gives the time match of every duration
+    """
+
+    durations = [180.0, 183.0, 170, 0.5]
+
+    assert time_matches(durations, 180) == [
+        100 - ((duration - 180) ** 2) / 180 * 100 for duration in durations
+    ]
+    assert time_matches([], 180) == []
+
+    with pytest.raises(ZeroDivisionError):
+        time_matches(durations, 0)
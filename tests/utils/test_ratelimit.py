@@ -0,0 +1,101 @@
+import email.utils
+import time
+import urllib.error
+
+import pytest
+
+from spotdl.utils.ratelimit import *
+
+
+@pytest.fixture()
+def clock(monkeypatch):
+    """
+    Fake clock, sleeping advances the time immediately.
+    """
+
+    now = [1000.0]
+    sleeps = []
+
+    def sleep(seconds):
+        sleeps.append(seconds)
+        now[0] += seconds
+
+    monkeypatch.setattr(time, "monotonic", lambda: now[0])
+    monkeypatch.setattr(time, "sleep", sleep)
+
+    yield sleeps
+
+
+def test_token_bucket(clock):
+    """
+    Test that requests after the burst are spread out by the rate.
+    """
+
+    bucket = TokenBucket(rate=2, burst=2)
+
+    assert [bucket.acquire() for _ in range(4)] == [0, 0, 0.5, 0.5]
+    assert clock == [0.5, 0.5]
+
+
+def test_token_bucket_backoff(clock):
+    """
+    Test that the rate is lowered, paused and raised again.
+    """
+
+    bucket = TokenBucket(rate=4, burst=4, min_rate=1, max_rate=4)
+
+    bucket.backoff(retry_after=3)
+    assert bucket.rate == 2
+    assert bucket.acquire() == 3
+
+    for _ in range(3):
+        bucket.backoff()
+    assert bucket.rate == 1
+
+    for _ in range(100):
+        bucket.recover()
+    assert bucket.rate == 4
+
+
+def test_rate_limiter(clock):
+    """
+    Test that every host gets its own bucket.
+    """
+
+    limiter = RateLimiter(rate=10)
+
+    limiter.update("api.spotify.com", 429, "2")
+    limiter.update("music.youtube.com", 200)
+    limiter.update("genius.com", 404)
+
+    assert limiter.rates() == {
+        "api.spotify.com": 5,
+        "music.youtube.com": 10.1,
+        "genius.com": 10,
+    }
+    assert limiter.acquire("api.spotify.com") == 2
+    assert limiter.acquire("music.youtube.com") == 0
+
+
+def test_parse_retry_after():
+    """
+    Test parsing of the Retry-After header.
+    """
+
+    assert parse_retry_after("120") == 120
+    assert parse_retry_after(None) is None
+    assert parse_retry_after("soon") is None
+
+    date = email.utils.formatdate(time.time() + 60, usegmt=True)
+    assert 55 < parse_retry_after(date) <= 60
+
+
+def test_get_status_code():
+    """
+    Test that status codes are read from errors of the client libraries.
+    """
+
+    error = urllib.error.HTTPError("https://youtube.com", 429, "Too Many", {}, None)
+
+    assert get_status_code(error) == 429
+    assert get_status_code(ValueError("no status")) is None
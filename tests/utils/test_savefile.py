@@ -0,0 +1,167 @@
+import json
+
+import pytest
+
+from spotdl.utils.savefile import (
+    SaveFileError,
+    SaveFileWriter,
+    is_save_file,
+    load_songs,
+    save_songs,
+)
+from spotdl.types.song import SongList
+from spotdl.utils.search import create_empty_song
+
+
+def make_songs(count):
+    return [
+        create_empty_song(name=f"song {index}", artists=["artist"], song_id=str(index))
+        for index in range(count)
+    ]
+
+
+def test_is_save_file():
+    """
+    Test that all save file extensions are recognized.
+    """
+
+    assert is_save_file("songs.spotdl")
+    assert is_save_file("songs.spotdl.gz")
+    assert is_save_file("songs.spotdl.zst")
+    assert not is_save_file("songs.json")
+
+
+@pytest.mark.parametrize("name", ["songs.spotdl", "songs.spotdl.gz"])
+def test_save_file_round_trip(tmp_path, name):
+    """
+    Test that songs are written one per line and read back lazily.
+    """
+
+    path = tmp_path / name
+    songs = make_songs(3)
+
+    assert save_songs(path, songs) == 3
+    assert list(tmp_path.iterdir()) == [path]
+
+    loaded = load_songs(path)
+    assert next(loaded) == songs[0]
+    assert list(loaded) == songs[1:]
+
+
+def test_save_file_zstd(tmp_path):
+    """
+    Test that save files can be compressed with zstd.
+    """
+
+    pytest.importorskip("zstandard")
+
+    path = tmp_path / "songs.spotdl.zst"
+    songs = make_songs(3)
+    save_songs(path, songs)
+
+    assert path.read_bytes()[:4] == b"\x28\xb5\x2f\xfd"
+    assert list(load_songs(path)) == songs
+
+
+def test_save_file_writer_part_file(tmp_path):
+    """
+    Test that songs are readable as soon as they are written
+    and that the previous save file is kept until the writer is closed.
+    """
+
+    path = tmp_path / "songs.spotdl.gz"
+    save_songs(path, make_songs(1))
+
+    songs = make_songs(2)
+    writer = SaveFileWriter(path)
+    writer.write(songs[0])
+    writer.write(songs[1].json)
+
+    assert list(load_songs(writer.part_path)) == songs
+    assert list(load_songs(path)) == songs[:1]
+
+    writer.close()
+    assert list(load_songs(path)) == songs
+    assert not writer.part_path.exists()
+
+
+def test_save_file_legacy(tmp_path):
+    """
+    Test that save files with a JSON array are still loaded.
+    """
+
+    path = tmp_path / "songs.spotdl"
+    songs = make_songs(2)
+    path.write_text(json.dumps([song.json for song in songs], indent=4))
+
+    assert list(load_songs(path)) == songs
+
+
+def test_save_file_broken_lines(tmp_path):
+    """
+    Test that a broken last line is skipped and other broken lines are errors.
+    """
+
+    song = make_songs(1)[0]
+    line = json.dumps(song.json)
+
+    path = tmp_path / "songs.spotdl"
+    path.write_text(f"{line}\n{line[:20]}")
+    assert list(load_songs(path)) == [song]
+
+    path.write_text(f"{line[:20]}\n{line}\n")
+    with pytest.raises(SaveFileError):
+        list(load_songs(path))
+
+
+def test_save_file_song_list(tmp_path):
+    """
+    Test that the song list of the songs is restored,
+    from the list records and from the dictionaries of older save files.
+    """
+
+    song_list = SongList(
+        name="Playlist", url="https://open.spotify.com/playlist/1", urls=[], songs=[]
+    )
+    songs = [
+        create_empty_song(
+            name=f"song {index}",
+            artists=["artist"],
+            song_id=str(index),
+            url=f"https://open.spotify.com/track/{index}",
+            song_list=song_list,
+        )
+        for index in range(2)
+    ]
+    song_list.urls.extend(song.url for song in songs)
+    song_list.songs.extend(songs)
+
+    path = tmp_path / "songs.spotdl"
+    assert save_songs(path, songs) == 2
+    assert len(path.read_text(encoding="utf-8").splitlines()) == 3
+
+    legacy_path = tmp_path / "legacy.spotdl"
+    legacy_path.write_text(
+        json.dumps(
+            [
+                {
+                    **song.json,
+                    "song_list": {
+                        "name": "Playlist",
+                        "url": song_list.url,
+                        "urls": song_list.urls,
+                        "songs": [],
+                    },
+                }
+                for song in songs
+            ]
+        )
+    )
+
+    for loaded in [list(load_songs(path)), list(load_songs(legacy_path))]:
+        restored = loaded[0].song_list
+        assert restored is loaded[1].song_list
+        assert restored.name == "Playlist"
+        assert restored.urls == song_list.urls
+        assert restored.songs == loaded
+        assert restored.length == 2
@@ -1,3 +1,8 @@
+import concurrent.futures
+import threading
+import time
+
+from spotdl.utils.cache import PersistentCache
 from spotdl.utils.spotify import SpotifyClient, SpotifyError
 
 import pytest
@@ -34,3 +39,144 @@ def test_multiple_init():
             client_secret="client_secret",
             user_auth=False,
         )
+
+
+def test_memoized_items(tmp_path):
+    """
+    Test that concurrent lookups of the same item only fetch it once
+    and that the results are stored in the metadata cache.
+    """
+
+    cache = PersistentCache(tmp_path / "metadata.db", "metadata")
+    client = object.__new__(SpotifyClient)
+    SpotifyClient.__init__(client, auth="token", metadata_cache=cache)
+
+    calls = []
+    lock = threading.Lock()
+
+    def fetch_many(ids):
+        with lock:
+            calls.append(ids)
+        time.sleep(0.1)
+        return [{"id": item_id} for item_id in ids]
+
+    with concurrent.futures.ThreadPoolExecutor(max_workers=8) as executor:
+        results = list(
+            executor.map(
+                lambda _: client._get_many_cached("album", ["a1"], fetch_many),
+                range(8),
+            )
+        )
+
+    assert calls == [["a1"]]
+    assert all(result == [{"id": "a1"}] for result in results)
+    assert cache.get("album:a1") == {"id": "a1"}
+
+    # Already memoized items are not fetched again
+    assert client._get_many_cached("album", ["a1", "a2"], fetch_many) == [
+        {"id": "a1"},
+        {"id": "a2"},
+    ]
+    assert calls == [["a1"], ["a2"]]
+
+
+def test_get_all_items(monkeypatch):
+    """
+    Test that all pages are fetched and reassembled in order.
+    """
+
+    client = object.__new__(SpotifyClient)
+    SpotifyClient.__init__(client, auth="token")
+
+    base_url = "https://api.spotify.com/v1/playlists/id/tracks"
+    requested = []
+
+    def fake_get(url):
+        offset = int(url.split("offset=")[1].split("&")[0])
+        requested.append(offset)
+        time.sleep(0.01 * (10 - offset // 100))
+        return {"items": list(range(offset, min(offset + 100, 950)))}
+
+    monkeypatch.setattr(client, "_get", fake_get)
+
+    first_page = {
+        "items": list(range(100)),
+        "limit": 100,
+        "offset": 0,
+        "total": 950,
+        "next": f"{base_url}?offset=100&limit=100&additional_types=track",
+    }
+
+    assert client.get_all_items(first_page) == list(range(950))
+    assert sorted(requested) == list(range(100, 1000, 100))
+
+
+def test_get_all_items_failed_page(monkeypatch):
+    """
+    Test that a page that can't be fetched is retried and then raises an error
+    instead of returning a partial list.
+    """
+
+    client = object.__new__(SpotifyClient)
+    SpotifyClient.__init__(client, auth="token")
+
+    base_url = "https://api.spotify.com/v1/albums/id/tracks"
+    attempts = []
+
+    def fake_get(url):
+        offset = int(url.split("offset=")[1].split("&")[0])
+        if offset == 200:
+            attempts.append(offset)
+            # Fails once, then succeeds
+            if len(attempts) == 1:
+                return None
+
+        return {"items": list(range(offset, min(offset + 100, 350)))}
+
+    monkeypatch.setattr(client, "_get", fake_get)
+
+    first_page = {
+        "items": list(range(100)),
+        "limit": 100,
+        "offset": 0,
+        "total": 350,
+        "next": f"{base_url}?offset=100&limit=100",
+    }
+
+    assert client.get_all_items(first_page) == list(range(350))
+    assert len(attempts) == 2
+
+    monkeypatch.setattr(
+        client,
+        "_get",
+        lambda url: None if "offset=200" in url else fake_get(url),
+    )
+
+    with pytest.raises(SpotifyError):
+        client.get_all_items(first_page)
+
+
+def test_track_cache_market(tmp_path, monkeypatch):
+    """
+    Test that tracks fetched for a market are cached separately.
+    """
+
+    cache = PersistentCache(tmp_path / "metadata.db", "metadata")
+    client = object.__new__(SpotifyClient)
+    SpotifyClient.__init__(client, auth="token", metadata_cache=cache)
+
+    calls = []
+
+    def fake_track(self, track_id, market=None):
+        calls.append((track_id, market))
+        return {"id": track_id, "market": market}
+
+    monkeypatch.setattr("spotipy.Spotify.track", fake_track)
+
+    assert client.track("t1") == {"id": "t1", "market": None}
+    assert client.track("t1", market="US") == {"id": "t1", "market": "US"}
+    assert client.track("t1", market="us") == {"id": "t1", "market": "US"}
+    assert client.track("t1") == {"id": "t1", "market": None}
+
+    assert calls == [("t1", None), ("t1", "US")]
+    assert cache.get("track@US:t1") == {"id": "t1", "market": "US"}